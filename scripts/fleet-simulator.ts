@@ -0,0 +1,58 @@
+// Local telemetry source for the fleet dashboard.
+//
+//   npm run simulate -- --vehicles 2000 --interval 1000 --url http://localhost:3000
+//
+// Registers a simulated fleet with the ingest route, then posts one batch of
+// position/speed/fuel changes per interval.
+
+import { createSimulatedFleet, TelemetrySimulator } from "@/lib/telemetry-simulator"
+
+function readArg(name: string, fallback: string) {
+  const index = process.argv.indexOf(`--${name}`)
+  return index !== -1 && process.argv[index + 1] ? process.argv[index + 1] : fallback
+}
+
+const baseUrl = readArg("url", "http://localhost:3000")
+const vehicleCount = Number(readArg("vehicles", "8"))
+const intervalMs = Number(readArg("interval", "1000"))
+const endpoint = new URL("/api/fleet/telemetry", baseUrl)
+
+// Periodically re-send the full fleet so a restarted dev server picks it up again
+const REGISTER_EVERY_TICKS = 30
+
+const headers: Record<string, string> = { "Content-Type": "application/json" }
+if (process.env.FLEET_INGEST_TOKEN) {
+  headers.Authorization = `Bearer ${process.env.FLEET_INGEST_TOKEN}`
+}
+
+async function post(body: unknown) {
+  const response = await fetch(endpoint, { method: "POST", headers, body: JSON.stringify(body) })
+  if (!response.ok) {
+    throw new Error(`${endpoint} responded ${response.status}`)
+  }
+}
+
+function main() {
+  const vehicles = createSimulatedFleet(vehicleCount)
+  const simulator = new TelemetrySimulator(vehicles)
+  let tickCount = 0
+  let lastTick = Date.now()
+
+  console.log(`Simulating ${vehicles.length} vehicles -> ${endpoint} every ${intervalMs}ms`)
+
+  setInterval(async () => {
+    const now = Date.now()
+    const updates = simulator.tick(now, (now - lastTick) / 1000)
+    lastTick = now
+
+    const register = tickCount++ % REGISTER_EVERY_TICKS === 0
+
+    try {
+      await post(register ? { vehicles, updates } : { updates })
+    } catch (error) {
+      console.warn(`Telemetry post failed: ${(error as Error).message}`)
+    }
+  }, intervalMs)
+}
+
+main()
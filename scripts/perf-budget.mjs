@@ -0,0 +1,350 @@
+// Per-route performance budgets, measured against a production build.
+//
+//   npm run build && npm run perf:budget
+//   npm run perf:budget -- --runs 5 --cpu 4 --json perf-results.json
+//   npm run perf:budget -- --runs 5 --record --headroom 10
+//
+// Starts `next start` on the existing .next output and, for every route in
+// scripts/perf-budgets.mjs, records:
+//   - JS shipped: every script the route's HTML loads, raw and gzipped
+//   - hydration: median time from navigation start to the "app-hydrated"
+//     mark set by the root layout, over --runs loads
+//   - per tab: JS fetched the first time each lazily loaded tab is opened
+// Hydration and tabs need a browser: playwright is a devDependency, and its
+// browser is installed once with `npx playwright install chromium`. Without
+// it they are reported as skipped. Exits 1 when any measured value is over
+// its budget, once scripts/perf-budgets.mjs holds a recorded baseline.
+//
+// --record writes the measurements back to scripts/perf-budgets.mjs as the
+// new baseline, each budget set --headroom percent (default 10) above what
+// was measured. It needs the browser, so hydration and tabs are covered.
+
+import { spawn } from "node:child_process"
+import { existsSync, readFileSync, writeFileSync } from "node:fs"
+import { createRequire } from "node:module"
+import { dirname, join, resolve } from "node:path"
+import { fileURLToPath } from "node:url"
+import { gzipSync } from "node:zlib"
+import { baseline, budgets } from "./perf-budgets.mjs"
+
+function readArg(name, fallback) {
+  const index = process.argv.indexOf(`--${name}`)
+  return index !== -1 && process.argv[index + 1] ? process.argv[index + 1] : fallback
+}
+
+const root = resolve(dirname(fileURLToPath(import.meta.url)), "..")
+const port = Number(readArg("port", "3210"))
+const runs = Math.max(1, Number(readArg("runs", "3")))
+const cpuSlowdown = Number(readArg("cpu", "1"))
+const jsonPath = readArg("json", "")
+const record = process.argv.includes("--record")
+const headroomPercent = Number(readArg("headroom", "10"))
+const baseUrl = `http://localhost:${port}`
+
+const SERVER_START_TIMEOUT_MS = 30_000
+const HYDRATION_TIMEOUT_MS = 30_000
+// A tab has finished loading once no new script has arrived for this long
+const SCRIPTS_QUIET_MS = 750
+
+const kb = (bytes) => bytes / 1024
+const budgetsPath = join(root, "scripts", "perf-budgets.mjs")
+// Recorded hydration budgets are rounded up to this step
+const HYDRATION_STEP_MS = 50
+
+function startServer() {
+  const require = createRequire(import.meta.url)
+  const nextBin = require.resolve("next/dist/bin/next")
+  return spawn(process.execPath, [nextBin, "start", "--port", String(port)], {
+    cwd: root,
+    env: { ...process.env, NODE_ENV: "production" },
+    stdio: ["ignore", "ignore", "inherit"],
+  })
+}
+
+async function waitForServer(server) {
+  const deadline = Date.now() + SERVER_START_TIMEOUT_MS
+  while (Date.now() < deadline) {
+    if (server.exitCode !== null) throw new Error(`next start exited with ${server.exitCode}`)
+    try {
+      await fetch(baseUrl)
+      return
+    } catch {
+      await new Promise((resolve) => setTimeout(resolve, 250))
+    }
+  }
+  throw new Error(`next start did not respond within ${SERVER_START_TIMEOUT_MS} ms`)
+}
+
+// Script sizes by path; chunks shared between routes are fetched once
+const scriptSizes = new Map()
+
+async function scriptSize(path) {
+  let size = scriptSizes.get(path)
+  if (!size) {
+    const response = await fetch(new URL(path, baseUrl))
+    if (!response.ok) throw new Error(`${path} responded ${response.status}`)
+    const body = Buffer.from(await response.arrayBuffer())
+    size = { raw: body.length, gzip: gzipSync(body).length }
+    scriptSizes.set(path, size)
+  }
+  return size
+}
+
+async function sumScripts(paths) {
+  let raw = 0
+  let gzip = 0
+  for (const path of paths) {
+    const size = await scriptSize(path)
+    raw += size.raw
+    gzip += size.gzip
+  }
+  return { count: paths.length, raw, gzip }
+}
+
+// Scripts referenced by the server-rendered HTML: <script src> tags and
+// script preloads, which the page executes during startup
+async function measureRouteScripts(route) {
+  const response = await fetch(new URL(route, baseUrl))
+  if (!response.ok) throw new Error(`${route} responded ${response.status}`)
+  const html = await response.text()
+  const paths = new Set()
+  for (const match of html.matchAll(/<script\b[^>]*\bsrc="([^"]+)"/g)) paths.add(match[1])
+  for (const match of html.matchAll(/<link\b[^>]*\bas="script"[^>]*\bhref="([^"]+)"/g)) {
+    paths.add(match[1])
+  }
+  const sameOrigin = [...paths]
+    .map((path) => path.replaceAll("&amp;", "&"))
+    .filter((path) => new URL(path, baseUrl).origin === baseUrl)
+  return sumScripts(sameOrigin)
+}
+
+async function loadPlaywright() {
+  try {
+    return await import("playwright")
+  } catch {
+    return null
+  }
+}
+
+// Null when playwright or its browser is missing
+async function launchBrowser() {
+  const playwright = await loadPlaywright()
+  if (!playwright) {
+    console.warn("playwright is not installed; measuring JS bytes only.\n")
+    return null
+  }
+  try {
+    return await playwright.chromium.launch()
+  } catch {
+    console.warn(
+      "Chromium is not installed (npx playwright install chromium); measuring JS bytes only.\n"
+    )
+    return null
+  }
+}
+
+async function openPage(browser) {
+  const context = await browser.newContext()
+  const page = await context.newPage()
+  if (cpuSlowdown > 1) {
+    const session = await context.newCDPSession(page)
+    await session.send("Emulation.setCPUThrottlingRate", { rate: cpuSlowdown })
+  }
+  const scripts = new Set()
+  page.on("response", (response) => {
+    if (response.request().resourceType() !== "script") return
+    const url = new URL(response.url())
+    if (url.origin === baseUrl) scripts.add(url.pathname + url.search)
+  })
+  return { context, page, scripts }
+}
+
+async function measureHydration(page, route) {
+  await page.goto(new URL(route, baseUrl).href, { waitUntil: "load" })
+  const handle = await page.waitForFunction(
+    () => performance.getEntriesByName("app-hydrated")[0]?.startTime,
+    null,
+    { timeout: HYDRATION_TIMEOUT_MS }
+  )
+  return handle.jsonValue()
+}
+
+async function waitForScriptsToSettle(scripts) {
+  let count = -1
+  while (count !== scripts.size) {
+    count = scripts.size
+    await new Promise((resolve) => setTimeout(resolve, SCRIPTS_QUIET_MS))
+  }
+}
+
+// Opens each tab in turn and attributes the scripts that arrive to it
+async function measureTabs(page, scripts, tabs) {
+  const results = {}
+  await waitForScriptsToSettle(scripts)
+  for (const name of Object.keys(tabs)) {
+    const before = new Set(scripts)
+    await page.getByRole("tab", { name, exact: true }).click()
+    await waitForScriptsToSettle(scripts)
+    results[name] = await sumScripts([...scripts].filter((path) => !before.has(path)))
+  }
+  return results
+}
+
+function median(values) {
+  const sorted = [...values].sort((a, b) => a - b)
+  const middle = Math.floor(sorted.length / 2)
+  return sorted.length % 2 ? sorted[middle] : (sorted[middle - 1] + sorted[middle]) / 2
+}
+
+function check(failures, label, value, budget, unit) {
+  if (budget === undefined || value === null) return ""
+  if (value > budget) {
+    failures.push(`${label}: ${value.toFixed(1)} ${unit} > ${budget} ${unit}`)
+    return "OVER"
+  }
+  return "ok"
+}
+
+// Object literal source in the style of perf-budgets.mjs
+function toSource(value, indent = "") {
+  if (typeof value !== "object" || value === null) return JSON.stringify(value)
+  const inner = `${indent}  `
+  const entries = Object.entries(value).map(([key, entry]) => {
+    const name = /^[A-Za-z_$][\w$]*$/.test(key) ? key : JSON.stringify(key)
+    return `${inner}${name}: ${toSource(entry, inner)},`
+  })
+  return `{\n${entries.join("\n")}\n${indent}}`
+}
+
+// Rewrites perf-budgets.mjs from the measured results, keeping its header
+function recordBaseline(results) {
+  const scale = 1 + headroomPercent / 100
+  const jsBudget = (bytes) => Math.ceil(kb(bytes) * scale)
+  const round = (value) => Math.round(value * 10) / 10
+  const next = {}
+  for (const { route, js, hydrationMs, tabs } of results) {
+    const entry = {
+      jsKb: jsBudget(js.gzip),
+      hydrationMs: Math.ceil((hydrationMs * scale) / HYDRATION_STEP_MS) * HYDRATION_STEP_MS,
+      measured: { jsKb: round(kb(js.gzip)), hydrationMs: Math.round(hydrationMs) },
+    }
+    if (Object.keys(tabs).length > 0) {
+      entry.tabs = {}
+      for (const [name, tab] of Object.entries(tabs)) {
+        entry.tabs[name] = { jsKb: jsBudget(tab.gzip), measured: { jsKb: round(kb(tab.gzip)) } }
+      }
+    }
+    next[route] = entry
+  }
+
+  const source = readFileSync(budgetsPath, "utf8")
+  const header = source.slice(0, source.indexOf("export const baseline"))
+  const recorded = {
+    measuredAt: new Date().toISOString().slice(0, 10),
+    runs,
+    cpuSlowdown,
+    headroomPercent,
+  }
+  writeFileSync(
+    budgetsPath,
+    `${header}export const baseline = ${toSource(recorded)}\n\n` +
+      `export const budgets = ${toSource(next)}\n`
+  )
+}
+
+async function main() {
+  if (!existsSync(join(root, ".next", "BUILD_ID"))) {
+    console.error("No production build found; run `npm run build` first.")
+    process.exit(1)
+  }
+
+  const browser = await launchBrowser()
+  if (record && !browser) {
+    console.error("--record needs playwright and Chromium to measure hydration and tabs.")
+    process.exit(1)
+  }
+  const server = startServer()
+  const results = []
+  const failures = []
+  try {
+    await waitForServer(server)
+
+    for (const [route, budget] of Object.entries(budgets)) {
+      const js = await measureRouteScripts(route)
+      const result = { route, js, hydrationMs: null, tabs: {} }
+
+      if (browser) {
+        const samples = []
+        for (let run = 0; run < runs; run++) {
+          const { context, page, scripts } = await openPage(browser)
+          try {
+            samples.push(await measureHydration(page, route))
+            if (run === 0 && budget.tabs) {
+              result.tabs = await measureTabs(page, scripts, budget.tabs)
+            }
+          } finally {
+            await context.close()
+          }
+        }
+        result.hydrationMs = median(samples)
+      }
+      results.push(result)
+
+      const jsStatus = check(failures, `${route} JS`, kb(js.gzip), budget.jsKb, "KB")
+      const hydrationStatus = check(
+        failures,
+        `${route} hydration`,
+        result.hydrationMs,
+        budget.hydrationMs,
+        "ms"
+      )
+      console.log(
+        `${route.padEnd(22)} JS ${kb(js.gzip).toFixed(1).padStart(7)} KB gzip` +
+          ` (${kb(js.raw).toFixed(0)} KB raw, ${js.count} files) / ${budget.jsKb} KB ${jsStatus}` +
+          (result.hydrationMs === null
+            ? "   hydration skipped"
+            : `   hydration ${result.hydrationMs.toFixed(0).padStart(5)} ms` +
+              ` / ${budget.hydrationMs} ms ${hydrationStatus}`)
+      )
+      for (const [name, tab] of Object.entries(result.tabs)) {
+        const tabBudget = budget.tabs[name].jsKb
+        const status = check(failures, `${route} "${name}" tab JS`, kb(tab.gzip), tabBudget, "KB")
+        console.log(
+          `  tab ${name.padEnd(16)} +${kb(tab.gzip).toFixed(1).padStart(6)} KB gzip` +
+            ` (${tab.count} files) / ${tabBudget} KB ${status}`
+        )
+      }
+    }
+  } finally {
+    await browser?.close()
+    server.kill()
+  }
+
+  if (jsonPath) {
+    writeFileSync(jsonPath, JSON.stringify({ runs, cpuSlowdown, results }, null, 2))
+  }
+
+  if (record) {
+    recordBaseline(results)
+    console.log(`\nRecorded the baseline with ${headroomPercent}% headroom in ${budgetsPath}.`)
+    return
+  }
+
+  if (failures.length > 0 && !baseline) {
+    console.warn(`\n${failures.length} over the provisional budgets:`)
+    for (const failure of failures) console.warn(`  ${failure}`)
+    console.warn("No baseline has been recorded yet; run with --record to set one.")
+    return
+  }
+  if (failures.length > 0) {
+    console.error(`\n${failures.length} over budget:`)
+    for (const failure of failures) console.error(`  ${failure}`)
+    process.exit(1)
+  }
+  console.log("\nAll routes within budget.")
+}
+
+main().catch((error) => {
+  console.error(error)
+  process.exit(1)
+})
@@ -0,0 +1,39 @@
+// Per-route budgets checked by scripts/perf-budget.mjs.
+//
+// jsKb is the gzipped size of every script a route's HTML loads, hydrationMs
+// the median time from navigation start to the root layout's hydration mark.
+// `tabs` budget the extra JS fetched the first time a lazily loaded tab is
+// opened. Lower a budget after a change that shrinks a route, so it stays
+// shrunk.
+//
+// `npm run perf:budget -- --record` rewrites this file from a measured run:
+// each budget becomes the measured value plus `baseline.headroomPercent`, and
+// the measurement itself is kept under `measured`. Until a baseline has been
+// recorded, `baseline` is null, the numbers below are estimates, and routes
+// over them are reported as warnings rather than failing the check.
+
+export const baseline = null
+
+export const budgets = {
+  "/": { jsKb: 190, hydrationMs: 1500 },
+  "/services": { jsKb: 170, hydrationMs: 1500 },
+  "/contact": { jsKb: 170, hydrationMs: 1500 },
+  "/privacy": { jsKb: 150, hydrationMs: 1200 },
+  "/terms": { jsKb: 150, hydrationMs: 1200 },
+  "/fleet": {
+    jsKb: 230,
+    hydrationMs: 2000,
+    tabs: {
+      "Live Map": { jsKb: 30 },
+      "Trip History": { jsKb: 20 },
+      Maintenance: { jsKb: 20 },
+      Drivers: { jsKb: 20 },
+      // recharts lives here and nowhere else
+      "Fuel & Costs": { jsKb: 160 },
+      Alerts: { jsKb: 20 },
+    },
+  },
+  "/dashboard/fleet": { jsKb: 160, hydrationMs: 1500 },
+  "/dashboard/support": { jsKb: 190, hydrationMs: 1500 },
+  "/dashboard/tracking": { jsKb: 150, hydrationMs: 1200 },
+}
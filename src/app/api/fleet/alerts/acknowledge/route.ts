@@ -0,0 +1,37 @@
+import { acknowledgeAlerts } from "@/lib/alert-hub"
+import { isAuthorized } from "@/lib/fleet-auth"
+
+export const dynamic = "force-dynamic"
+export const runtime = "nodejs"
+
+interface AcknowledgeRequest {
+  ids?: unknown
+  all?: unknown
+}
+
+// Acknowledges alerts for every dashboard: `{ "ids": [...] }` or
+// `{ "all": true }`. The acknowledged alerts are pushed to connected streams.
+// Needs the operator token when FLEET_INGEST_TOKEN is set.
+export async function POST(request: Request) {
+  if (!isAuthorized(request)) {
+    return Response.json({ error: "Unauthorized" }, { status: 401 })
+  }
+
+  let body: AcknowledgeRequest
+  try {
+    body = await request.json()
+  } catch {
+    return Response.json({ error: "Invalid JSON body" }, { status: 400 })
+  }
+
+  if (body.all === true) {
+    return Response.json({ acknowledged: acknowledgeAlerts("all") })
+  }
+  if (!Array.isArray(body.ids) || !body.ids.every((id) => typeof id === "string")) {
+    return Response.json(
+      { error: "Expected `ids` (an array of alert ids) or `all: true`" },
+      { status: 400 }
+    )
+  }
+  return Response.json({ acknowledged: acknowledgeAlerts(body.ids) })
+}
@@ -0,0 +1,10 @@
+import { getAlertHistory } from "@/lib/alert-hub"
+
+export const dynamic = "force-dynamic"
+export const runtime = "nodejs"
+
+// Alert history, oldest first. Live changes are pushed on the `alerts` event
+// of /api/fleet/stream.
+export function GET() {
+  return Response.json({ alerts: getAlertHistory() })
+}
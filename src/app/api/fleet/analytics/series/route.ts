@@ -0,0 +1,47 @@
+import { getSeries, parseAnalyticsRange } from "@/lib/fleet-analytics"
+import { SERIES_METRICS, type SeriesMetric, type SeriesMode } from "@/lib/time-series"
+
+export const dynamic = "force-dynamic"
+export const runtime = "nodejs"
+
+// Chart series for one metric, fleet-wide or for `vehicleId`, sized for a
+// chart `width` pixels wide: never more points than that, and never more than
+// 1,000. `mode=bars` returns whole buckets sized to stay readable as bars;
+// the default `line` mode downsamples finer data with LTTB.
+//
+//   GET /api/fleet/analytics/series?metric=cost&range=7d&width=640
+export function GET(request: Request) {
+  const params = new URL(request.url).searchParams
+
+  const metric = params.get("metric") as SeriesMetric | null
+  if (!metric || !SERIES_METRICS.includes(metric)) {
+    return Response.json(
+      { error: `\`metric\` must be one of ${SERIES_METRICS.join(", ")}` },
+      { status: 400 }
+    )
+  }
+  const mode = (params.get("mode") ?? "line") as SeriesMode
+  if (mode !== "line" && mode !== "bars") {
+    return Response.json({ error: "`mode` must be line or bars" }, { status: 400 })
+  }
+  const width = Number(params.get("width") ?? 1000)
+  if (!Number.isFinite(width) || width <= 0) {
+    return Response.json({ error: "`width` must be a positive number" }, { status: 400 })
+  }
+  const range = parseAnalyticsRange(params)
+  if (!range) {
+    return Response.json({ error: "Invalid `range`, `from` or `to`" }, { status: 400 })
+  }
+
+  const series = getSeries({
+    metric,
+    mode,
+    width,
+    ...range,
+    vehicleId: params.get("vehicleId") ?? undefined,
+  })
+  if (!series) {
+    return Response.json({ error: "Unknown vehicle" }, { status: 404 })
+  }
+  return Response.json(series)
+}
@@ -0,0 +1,28 @@
+import { getUsageSummary, parseAnalyticsRange } from "@/lib/fleet-analytics"
+
+export const dynamic = "force-dynamic"
+export const runtime = "nodejs"
+
+const MAX_VEHICLES = 100
+
+// Fleet fuel and cost totals over a range, plus the `limit` most utilized
+// vehicles (default 10).
+//
+//   GET /api/fleet/analytics/summary?range=7d&limit=10
+export function GET(request: Request) {
+  const params = new URL(request.url).searchParams
+
+  const range = parseAnalyticsRange(params)
+  if (!range) {
+    return Response.json({ error: "Invalid `range`, `from` or `to`" }, { status: 400 })
+  }
+  const limit = Number(params.get("limit") ?? 10)
+  if (!Number.isInteger(limit) || limit < 0 || limit > MAX_VEHICLES) {
+    return Response.json(
+      { error: `\`limit\` must be an integer from 0 to ${MAX_VEHICLES}` },
+      { status: 400 }
+    )
+  }
+
+  return Response.json(getUsageSummary(range, limit))
+}
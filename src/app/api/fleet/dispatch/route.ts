@@ -0,0 +1,65 @@
+import { DISPATCH_WINDOW_MS, getDispatchStatuses, requestRide } from "@/lib/dispatch-hub"
+import { parseLocation } from "@/lib/places"
+
+export const dynamic = "force-dynamic"
+export const runtime = "nodejs"
+
+const MAX_IDS = 500
+
+// Dispatch status of ride requests, keyed by request id. Unknown ids are
+// left out.
+//
+//   GET /api/fleet/dispatch?ids=RIDE-2851,RIDE-2852
+export function GET(request: Request) {
+  const ids = (new URL(request.url).searchParams.get("ids") ?? "").split(",").filter(Boolean)
+  if (ids.length === 0 || ids.length > MAX_IDS) {
+    return Response.json(
+      { error: `\`ids\` must list between 1 and ${MAX_IDS} request ids` },
+      { status: 400 }
+    )
+  }
+  return Response.json({ requests: getDispatchStatuses(ids) })
+}
+
+interface RideRequestBody {
+  id?: unknown
+  pickup?: unknown
+  dropoff?: unknown
+  accessible?: unknown
+}
+
+// Queues a ride request for the next dispatch window:
+// `{ "id", "pickup", "dropoff", "accessible"? }`, where pickup and dropoff
+// are place names or `{ "lat", "lng" }`. Responds 202 with the request's
+// status; poll GET for the assignment, then /api/fleet/eta for its ETA.
+export async function POST(request: Request) {
+  let body: RideRequestBody
+  try {
+    body = await request.json()
+  } catch {
+    return Response.json({ error: "Invalid JSON body" }, { status: 400 })
+  }
+
+  if (typeof body.id !== "string" || body.id === "") {
+    return Response.json({ error: "`id` must be a non-empty string" }, { status: 400 })
+  }
+  if (body.accessible !== undefined && typeof body.accessible !== "boolean") {
+    return Response.json({ error: "`accessible` must be a boolean" }, { status: 400 })
+  }
+  const pickup = parseLocation(body.pickup)
+  const dropoff = parseLocation(body.dropoff)
+  if (!pickup || !dropoff) {
+    return Response.json(
+      { error: "`pickup` and `dropoff` must be known place names or { lat, lng }" },
+      { status: 400 }
+    )
+  }
+
+  const status = requestRide({
+    id: body.id,
+    pickup,
+    dropoff,
+    accessible: body.accessible ?? false,
+  })
+  return Response.json({ request: status, windowMs: DISPATCH_WINDOW_MS }, { status: 202 })
+}
@@ -0,0 +1,65 @@
+import { getRideEtas, trackRide } from "@/lib/eta-hub"
+import { isAuthorized } from "@/lib/fleet-auth"
+import { parseLocation } from "@/lib/places"
+
+export const dynamic = "force-dynamic"
+export const runtime = "nodejs"
+
+const MAX_IDS = 500
+
+// Current ETA and progress of tracked rides, keyed by ride id. Unknown ids
+// are left out.
+//
+//   GET /api/fleet/eta?ids=trip-1,trip-5
+export function GET(request: Request) {
+  const ids = (new URL(request.url).searchParams.get("ids") ?? "").split(",").filter(Boolean)
+  if (ids.length === 0 || ids.length > MAX_IDS) {
+    return Response.json(
+      { error: `\`ids\` must list between 1 and ${MAX_IDS} ride ids` },
+      { status: 400 }
+    )
+  }
+  return Response.json({ etas: getRideEtas(ids) })
+}
+
+interface TrackRequest {
+  id?: unknown
+  vehicleId?: unknown
+  pickup?: unknown
+  dropoff?: unknown
+}
+
+// Starts tracking a ride:
+// `{ "id", "vehicleId", "pickup", "dropoff" }`, where pickup and dropoff are
+// place names or `{ "lat", "lng" }`. Returns the initial ETA. Needs the
+// operator token when FLEET_INGEST_TOKEN is set.
+export async function POST(request: Request) {
+  if (!isAuthorized(request)) {
+    return Response.json({ error: "Unauthorized" }, { status: 401 })
+  }
+
+  let body: TrackRequest
+  try {
+    body = await request.json()
+  } catch {
+    return Response.json({ error: "Invalid JSON body" }, { status: 400 })
+  }
+
+  if (typeof body.id !== "string" || typeof body.vehicleId !== "string") {
+    return Response.json({ error: "`id` and `vehicleId` must be strings" }, { status: 400 })
+  }
+  const pickup = parseLocation(body.pickup)
+  const dropoff = parseLocation(body.dropoff)
+  if (!pickup || !dropoff) {
+    return Response.json(
+      { error: "`pickup` and `dropoff` must be known place names or { lat, lng }" },
+      { status: 400 }
+    )
+  }
+
+  const eta = trackRide({ id: body.id, vehicleId: body.vehicleId, pickup, dropoff })
+  if (!eta) {
+    return Response.json({ error: "No route between pickup and dropoff" }, { status: 422 })
+  }
+  return Response.json({ eta })
+}
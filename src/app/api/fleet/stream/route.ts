@@ -0,0 +1,72 @@
+import { getAlertHistory, subscribeAlerts } from "@/lib/alert-hub"
+import { getVehicleSnapshot, subscribeTelemetry } from "@/lib/telemetry-hub"
+
+export const dynamic = "force-dynamic"
+export const runtime = "nodejs"
+
+const HEARTBEAT_MS = 15000
+
+const encoder = new TextEncoder()
+
+function formatEvent(event: string, data: unknown) {
+  return encoder.encode(`event: ${event}\ndata: ${JSON.stringify(data)}\n\n`)
+}
+
+// Server-Sent Events stream of fleet telemetry. Clients receive a `snapshot`
+// of every known vehicle on connect, then `telemetry` events carrying only
+// the per-vehicle position/speed/fuel changes of each ingested batch. Alerts
+// work the same way: the history on connect, then only new or changed alerts
+// (raised, escalated or acknowledged) as `alerts` events.
+export function GET(request: Request) {
+  let cleanup = () => {}
+
+  const stream = new ReadableStream<Uint8Array>({
+    start(controller) {
+      let closed = false
+      const send = (chunk: Uint8Array) => {
+        if (!closed) controller.enqueue(chunk)
+      }
+
+      const snapshot = getVehicleSnapshot()
+      if (snapshot.length > 0) {
+        send(formatEvent("snapshot", snapshot))
+      }
+
+      send(formatEvent("alerts", getAlertHistory()))
+
+      const unsubscribeTelemetry = subscribeTelemetry((updates) => {
+        send(formatEvent("telemetry", updates))
+      })
+      const unsubscribeAlerts = subscribeAlerts((alerts) => {
+        send(formatEvent("alerts", alerts))
+      })
+      const heartbeat = setInterval(() => send(encoder.encode(": heartbeat\n\n")), HEARTBEAT_MS)
+
+      cleanup = () => {
+        if (closed) return
+        closed = true
+        clearInterval(heartbeat)
+        unsubscribeTelemetry()
+        unsubscribeAlerts()
+      }
+
+      request.signal.addEventListener("abort", () => {
+        if (closed) return
+        cleanup()
+        controller.close()
+      })
+    },
+    cancel() {
+      cleanup()
+    },
+  })
+
+  return new Response(stream, {
+    headers: {
+      "Content-Type": "text/event-stream",
+      "Cache-Control": "no-cache, no-transform",
+      Connection: "keep-alive",
+      "X-Accel-Buffering": "no",
+    },
+  })
+}
@@ -0,0 +1,179 @@
+import { evaluateAlerts } from "@/lib/alert-hub"
+import { updateRideEtas } from "@/lib/eta-hub"
+import { recordTelemetry, registerVehicleNames } from "@/lib/fleet-analytics"
+import { isAuthorized } from "@/lib/fleet-auth"
+import type { Driver, TelemetryUpdate, Vehicle } from "@/lib/fleet-types"
+import { isRoadClass } from "@/lib/geofences"
+import { publishTelemetry, registerVehicles } from "@/lib/telemetry-hub"
+
+export const dynamic = "force-dynamic"
+export const runtime = "nodejs"
+
+// Timestamps must fall within this window around the server clock. Sources
+// may resend a backlog after an outage, but a wildly wrong clock would
+// otherwise open rollup buckets for the whole gap.
+const MAX_TIMESTAMP_AGE_MS = 24 * 60 * 60_000
+const MAX_TIMESTAMP_LEAD_MS = 5 * 60_000
+
+const VEHICLE_TYPES: ReadonlySet<string> = new Set<Vehicle["type"]>(["van", "sedan", "accessible"])
+const VEHICLE_STATUSES: ReadonlySet<string> = new Set<Vehicle["status"]>([
+  "active",
+  "idle",
+  "maintenance",
+  "offline",
+])
+const DRIVER_STATUSES: ReadonlySet<string> = new Set<Driver["status"]>([
+  "available",
+  "on-trip",
+  "off-duty",
+])
+
+interface TelemetryBatch {
+  vehicles?: unknown[]
+  updates?: unknown[]
+}
+
+function isFiniteNumber(value: unknown): value is number {
+  return typeof value === "number" && Number.isFinite(value)
+}
+
+function isRecord(value: unknown): value is Record<string, unknown> {
+  return typeof value === "object" && value !== null
+}
+
+function parseDriver(value: unknown): Driver | undefined {
+  if (!isRecord(value)) return undefined
+  const { id, name, phone, license, status, rating, avatar, totalTrips, safetyScore } = value
+  if (
+    typeof id !== "string" ||
+    typeof name !== "string" ||
+    typeof phone !== "string" ||
+    typeof license !== "string" ||
+    typeof status !== "string" ||
+    !DRIVER_STATUSES.has(status) ||
+    !isFiniteNumber(rating) ||
+    !isFiniteNumber(totalTrips) ||
+    !isFiniteNumber(safetyScore) ||
+    (avatar !== undefined && typeof avatar !== "string")
+  ) {
+    return undefined
+  }
+  return {
+    id,
+    name,
+    phone,
+    license,
+    status: status as Driver["status"],
+    rating,
+    avatar,
+    totalTrips,
+    safetyScore,
+  }
+}
+
+// Registered vehicles go to every dashboard in the stream snapshot, so only
+// well-formed ones are accepted, copied field by field
+function parseVehicle(value: unknown): Vehicle | undefined {
+  if (!isRecord(value) || !isRecord(value.location)) return undefined
+  const { id, name, type, licensePlate, status, fuelLevel, odometer, lastUpdate, speed, color } =
+    value
+  const { lat, lng, address } = value.location
+  const driver = value.driver === undefined ? undefined : parseDriver(value.driver)
+  if (
+    typeof id !== "string" ||
+    typeof name !== "string" ||
+    typeof type !== "string" ||
+    !VEHICLE_TYPES.has(type) ||
+    typeof licensePlate !== "string" ||
+    typeof status !== "string" ||
+    !VEHICLE_STATUSES.has(status) ||
+    !isFiniteNumber(lat) ||
+    !isFiniteNumber(lng) ||
+    typeof address !== "string" ||
+    !isFiniteNumber(fuelLevel) ||
+    !isFiniteNumber(odometer) ||
+    !isFiniteNumber(lastUpdate) ||
+    !isFiniteNumber(speed) ||
+    typeof color !== "string" ||
+    (value.driver !== undefined && !driver)
+  ) {
+    return undefined
+  }
+  return {
+    id,
+    name,
+    type: type as Vehicle["type"],
+    licensePlate,
+    status: status as Vehicle["status"],
+    driver,
+    location: { lat, lng, address },
+    fuelLevel,
+    odometer,
+    lastUpdate,
+    speed,
+    color,
+  }
+}
+
+function isTelemetryUpdate(value: unknown, now: number): value is TelemetryUpdate {
+  if (typeof value !== "object" || value === null) return false
+  const update = value as Record<string, unknown>
+  return (
+    typeof update.vehicleId === "string" &&
+    isFiniteNumber(update.lat) &&
+    isFiniteNumber(update.lng) &&
+    isFiniteNumber(update.speed) &&
+    isFiniteNumber(update.fuelLevel) &&
+    isFiniteNumber(update.timestamp) &&
+    update.timestamp >= now - MAX_TIMESTAMP_AGE_MS &&
+    update.timestamp <= now + MAX_TIMESTAMP_LEAD_MS &&
+    (update.roadClass === undefined || isRoadClass(update.roadClass))
+  )
+}
+
+// Ingestion endpoint for telemetry sources (see scripts/fleet-simulator.ts).
+// Set FLEET_INGEST_TOKEN to require a matching bearer token.
+export async function POST(request: Request) {
+  if (!isAuthorized(request)) {
+    return Response.json({ error: "Unauthorized" }, { status: 401 })
+  }
+
+  let batch: TelemetryBatch
+  try {
+    batch = await request.json()
+  } catch {
+    return Response.json({ error: "Invalid JSON body" }, { status: 400 })
+  }
+
+  if (batch.vehicles !== undefined && !Array.isArray(batch.vehicles)) {
+    return Response.json({ error: "`vehicles` must be an array" }, { status: 400 })
+  }
+  if (batch.updates !== undefined && !Array.isArray(batch.updates)) {
+    return Response.json({ error: "`updates` must be an array" }, { status: 400 })
+  }
+
+  if (batch.vehicles) {
+    const vehicles: Vehicle[] = []
+    for (const [index, value] of batch.vehicles.entries()) {
+      const vehicle = parseVehicle(value)
+      if (!vehicle) {
+        return Response.json(
+          { error: `\`vehicles[${index}]\` is not a valid vehicle` },
+          { status: 400 }
+        )
+      }
+      vehicles.push(vehicle)
+    }
+    registerVehicles(vehicles)
+    registerVehicleNames(vehicles)
+  }
+
+  const now = Date.now()
+  const updates = (batch.updates ?? []).filter((update) => isTelemetryUpdate(update, now))
+  publishTelemetry(updates)
+  recordTelemetry(updates)
+  evaluateAlerts(updates)
+  updateRideEtas(updates)
+
+  return Response.json({ accepted: updates.length })
+}
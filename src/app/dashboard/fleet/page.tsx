@@ -115,9 +115,10 @@ function getStatusCounts(vehicles: Vehicle[]) {
   );
 }
 
-export default function FleetDashboardPage() {
-  const stats = getStatusCounts(vehicles);
+// The rows are static, so they are counted once rather than per request
+const stats = getStatusCounts(vehicles);
 
+export default function FleetDashboardPage() {
   return (
     <div className="min-h-screen bg-background">
       <div className="container mx-auto px-4 py-8">
@@ -1,19 +1,17 @@
+import { Car, Clock, History, Map as MapIcon, MapPin, Phone, Star } from "lucide-react"
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card"
 import { Badge } from "@/components/ui/badge"
 import { Avatar, AvatarFallback, AvatarImage } from "@/components/ui/avatar"
-import { Progress } from "@/components/ui/progress"
 import { Button } from "@/components/ui/button"
+import { RideEtaPanel } from "@/components/tracking/ride-eta-panel"
+import { getRideEtas } from "@/lib/eta-hub"
+import { seedActiveRide } from "@/lib/fleet-data"
 
 // Mock data for current ride
 const currentRide = {
-  id: "RIDE-2847",
+  ...seedActiveRide,
   status: "in_progress" as const,
-  pickup: "Grand Junction Medical Center",
-  dropoff: "1247 Patterson Road, Grand Junction",
   scheduledTime: "2:30 PM",
-  estimatedArrival: "2:45 PM",
-  etaMinutes: 12,
-  progress: 65,
   driver: {
     name: "Marcus Johnson",
     photo: "/driver.png",
@@ -72,72 +70,12 @@ function StatusBadge({ status }: { status: "in_progress" | "completed" | "cancel
   return <Badge className={className}>{label}</Badge>
 }
 
-function MapIcon({ className }: { className?: string }) {
-  return (
-    <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2" strokeLinecap="round" strokeLinejoin="round" className={className}>
-      <polygon points="3 6 9 3 15 6 21 3 21 18 15 21 9 18 3 21" />
-      <line x1="9" y1="3" x2="9" y2="18" />
-      <line x1="15" y1="6" x2="15" y2="21" />
-    </svg>
-  )
-}
-
-function PhoneIcon({ className }: { className?: string }) {
-  return (
-    <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2" strokeLinecap="round" strokeLinejoin="round" className={className}>
-      <path d="M22 16.92v3a2 2 0 0 1-2.18 2 19.79 19.79 0 0 1-8.63-3.07 19.5 19.5 0 0 1-6-6 19.79 19.79 0 0 1-3.07-8.67A2 2 0 0 1 4.11 2h3a2 2 0 0 1 2 1.72 12.84 12.84 0 0 0 .7 2.81 2 2 0 0 1-.45 2.11L8.09 9.91a16 16 0 0 0 6 6l1.27-1.27a2 2 0 0 1 2.11-.45 12.84 12.84 0 0 0 2.81.7A2 2 0 0 1 22 16.92z" />
-    </svg>
-  )
-}
-
-function ClockIcon({ className }: { className?: string }) {
-  return (
-    <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2" strokeLinecap="round" strokeLinejoin="round" className={className}>
-      <circle cx="12" cy="12" r="10" />
-      <polyline points="12 6 12 12 16 14" />
-    </svg>
-  )
-}
-
-function CarIcon({ className }: { className?: string }) {
-  return (
-    <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2" strokeLinecap="round" strokeLinejoin="round" className={className}>
-      <path d="M19 17h2c.6 0 1-.4 1-1v-3c0-.9-.7-1.7-1.5-1.9C18.7 10.6 16 10 16 10s-1.3-1.4-2.2-2.3c-.5-.4-1.1-.7-1.8-.7H5c-.6 0-1.1.4-1.4.9l-1.5 2.8C1.4 11.3 1 12.1 1 13v3c0 .6.4 1 1 1h2" />
-      <circle cx="7" cy="17" r="2" />
-      <path d="M9 17h6" />
-      <circle cx="17" cy="17" r="2" />
-    </svg>
-  )
-}
-
-function StarIcon({ className }: { className?: string }) {
-  return (
-    <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="currentColor" className={className}>
-      <polygon points="12 2 15.09 8.26 22 9.27 17 14.14 18.18 21.02 12 17.77 5.82 21.02 7 14.14 2 9.27 8.91 8.26 12 2" />
-    </svg>
-  )
-}
-
-function LocationPinIcon({ className }: { className?: string }) {
-  return (
-    <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2" strokeLinecap="round" strokeLinejoin="round" className={className}>
-      <path d="M21 10c0 7-9 13-9 13s-9-6-9-13a9 9 0 0 1 18 0z" />
-      <circle cx="12" cy="10" r="3" />
-    </svg>
-  )
-}
-
-function HistoryIcon({ className }: { className?: string }) {
-  return (
-    <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2" strokeLinecap="round" strokeLinejoin="round" className={className}>
-      <path d="M3 3v5h5" />
-      <path d="M3.05 13A9 9 0 1 0 6 5.3L3 8" />
-      <path d="M12 7v5l4 2" />
-    </svg>
-  )
-}
+// ETAs are live
+export const dynamic = "force-dynamic"
 
 export default function RideTrackingPage() {
+  const eta = getRideEtas([currentRide.id])[currentRide.id] ?? null
+
   return (
     <div className="min-h-screen bg-background">
       <div className="container mx-auto max-w-6xl px-4 py-8">
@@ -156,7 +94,7 @@ export default function RideTrackingPage() {
                 <div className="flex items-center justify-between">
                   <div>
                     <CardTitle className="flex items-center gap-2">
-                      <CarIcon className="size-5 text-primary" />
+                      <Car className="size-5 text-primary" />
                       Active Ride
                     </CardTitle>
                     <CardDescription className="mt-1">Ride #{currentRide.id}</CardDescription>
@@ -185,22 +123,7 @@ export default function RideTrackingPage() {
                 </div>
 
                 {/* ETA Progress */}
-                <div className="rounded-lg bg-muted/50 p-4">
-                  <div className="flex items-center justify-between mb-3">
-                    <div className="flex items-center gap-2">
-                      <ClockIcon className="size-4 text-muted-foreground" />
-                      <span className="text-sm text-muted-foreground">Estimated Arrival</span>
-                    </div>
-                    <div className="text-right">
-                      <span className="text-2xl font-bold text-primary">{currentRide.etaMinutes}</span>
-                      <span className="ml-1 text-sm text-muted-foreground">min</span>
-                    </div>
-                  </div>
-                  <Progress value={currentRide.progress} className="h-2" />
-                  <p className="mt-2 text-sm text-muted-foreground text-center">
-                    Arriving at {currentRide.estimatedArrival}
-                  </p>
-                </div>
+                <RideEtaPanel rideId={currentRide.id} initial={eta} />
 
                 {/* Fare */}
                 <div className="mt-4 flex items-center justify-between rounded-lg border p-4">
@@ -220,7 +143,7 @@ export default function RideTrackingPage() {
               </CardHeader>
               <CardContent>
                 <div className="relative h-64 w-full rounded-lg bg-muted/30 border-2 border-dashed border-muted-foreground/20 flex flex-col items-center justify-center">
-                  <LocationPinIcon className="size-12 text-muted-foreground/40" />
+                  <MapPin className="size-12 text-muted-foreground/40" />
                   <p className="mt-2 text-sm text-muted-foreground">Live route visualization</p>
                   <p className="text-xs text-muted-foreground/60">Map integration coming soon</p>
                 </div>
@@ -245,7 +168,7 @@ export default function RideTrackingPage() {
                   </Avatar>
                   <h3 className="mt-4 text-xl font-semibold">{currentRide.driver.name}</h3>
                   <div className="mt-1 flex items-center gap-1">
-                    <StarIcon className="size-4 text-warning" />
+                    <Star className="size-4 fill-warning text-warning" />
                     <span className="font-medium">{currentRide.driver.rating}</span>
                     <span className="text-muted-foreground text-sm">rating</span>
                   </div>
@@ -263,7 +186,7 @@ export default function RideTrackingPage() {
                 </div>
 
                 <Button className="mt-6 w-full" variant="outline">
-                  <PhoneIcon className="size-4" />
+                  <Phone className="size-4" />
                   Contact Driver
                 </Button>
               </CardContent>
@@ -280,7 +203,7 @@ export default function RideTrackingPage() {
                   Share Live Location
                 </Button>
                 <Button variant="ghost" className="w-full justify-start">
-                  <ClockIcon className="size-4" />
+                  <Clock className="size-4" />
                   Edit Pickup Time
                 </Button>
                 <Button variant="ghost" className="w-full justify-start text-destructive hover:text-destructive">
@@ -295,7 +218,7 @@ export default function RideTrackingPage() {
         <Card className="mt-8">
           <CardHeader>
             <CardTitle className="flex items-center gap-2">
-              <HistoryIcon className="size-5" />
+              <History className="size-5" />
               Recent Rides
             </CardTitle>
             <CardDescription>Your ride history from the past week</CardDescription>
@@ -309,7 +232,7 @@ export default function RideTrackingPage() {
                     <div className="flex items-start justify-between gap-2">
                       <div className="flex items-start gap-3">
                         <div className="rounded-lg bg-muted p-2 shrink-0">
-                          <CarIcon className="size-5 text-muted-foreground" />
+                          <Car className="size-5 text-muted-foreground" />
                         </div>
                         <div className="min-w-0">
                           <p className="text-sm text-muted-foreground">{ride.date} • {ride.id}</p>
@@ -335,7 +258,7 @@ export default function RideTrackingPage() {
                   <div className="hidden sm:flex items-center justify-between">
                     <div className="flex items-start gap-4">
                       <div className="rounded-lg bg-muted p-2">
-                        <CarIcon className="size-5 text-muted-foreground" />
+                        <Car className="size-5 text-muted-foreground" />
                       </div>
                       <div>
                         <div className="flex items-center gap-2">
@@ -2,6 +2,7 @@ import type { Metadata } from "next";
 import { Inter, Geist_Mono } from "next/font/google";
 import { ThemeProvider } from "@/components/theme-provider";
 import { Header } from "@/components/header";
+import { HydrationMark } from "@/components/hydration-mark";
 import "./globals.css";
 
 const inter = Inter({
@@ -173,6 +174,7 @@ export default function RootLayout({
           <Header />
           {children}
         </ThemeProvider>
+        <HydrationMark />
       </body>
     </html>
   );
@@ -0,0 +1,155 @@
+"use client"
+
+import { useCallback, useMemo } from "react"
+import {
+  AlertTriangle,
+  CheckCircle2,
+  Clock,
+  Fuel,
+  Gauge,
+  MapPin,
+  Wrench,
+  type LucideIcon,
+} from "lucide-react"
+import { Badge } from "@/components/ui/badge"
+import { Button } from "@/components/ui/button"
+import { Card } from "@/components/ui/card"
+import { VirtualList } from "@/components/ui/virtual-list"
+import { acknowledgeAlerts } from "@/lib/alert-actions"
+import type { Alert } from "@/lib/fleet-types"
+import { useCount, useEntity, useFleetStore, useIds } from "@/lib/use-fleet-store"
+
+const getAlertSeverityColor = (severity: Alert["severity"]) => {
+  switch (severity) {
+    case "high":
+      return "text-red-400 bg-red-500/20 border-red-500/30"
+    case "medium":
+      return "text-amber-400 bg-amber-500/20 border-amber-500/30"
+    case "low":
+      return "text-blue-400 bg-blue-500/20 border-blue-500/30"
+  }
+}
+
+const ALERT_ICONS: Record<Alert["type"], LucideIcon> = {
+  speeding: Gauge,
+  maintenance: Wrench,
+  "fuel-low": Fuel,
+  geofence: MapPin,
+  idle: Clock,
+  "harsh-braking": AlertTriangle,
+}
+
+function AlertRow({ id }: { id: string }) {
+  const store = useFleetStore()
+  const alert = useEntity(store.alerts, id)
+  if (!alert) return null
+
+  const AlertIcon = ALERT_ICONS[alert.type]
+  return (
+    <div
+      className={`glass-dark rounded-lg p-4 ${
+        alert.acknowledged ? "opacity-50" : ""
+      }`}
+    >
+      <div className="flex items-start justify-between mb-3">
+        <div className="flex items-center gap-3">
+          <div
+            className={`w-10 h-10 rounded-full flex items-center justify-center ${
+              alert.severity === "high"
+                ? "bg-red-500/20"
+                : alert.severity === "medium"
+                ? "bg-amber-500/20"
+                : "bg-blue-500/20"
+            }`}
+          >
+            <AlertIcon
+              className={`h-5 w-5 ${
+                alert.severity === "high"
+                  ? "text-red-400"
+                  : alert.severity === "medium"
+                  ? "text-amber-400"
+                  : "text-blue-400"
+              }`}
+            />
+          </div>
+          <div>
+            <p className="text-foreground font-medium text-sm">
+              {alert.vehicleName}
+            </p>
+            <p className="text-muted-foreground text-xs capitalize">
+              {alert.type.replace("-", " ")}
+            </p>
+          </div>
+        </div>
+        <div className="flex items-center gap-2">
+          <Badge className={getAlertSeverityColor(alert.severity)}>
+            {alert.severity.toUpperCase()}
+          </Badge>
+          {!alert.acknowledged && (
+            <Button
+              variant="ghost"
+              size="sm"
+              className="h-8 w-8 p-0"
+              onClick={() => acknowledgeAlerts(store, [alert.id])}
+            >
+              <CheckCircle2 className="h-4 w-4 text-primary" />
+            </Button>
+          )}
+        </div>
+      </div>
+
+      <p className="text-foreground text-sm mb-2">{alert.message}</p>
+      <p className="text-muted-foreground text-xs">
+        {new Date(alert.timestamp).toLocaleString()}
+        {(alert.occurrences ?? 1) > 1 && ` · ${alert.occurrences} times`}
+      </p>
+    </div>
+  )
+}
+
+export function AlertsPanel() {
+  const store = useFleetStore()
+  const highAlerts = useCount(store.alerts, "openSeverity", "high")
+  const mediumAlerts = useCount(store.alerts, "openSeverity", "medium")
+  const alertIds = useIds(store.alerts)
+  const newestFirstAlertIds = useMemo(() => [...alertIds].reverse(), [alertIds])
+  const getAlertKey = useCallback(
+    (index: number) => newestFirstAlertIds[index],
+    [newestFirstAlertIds]
+  )
+
+  return (
+    <Card className="glass border-primary/30 p-6">
+      <div className="flex items-center justify-between mb-6">
+        <h3 className="text-lg font-semibold text-foreground">Alert Center</h3>
+        <div className="flex items-center gap-2">
+          <Badge className="bg-red-500/20 text-red-400 border-red-500/30">
+            {highAlerts} High
+          </Badge>
+          <Badge className="bg-amber-500/20 text-amber-400 border-amber-500/30">
+            {mediumAlerts} Medium
+          </Badge>
+          <Button
+            variant="outline"
+            size="sm"
+            className="border-primary/30"
+            onClick={() => acknowledgeAlerts(store, "all")}
+          >
+            Acknowledge All
+          </Button>
+        </div>
+      </div>
+
+      <VirtualList
+        className="h-[600px] pr-4"
+        aria-label="Alerts"
+        count={newestFirstAlertIds.length}
+        getItemKey={getAlertKey}
+        estimateSize={132}
+        gap={12}
+        onActivate={(index) => acknowledgeAlerts(store, [newestFirstAlertIds[index]])}
+        renderItem={(index) => <AlertRow id={newestFirstAlertIds[index]} />}
+      />
+    </Card>
+  )
+}
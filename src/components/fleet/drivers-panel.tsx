@@ -0,0 +1,106 @@
+"use client"
+
+import { useCallback, useState } from "react"
+import { Phone, Search, Star, User } from "lucide-react"
+import { Badge } from "@/components/ui/badge"
+import { Card } from "@/components/ui/card"
+import { Input } from "@/components/ui/input"
+import { Progress } from "@/components/ui/progress"
+import { Separator } from "@/components/ui/separator"
+import { VirtualList } from "@/components/ui/virtual-list"
+import { getDriverStatusColor } from "@/components/fleet/status"
+import { useEntity, useFleetStore, useIds } from "@/lib/use-fleet-store"
+import { useSearch, useSharedSearchClient } from "@/lib/use-search"
+
+function DriverCard({ id }: { id: string }) {
+  const store = useFleetStore()
+  const driver = useEntity(store.drivers, id)
+  if (!driver) return null
+
+  return (
+    <Card className="glass border-primary/30 p-5">
+      <div className="flex items-start gap-4 mb-4">
+        <div className="w-14 h-14 rounded-full bg-gradient-to-br from-primary/30 to-secondary/30 flex items-center justify-center">
+          <User className="h-7 w-7 text-foreground" />
+        </div>
+        <div className="flex-1">
+          <h3 className="text-lg font-bold text-foreground">{driver.name}</h3>
+          <p className="text-muted-foreground text-sm">{driver.license}</p>
+        </div>
+      </div>
+
+      <Badge className={`${getDriverStatusColor(driver.status)} mb-4`}>
+        {driver.status.replace("-", " ").toUpperCase()}
+      </Badge>
+
+      <div className="flex items-center gap-2 mb-4">
+        <Phone className="h-4 w-4 text-muted-foreground" />
+        <span className="text-muted-foreground text-sm">{driver.phone}</span>
+      </div>
+
+      <Separator className="bg-border/20 mb-4" />
+
+      <div className="grid grid-cols-3 gap-4">
+        <div className="text-center">
+          <div className="flex items-center justify-center gap-1 mb-1">
+            <Star className="h-4 w-4 text-amber-400" />
+            <span className="text-foreground font-mono">{driver.rating}</span>
+          </div>
+          <p className="text-muted-foreground text-xs">Rating</p>
+        </div>
+        <div className="text-center">
+          <p className="text-foreground font-mono">{driver.totalTrips}</p>
+          <p className="text-muted-foreground text-xs">Trips</p>
+        </div>
+        <div className="text-center">
+          <p className="text-primary font-mono">{driver.safetyScore}%</p>
+          <p className="text-muted-foreground text-xs">Safety</p>
+        </div>
+      </div>
+
+      <div className="mt-4">
+        <div className="flex items-center justify-between mb-1">
+          <span className="text-muted-foreground text-xs">Safety Score</span>
+          <span className="text-primary text-xs">{driver.safetyScore}%</span>
+        </div>
+        <Progress value={driver.safetyScore} className="h-1.5" />
+      </div>
+    </Card>
+  )
+}
+
+export function DriversPanel() {
+  const store = useFleetStore()
+  const [driverQuery, setDriverQuery] = useState("")
+
+  const driverIds = useIds(store.drivers)
+  const searchClient = useSharedSearchClient()
+  const filteredDriverIds =
+    useSearch(searchClient, driverQuery, { kinds: ["driver"] }).ids ?? driverIds
+  const getDriverKey = useCallback((index: number) => filteredDriverIds[index], [filteredDriverIds])
+
+  return (
+    <>
+    <div className="relative">
+      <Search className="absolute left-3 top-1/2 -translate-y-1/2 h-4 w-4 text-muted-foreground" />
+      <Input
+        placeholder="Search drivers by name, license, or phone..."
+        value={driverQuery}
+        onChange={(e) => setDriverQuery(e.target.value)}
+        className="pl-10 glass border-primary/30"
+      />
+    </div>
+
+    <VirtualList
+      className="h-[720px] pr-4"
+      aria-label="Drivers"
+      count={filteredDriverIds.length}
+      getItemKey={getDriverKey}
+      estimateSize={300}
+      minItemWidth={280}
+      gap={16}
+      renderItem={(index) => <DriverCard id={filteredDriverIds[index]} />}
+    />
+    </>
+  )
+}
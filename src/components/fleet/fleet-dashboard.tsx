@@ -0,0 +1,99 @@
+"use client"
+
+import { createContext, useContext, useMemo, useState, type ReactNode } from "react"
+import dynamic from "next/dynamic"
+import { FleetStore, type FleetSeed } from "@/lib/fleet-store"
+import { FleetStoreProvider, useFleetStore } from "@/lib/use-fleet-store"
+import { useFleetTelemetry } from "@/lib/use-fleet-telemetry"
+import {
+  driverSearchFields,
+  SearchClientProvider,
+  tripSearchFields,
+  useSharedSearchClient,
+  useTableSearchSync,
+  vehicleSearchFields,
+} from "@/lib/use-search"
+
+// The modal pulls in framer-motion, so it is only fetched once a vehicle is
+// first selected
+const VehicleDetailModal = dynamic(() =>
+  import("@/components/fleet/vehicle-detail").then((mod) => mod.VehicleDetailModal)
+)
+
+interface VehicleSelection {
+  selectedVehicleId: string | null
+  selectVehicle: (id: string | null) => void
+}
+
+const VehicleSelectionContext = createContext<VehicleSelection | null>(null)
+
+export function useVehicleSelection() {
+  const selection = useContext(VehicleSelectionContext)
+  if (!selection) {
+    throw new Error("useVehicleSelection must be used within a FleetDashboard")
+  }
+  return selection
+}
+
+// Keeps the shared search index in step with the store while the dashboard
+// is mounted, whichever tabs are open
+function FleetSearchSync() {
+  const store = useFleetStore()
+  const client = useSharedSearchClient()
+  useTableSearchSync(client, store.vehicles, "vehicle", vehicleSearchFields)
+  useTableSearchSync(client, store.drivers, "driver", driverSearchFields)
+  useTableSearchSync(client, store.trips, "trip", tripSearchFields)
+  return null
+}
+
+// Client root of the fleet page: owns the store, the live telemetry
+// connection, the search index and the selected vehicle. Everything static is rendered by the
+// server page and passed in as children.
+export function FleetDashboard({ seed, children }: { seed: FleetSeed; children: ReactNode }) {
+  const [store] = useState(() => new FleetStore(seed))
+  const [selectedVehicleId, setSelectedVehicleId] = useState<string | null>(null)
+  const selection = useMemo<VehicleSelection>(
+    () => ({ selectedVehicleId, selectVehicle: setSelectedVehicleId }),
+    [selectedVehicleId]
+  )
+  // Stays mounted after the first selection so the modal can animate out
+  const [detailLoaded, setDetailLoaded] = useState(false)
+  if (selectedVehicleId && !detailLoaded) setDetailLoaded(true)
+
+  // Live telemetry - changes arrive batched once per animation frame
+  const connection = useFleetTelemetry({
+    onTelemetry: (updates) => store.applyTelemetry(updates),
+    onSnapshot: (vehicles) => store.vehicles.upsertMany(vehicles),
+    onAlerts: (alerts) => store.applyAlerts(alerts),
+  })
+
+  return (
+    <FleetStoreProvider store={store}>
+      <SearchClientProvider>
+        <FleetSearchSync />
+        <VehicleSelectionContext value={selection}>
+          {children}
+
+          {detailLoaded && (
+            <VehicleDetailModal
+              id={selectedVehicleId}
+              onClose={() => setSelectedVehicleId(null)}
+            />
+          )}
+
+          {/* Live Indicator */}
+          <div className="fixed bottom-8 right-8 glass border-primary/30 rounded-full px-4 py-2 flex items-center gap-2 animate-fade-in">
+            <div className="w-2 h-2 bg-primary rounded-full animate-pulse" />
+            <span className="text-primary text-sm font-mono">
+              {connection === "live"
+                ? "Live Tracking"
+                : connection === "connecting"
+                ? "Connecting..."
+                : "Offline"}
+            </span>
+          </div>
+        </VehicleSelectionContext>
+      </SearchClientProvider>
+    </FleetStoreProvider>
+  )
+}
@@ -0,0 +1,101 @@
+"use client"
+
+import { Activity, Bell, Clock, Gauge, Truck, Wrench, XCircle } from "lucide-react"
+import { Badge } from "@/components/ui/badge"
+import { Card } from "@/components/ui/card"
+import { Progress } from "@/components/ui/progress"
+import { useCount, useFleetStore } from "@/lib/use-fleet-store"
+
+// Fleet metrics - index bucket sizes, maintained incrementally by the store
+
+export function FleetHeaderBadges() {
+  const store = useFleetStore()
+  const totalVehicles = useCount(store.vehicles)
+  const activeVehicles = useCount(store.vehicles, "status", "active")
+  const unacknowledgedAlerts = useCount(store.alerts, "status", "open")
+
+  return (
+    <>
+      <Badge className="bg-primary/20 text-primary border-primary/30 text-sm px-3 py-1">
+        {activeVehicles} / {totalVehicles} Active
+      </Badge>
+      {unacknowledgedAlerts > 0 && (
+        <Badge className="bg-red-500/20 text-red-400 border-red-500/30 text-sm px-3 py-1">
+          <Bell className="h-3 w-3 mr-1" />
+          {unacknowledgedAlerts} Alerts
+        </Badge>
+      )}
+    </>
+  )
+}
+
+export function FleetOverviewCards() {
+  const store = useFleetStore()
+  const totalVehicles = useCount(store.vehicles)
+  const activeVehicles = useCount(store.vehicles, "status", "active")
+  const idleVehicles = useCount(store.vehicles, "status", "idle")
+  const maintenanceVehicles = useCount(store.vehicles, "status", "maintenance")
+  const offlineVehicles = useCount(store.vehicles, "status", "offline")
+  const utilizationRate =
+    totalVehicles > 0 ? ((activeVehicles + idleVehicles) / totalVehicles) * 100 : 0
+
+  return (
+    <>
+    <Card className="glass border-primary/30 p-4">
+      <div className="flex items-center justify-between mb-2">
+        <p className="text-muted-foreground text-xs sm:text-sm">Total Fleet</p>
+        <Truck className="h-4 w-4 sm:h-5 sm:w-5 text-primary/50" />
+      </div>
+      <p className="text-2xl sm:text-3xl font-bold text-primary font-mono">{totalVehicles}</p>
+      <p className="text-muted-foreground text-xs mt-1">vehicles</p>
+    </Card>
+
+    <Card className="glass border-primary/30 p-4">
+      <div className="flex items-center justify-between mb-2">
+        <p className="text-muted-foreground text-xs sm:text-sm">Active</p>
+        <Activity className="h-4 w-4 sm:h-5 sm:w-5 text-primary/50" />
+      </div>
+      <p className="text-2xl sm:text-3xl font-bold text-primary font-mono">{activeVehicles}</p>
+      <p className="text-muted-foreground text-xs mt-1">on the road</p>
+    </Card>
+
+    <Card className="glass border-secondary/30 p-4">
+      <div className="flex items-center justify-between mb-2">
+        <p className="text-muted-foreground text-xs sm:text-sm">Idle</p>
+        <Clock className="h-4 w-4 sm:h-5 sm:w-5 text-secondary/50" />
+      </div>
+      <p className="text-2xl sm:text-3xl font-bold text-secondary font-mono">{idleVehicles}</p>
+      <p className="text-muted-foreground text-xs mt-1">standing by</p>
+    </Card>
+
+    <Card className="glass border-amber-500/30 p-4">
+      <div className="flex items-center justify-between mb-2">
+        <p className="text-muted-foreground text-xs sm:text-sm">Maintenance</p>
+        <Wrench className="h-4 w-4 sm:h-5 sm:w-5 text-amber-400/50" />
+      </div>
+      <p className="text-2xl sm:text-3xl font-bold text-amber-400 font-mono">{maintenanceVehicles}</p>
+      <p className="text-muted-foreground text-xs mt-1">in service</p>
+    </Card>
+
+    <Card className="glass border-blue-500/30 p-4">
+      <div className="flex items-center justify-between mb-2">
+        <p className="text-muted-foreground text-xs sm:text-sm">Utilization</p>
+        <Gauge className="h-4 w-4 sm:h-5 sm:w-5 text-blue-400/50" />
+      </div>
+      <p className="text-2xl sm:text-3xl font-bold text-blue-400 font-mono">
+        {utilizationRate.toFixed(0)}%
+      </p>
+      <Progress value={utilizationRate} className="h-1.5 mt-2" />
+    </Card>
+
+    <Card className="glass border-red-500/30 p-4">
+      <div className="flex items-center justify-between mb-2">
+        <p className="text-muted-foreground text-xs sm:text-sm">Offline</p>
+        <XCircle className="h-4 w-4 sm:h-5 sm:w-5 text-red-400/50" />
+      </div>
+      <p className="text-2xl sm:text-3xl font-bold text-red-400 font-mono">{offlineVehicles}</p>
+      <p className="text-muted-foreground text-xs mt-1">disconnected</p>
+    </Card>
+    </>
+  )
+}
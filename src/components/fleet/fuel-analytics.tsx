@@ -0,0 +1,350 @@
+"use client"
+
+import { useState, type ReactNode } from "react"
+import { DollarSign, Fuel, Gauge, Route, type LucideIcon } from "lucide-react"
+import {
+  Area,
+  AreaChart,
+  Bar,
+  BarChart,
+  CartesianGrid,
+  Cell,
+  ResponsiveContainer,
+  Tooltip,
+  XAxis,
+  YAxis,
+} from "recharts"
+import { Button } from "@/components/ui/button"
+import { Card } from "@/components/ui/card"
+import { ANALYTICS_RANGES, type AnalyticsRangeKey, type Resolution } from "@/lib/time-series"
+import { useAnalyticsSeries, useUsageSummary } from "@/lib/use-fleet-analytics"
+import { cn } from "@/lib/utils"
+
+// Chart colors - Recharts needs actual color values, not CSS variables
+const CHART_COLORS = {
+  primary: "#f59e0b",      // Sunshine orange
+  secondary: "#3b82f6",    // Blue
+  success: "#22c55e",      // Green
+  warning: "#eab308",      // Yellow
+  danger: "#ef4444",       // Red
+  muted: "#6b7280",        // Gray
+  border: "#374151",       // Border gray
+  // Tooltip colors
+  tooltipBg: "#1f2937",    // Dark background
+  tooltipBorder: "#374151", // Border
+  tooltipText: "#f9fafb",  // Light text
+}
+
+const TOOLTIP_STYLE = {
+  contentStyle: {
+    backgroundColor: CHART_COLORS.tooltipBg,
+    border: `1px solid ${CHART_COLORS.tooltipBorder}`,
+    borderRadius: "8px",
+    color: CHART_COLORS.tooltipText,
+  },
+  labelStyle: { color: CHART_COLORS.tooltipText },
+  itemStyle: { color: CHART_COLORS.tooltipText },
+}
+
+const AXIS_TICK = { fill: CHART_COLORS.muted, fontSize: 12 }
+const CHART_HEIGHT = 300
+
+const RANGE_LABELS: Record<AnalyticsRangeKey, string> = {
+  "24h": "last 24 hours",
+  "7d": "last 7 days",
+  "30d": "last 30 days",
+  "90d": "last 90 days",
+}
+
+const PER_BUCKET: Record<Resolution, string> = {
+  minute: "per minute",
+  hour: "per hour",
+  day: "per day",
+  week: "per week",
+}
+
+const formatTick = (time: number, resolution: Resolution) =>
+  new Date(time).toLocaleString(
+    undefined,
+    resolution === "minute" || resolution === "hour"
+      ? { hour: "numeric", minute: "2-digit" }
+      : resolution === "day"
+      ? { weekday: "short", day: "numeric" }
+      : { month: "short", day: "numeric" }
+  )
+
+const formatTooltipTime = (time: number) =>
+  new Date(time).toLocaleString(undefined, {
+    weekday: "short",
+    month: "short",
+    day: "numeric",
+    hour: "numeric",
+    minute: "2-digit",
+  })
+
+// Fixed-height chart frame whose width is reported to the series request
+function ChartFrame({
+  frameRef,
+  empty,
+  children,
+}: {
+  frameRef: (element: HTMLDivElement | null) => void
+  empty: boolean
+  children: ReactNode
+}) {
+  return (
+    <div ref={frameRef} style={{ height: CHART_HEIGHT }}>
+      {empty ? (
+        <div className="h-full flex items-center justify-center text-muted-foreground text-sm">
+          Loading…
+        </div>
+      ) : (
+        children
+      )}
+    </div>
+  )
+}
+
+function FuelConsumptionChart({ range }: { range: AnalyticsRangeKey }) {
+  const { ref, data } = useAnalyticsSeries("gallons", range, { mode: "bars" })
+  const resolution = data?.resolution ?? "day"
+  const points = data?.points.map(([time, gallons]) => ({ time, gallons })) ?? []
+
+  return (
+    <Card className="glass border-primary/30 p-6">
+      <h3 className="text-lg font-semibold text-foreground mb-6">
+        Fuel Consumption
+        <span className="text-muted-foreground text-sm font-normal ml-2">
+          gallons {PER_BUCKET[resolution]}
+        </span>
+      </h3>
+      <ChartFrame frameRef={ref} empty={!data}>
+        <ResponsiveContainer width="100%" height="100%">
+          <BarChart data={points}>
+            <CartesianGrid strokeDasharray="3 3" stroke={`${CHART_COLORS.border}33`} />
+            <XAxis
+              dataKey="time"
+              stroke={CHART_COLORS.muted}
+              tick={AXIS_TICK}
+              tickFormatter={(time) => formatTick(time, resolution)}
+            />
+            <YAxis stroke={CHART_COLORS.muted} tick={AXIS_TICK} />
+            <Tooltip
+              {...TOOLTIP_STYLE}
+              labelFormatter={(time) => formatTooltipTime(Number(time))}
+              formatter={(value) => [`${Number(value).toFixed(1)} gal`, "Fuel"]}
+              cursor={{ fill: `${CHART_COLORS.muted}4d` }}
+            />
+            <Bar
+              dataKey="gallons"
+              fill={CHART_COLORS.primary}
+              radius={[4, 4, 0, 0]}
+              name="Gallons"
+              isAnimationActive={false}
+            />
+          </BarChart>
+        </ResponsiveContainer>
+      </ChartFrame>
+    </Card>
+  )
+}
+
+function FuelCostChart({ range }: { range: AnalyticsRangeKey }) {
+  const { ref, data } = useAnalyticsSeries("cost", range)
+  const resolution = data?.resolution ?? "hour"
+  const points = data?.points.map(([time, cost]) => ({ time, cost })) ?? []
+
+  return (
+    <Card className="glass border-secondary/30 p-6">
+      <h3 className="text-lg font-semibold text-foreground mb-6">
+        Fuel Costs
+        <span className="text-muted-foreground text-sm font-normal ml-2">
+          {PER_BUCKET[resolution]}
+        </span>
+      </h3>
+      <ChartFrame frameRef={ref} empty={!data}>
+        <ResponsiveContainer width="100%" height="100%">
+          <AreaChart data={points}>
+            <CartesianGrid strokeDasharray="3 3" stroke={`${CHART_COLORS.border}33`} />
+            <XAxis
+              dataKey="time"
+              type="number"
+              scale="time"
+              domain={["dataMin", "dataMax"]}
+              stroke={CHART_COLORS.muted}
+              tick={AXIS_TICK}
+              tickFormatter={(time) => formatTick(time, range === "24h" ? "hour" : "day")}
+            />
+            <YAxis
+              stroke={CHART_COLORS.muted}
+              tick={AXIS_TICK}
+              tickFormatter={(value) => `$${value}`}
+            />
+            <Tooltip
+              {...TOOLTIP_STYLE}
+              labelFormatter={(time) => formatTooltipTime(Number(time))}
+              formatter={(value) => [`$${Number(value).toFixed(2)}`, "Cost"]}
+            />
+            <Area
+              type="monotone"
+              dataKey="cost"
+              stroke={CHART_COLORS.secondary}
+              fill={`${CHART_COLORS.secondary}33`}
+              strokeWidth={2}
+              name="Cost"
+              isAnimationActive={false}
+            />
+          </AreaChart>
+        </ResponsiveContainer>
+      </ChartFrame>
+    </Card>
+  )
+}
+
+function SummaryCard({
+  label,
+  value,
+  note,
+  icon: Icon,
+  className,
+  valueClassName,
+  iconClassName,
+}: {
+  label: string
+  value: string
+  note: string
+  icon: LucideIcon
+  className: string
+  valueClassName: string
+  iconClassName: string
+}) {
+  return (
+    <Card className={cn("glass p-4", className)}>
+      <div className="flex items-center justify-between mb-2">
+        <p className="text-muted-foreground text-sm">{label}</p>
+        <Icon className={cn("h-5 w-5", iconClassName)} />
+      </div>
+      <p className={cn("text-2xl font-bold font-mono", valueClassName)}>{value}</p>
+      <p className="text-muted-foreground text-xs mt-1">{note}</p>
+    </Card>
+  )
+}
+
+// Fuel, cost and utilization charts. Series are served by the analytics
+// route handlers from precomputed rollups, downsampled to the chart width.
+export function FuelAnalytics() {
+  const [range, setRange] = useState<AnalyticsRangeKey>("7d")
+  const { data: summary } = useUsageSummary(range)
+  const vehicles =
+    summary?.vehicles.map((vehicle) => ({
+      name: vehicle.name,
+      utilization: Math.round(vehicle.utilization),
+    })) ?? []
+  const totals = summary?.totals
+
+  return (
+    <div className="space-y-6">
+      <div className="flex flex-wrap gap-2" role="group" aria-label="Time range">
+        {(Object.keys(ANALYTICS_RANGES) as AnalyticsRangeKey[]).map((key) => (
+          <Button
+            key={key}
+            size="sm"
+            variant={range === key ? "default" : "outline"}
+            aria-pressed={range === key}
+            onClick={() => setRange(key)}
+          >
+            {key}
+          </Button>
+        ))}
+      </div>
+
+      <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
+        <FuelConsumptionChart range={range} />
+        <FuelCostChart range={range} />
+      </div>
+
+      {/* Utilization Chart */}
+      <Card className="glass border-primary/30 p-6">
+        <h3 className="text-lg font-semibold text-foreground mb-6">Fleet Utilization</h3>
+        <ResponsiveContainer width="100%" height={CHART_HEIGHT}>
+          <BarChart data={vehicles} layout="vertical">
+            <CartesianGrid strokeDasharray="3 3" stroke={`${CHART_COLORS.border}33`} />
+            <XAxis
+              type="number"
+              stroke={CHART_COLORS.muted}
+              tick={AXIS_TICK}
+              domain={[0, 100]}
+              tickFormatter={(value) => `${value}%`}
+            />
+            <YAxis
+              type="category"
+              dataKey="name"
+              stroke={CHART_COLORS.muted}
+              tick={AXIS_TICK}
+              width={130}
+            />
+            <Tooltip
+              {...TOOLTIP_STYLE}
+              formatter={(value) => [`${value}%`, "Utilization"]}
+              cursor={{ fill: `${CHART_COLORS.muted}4d` }}
+            />
+            <Bar dataKey="utilization" radius={[0, 4, 4, 0]}>
+              {vehicles.map((entry, index) => (
+                <Cell
+                  key={`cell-${index}`}
+                  fill={
+                    entry.utilization >= 70
+                      ? CHART_COLORS.primary
+                      : entry.utilization >= 40
+                      ? CHART_COLORS.secondary
+                      : CHART_COLORS.danger
+                  }
+                />
+              ))}
+            </Bar>
+          </BarChart>
+        </ResponsiveContainer>
+      </Card>
+
+      {/* Cost Summary */}
+      <div className="grid grid-cols-2 md:grid-cols-4 gap-4">
+        <SummaryCard
+          label="Total Fuel"
+          value={totals ? `${Math.round(totals.gallons).toLocaleString()} gal` : "—"}
+          note={RANGE_LABELS[range]}
+          icon={Fuel}
+          className="border-primary/30"
+          valueClassName="text-primary"
+          iconClassName="text-primary/50"
+        />
+        <SummaryCard
+          label="Total Cost"
+          value={totals ? `$${Math.round(totals.cost).toLocaleString()}` : "—"}
+          note={RANGE_LABELS[range]}
+          icon={DollarSign}
+          className="border-amber-500/30"
+          valueClassName="text-amber-400"
+          iconClassName="text-amber-400/50"
+        />
+        <SummaryCard
+          label="Avg MPG"
+          value={totals ? totals.mpg.toFixed(1) : "—"}
+          note="fleet average"
+          icon={Gauge}
+          className="border-secondary/30"
+          valueClassName="text-secondary"
+          iconClassName="text-secondary/50"
+        />
+        <SummaryCard
+          label="Cost/Mile"
+          value={totals ? `$${totals.costPerMile.toFixed(2)}` : "—"}
+          note="fleet average"
+          icon={Route}
+          className="border-blue-500/30"
+          valueClassName="text-blue-400"
+          iconClassName="text-blue-400/50"
+        />
+      </div>
+    </div>
+  )
+}
@@ -0,0 +1,46 @@
+"use client"
+
+import dynamic from "next/dynamic"
+import { Card } from "@/components/ui/card"
+
+// Tab panels are split into their own chunks. Radix only renders the active
+// tab's content, so a panel's code (the map canvas, recharts for analytics,
+// ...) is fetched the first time its tab is opened.
+
+function PanelLoading() {
+  return (
+    <Card className="glass border-primary/30 p-6 h-[400px] flex items-center justify-center">
+      <p className="text-muted-foreground text-sm">Loading...</p>
+    </Card>
+  )
+}
+
+export const LazyMapPanel = dynamic(
+  () => import("@/components/fleet/map-panel").then((mod) => mod.MapPanel),
+  { loading: PanelLoading }
+)
+
+export const LazyTripsPanel = dynamic(
+  () => import("@/components/fleet/trips-panel").then((mod) => mod.TripsPanel),
+  { loading: PanelLoading }
+)
+
+export const LazyMaintenancePanel = dynamic(
+  () => import("@/components/fleet/maintenance-panel").then((mod) => mod.MaintenancePanel),
+  { loading: PanelLoading }
+)
+
+export const LazyDriversPanel = dynamic(
+  () => import("@/components/fleet/drivers-panel").then((mod) => mod.DriversPanel),
+  { loading: PanelLoading }
+)
+
+export const LazyFuelAnalytics = dynamic(
+  () => import("@/components/fleet/fuel-analytics").then((mod) => mod.FuelAnalytics),
+  { loading: PanelLoading }
+)
+
+export const LazyAlertsPanel = dynamic(
+  () => import("@/components/fleet/alerts-panel").then((mod) => mod.AlertsPanel),
+  { loading: PanelLoading }
+)
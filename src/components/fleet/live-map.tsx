@@ -0,0 +1,551 @@
+"use client"
+
+import { useEffect, useRef } from "react"
+import { Maximize2, Minus, Plus } from "lucide-react"
+import { Button } from "@/components/ui/button"
+import type { EntityTable } from "@/lib/fleet-store"
+import type { Vehicle } from "@/lib/fleet-types"
+import { latToWorldY, lngToWorldX, TILE_SIZE, worldXToLng, worldYToLat } from "@/lib/geo"
+import { SERVICE_AREA_BOUNDS, SERVICE_HUBS } from "@/lib/places"
+import { Quadtree, type QuadtreePoint } from "@/lib/quadtree"
+import { cn } from "@/lib/utils"
+import { useFleetStore } from "@/lib/use-fleet-store"
+
+// Canvas needs actual color values, matching the legend below the map
+const STATUS_COLORS: Record<Vehicle["status"], string> = {
+  active: "#f59e0b",
+  idle: "#3b82f6",
+  maintenance: "#fbbf24",
+  offline: "#f87171",
+}
+
+const MIN_ZOOM = 5
+const MAX_ZOOM = 16
+const CLUSTER_BELOW_ZOOM = 10
+const CLUSTER_CELL_PX = 48
+const LABEL_ZOOM = 11
+const MAX_LABELS = 150
+const MARKER_RADIUS = 6
+const HIT_RADIUS_PX = 12
+const DRAG_THRESHOLD_PX = 4
+
+interface Cluster {
+  x: number
+  y: number
+  worldX: number
+  worldY: number
+  ids: string[]
+}
+
+type HitTarget = { type: "vehicle"; id: string } | { type: "cluster"; cluster: Cluster }
+
+// Owns the view (center + zoom), the spatial index and one rAF loop. The
+// frame is only redrawn when data, view, size or selection changed.
+class FleetMapRenderer {
+  private readonly ctx: CanvasRenderingContext2D
+  private centerX = 0
+  private centerY = 0
+  private zoom = 7
+  private width = 0
+  private height = 0
+  private dpr = 1
+  private dirty = true
+  private indexDirty = true
+  private index = new Quadtree<string>(0, 0, 1, 1)
+  private clusters: Cluster[] = []
+  private clustered = false
+  private frame = 0
+  private selectedId: string | null = null
+
+  constructor(
+    private readonly canvas: HTMLCanvasElement,
+    private readonly vehicles: EntityTable<Vehicle, string>
+  ) {
+    this.ctx = canvas.getContext("2d")!
+  }
+
+  start() {
+    const tick = () => {
+      if (this.dirty) this.draw()
+      this.frame = requestAnimationFrame(tick)
+    }
+    this.frame = requestAnimationFrame(tick)
+  }
+
+  stop() {
+    cancelAnimationFrame(this.frame)
+  }
+
+  invalidateData() {
+    this.indexDirty = true
+    this.dirty = true
+  }
+
+  setSelected(id: string | null) {
+    this.selectedId = id
+    this.dirty = true
+  }
+
+  resize(width: number, height: number, dpr: number) {
+    const firstLayout = this.width === 0
+    this.width = width
+    this.height = height
+    this.dpr = dpr
+    this.canvas.width = Math.round(width * dpr)
+    this.canvas.height = Math.round(height * dpr)
+    if (firstLayout) this.fitServiceArea()
+    this.dirty = true
+  }
+
+  fitServiceArea() {
+    if (this.width === 0) return
+    const minX = lngToWorldX(SERVICE_AREA_BOUNDS.minLng)
+    const maxX = lngToWorldX(SERVICE_AREA_BOUNDS.maxLng)
+    const minY = latToWorldY(SERVICE_AREA_BOUNDS.maxLat)
+    const maxY = latToWorldY(SERVICE_AREA_BOUNDS.minLat)
+    this.centerX = (minX + maxX) / 2
+    this.centerY = (minY + maxY) / 2
+    const scale = Math.min(this.width / (maxX - minX), this.height / (maxY - minY)) * 0.9
+    this.setZoom(Math.log2(scale / TILE_SIZE))
+  }
+
+  zoomAt(screenX: number, screenY: number, delta: number) {
+    const [worldX, worldY] = this.screenToWorld(screenX, screenY)
+    this.setZoom(this.zoom + delta)
+    // Keep the point under the cursor fixed
+    const scale = this.scale()
+    this.centerX = worldX - (screenX - this.width / 2) / scale
+    this.centerY = worldY - (screenY - this.height / 2) / scale
+  }
+
+  zoomBy(delta: number) {
+    this.zoomAt(this.width / 2, this.height / 2, delta)
+  }
+
+  panBy(dx: number, dy: number) {
+    const scale = this.scale()
+    this.centerX -= dx / scale
+    this.centerY -= dy / scale
+    this.dirty = true
+  }
+
+  hitTest(screenX: number, screenY: number): HitTarget | null {
+    if (this.clustered) {
+      for (const cluster of this.clusters) {
+        const radius = cluster.ids.length > 1 ? clusterRadius(cluster.ids.length) : HIT_RADIUS_PX
+        if ((cluster.x - screenX) ** 2 + (cluster.y - screenY) ** 2 <= radius * radius) {
+          return cluster.ids.length > 1
+            ? { type: "cluster", cluster }
+            : { type: "vehicle", id: cluster.ids[0] }
+        }
+      }
+      return null
+    }
+
+    const [worldX, worldY] = this.screenToWorld(screenX, screenY)
+    const nearest = this.index.nearest(worldX, worldY, HIT_RADIUS_PX / this.scale())
+    return nearest ? { type: "vehicle", id: nearest.data } : null
+  }
+
+  zoomToCluster(cluster: Cluster) {
+    this.centerX = cluster.worldX
+    this.centerY = cluster.worldY
+    this.setZoom(Math.min(this.zoom + 2, CLUSTER_BELOW_ZOOM))
+  }
+
+  private scale() {
+    return TILE_SIZE * 2 ** this.zoom
+  }
+
+  private setZoom(zoom: number) {
+    this.zoom = Math.max(MIN_ZOOM, Math.min(MAX_ZOOM, zoom))
+    this.dirty = true
+  }
+
+  private screenToWorld(screenX: number, screenY: number): [number, number] {
+    const scale = this.scale()
+    return [
+      this.centerX + (screenX - this.width / 2) / scale,
+      this.centerY + (screenY - this.height / 2) / scale,
+    ]
+  }
+
+  private rebuildIndex() {
+    const points: QuadtreePoint<string>[] = []
+    let minX = Infinity
+    let minY = Infinity
+    let maxX = -Infinity
+    let maxY = -Infinity
+
+    for (const id of this.vehicles.ids()) {
+      const vehicle = this.vehicles.get(id)
+      if (!vehicle) continue
+      const x = lngToWorldX(vehicle.location.lng)
+      const y = latToWorldY(vehicle.location.lat)
+      points.push({ x, y, data: id })
+      minX = Math.min(minX, x)
+      minY = Math.min(minY, y)
+      maxX = Math.max(maxX, x)
+      maxY = Math.max(maxY, y)
+    }
+
+    // Bound the tree by the data, not the whole world, so it subdivides usefully
+    this.index =
+      points.length > 0
+        ? new Quadtree<string>(minX, minY, Math.max(maxX, minX + 1e-9), Math.max(maxY, minY + 1e-9))
+        : new Quadtree<string>(0, 0, 1, 1)
+    for (const point of points) this.index.insert(point)
+    this.indexDirty = false
+  }
+
+  private draw() {
+    if (this.width === 0 || this.height === 0) return
+    if (this.indexDirty) this.rebuildIndex()
+    this.dirty = false
+
+    const { ctx } = this
+    ctx.setTransform(this.dpr, 0, 0, this.dpr, 0, 0)
+    ctx.clearRect(0, 0, this.width, this.height)
+
+    const scale = this.scale()
+    const toScreenX = (worldX: number) => (worldX - this.centerX) * scale + this.width / 2
+    const toScreenY = (worldY: number) => (worldY - this.centerY) * scale + this.height / 2
+
+    this.drawGraticule(toScreenX, toScreenY)
+    this.drawHubs(toScreenX, toScreenY)
+
+    const margin = (MARKER_RADIUS * 2) / scale
+    const [minX, minY] = this.screenToWorld(0, 0)
+    const [maxX, maxY] = this.screenToWorld(this.width, this.height)
+    const visible = this.index.queryRect(minX - margin, minY - margin, maxX + margin, maxY + margin)
+
+    this.clustered = this.zoom < CLUSTER_BELOW_ZOOM && visible.length > 1
+    if (this.clustered) {
+      this.clusters = clusterPoints(visible, toScreenX, toScreenY)
+      const singles: QuadtreePoint<string>[] = []
+      for (const cluster of this.clusters) {
+        if (cluster.ids.length === 1) {
+          singles.push({ x: cluster.worldX, y: cluster.worldY, data: cluster.ids[0] })
+        } else {
+          this.drawCluster(cluster)
+        }
+      }
+      this.drawMarkers(singles, toScreenX, toScreenY)
+    } else {
+      this.clusters = []
+      this.drawMarkers(visible, toScreenX, toScreenY)
+    }
+  }
+
+  private drawGraticule(toScreenX: (x: number) => number, toScreenY: (y: number) => number) {
+    const { ctx } = this
+    const step = this.zoom < 7 ? 1 : this.zoom < 9 ? 0.5 : this.zoom < 11 ? 0.1 : 0.05
+    const [minX, minY] = this.screenToWorld(0, 0)
+    const [maxX, maxY] = this.screenToWorld(this.width, this.height)
+
+    ctx.beginPath()
+    for (let lng = Math.floor(worldXToLng(minX) / step) * step; lng <= worldXToLng(maxX); lng += step) {
+      const x = Math.round(toScreenX(lngToWorldX(lng))) + 0.5
+      ctx.moveTo(x, 0)
+      ctx.lineTo(x, this.height)
+    }
+    for (let lat = Math.floor(worldYToLat(maxY) / step) * step; lat <= worldYToLat(minY); lat += step) {
+      const y = Math.round(toScreenY(latToWorldY(lat))) + 0.5
+      ctx.moveTo(0, y)
+      ctx.lineTo(this.width, y)
+    }
+    ctx.strokeStyle = "rgba(148, 163, 184, 0.12)"
+    ctx.lineWidth = 1
+    ctx.stroke()
+  }
+
+  private drawHubs(toScreenX: (x: number) => number, toScreenY: (y: number) => number) {
+    const { ctx } = this
+    ctx.font = "11px ui-sans-serif, system-ui, sans-serif"
+    ctx.textAlign = "left"
+    ctx.textBaseline = "middle"
+    for (const hub of SERVICE_HUBS) {
+      const x = toScreenX(lngToWorldX(hub.lng))
+      const y = toScreenY(latToWorldY(hub.lat))
+      ctx.fillStyle = "rgba(148, 163, 184, 0.5)"
+      ctx.fillRect(x - 2, y - 2, 4, 4)
+      ctx.fillStyle = "rgba(148, 163, 184, 0.8)"
+      ctx.fillText(hub.name, x + 6, y - 8)
+    }
+  }
+
+  private drawMarkers(
+    points: QuadtreePoint<string>[],
+    toScreenX: (x: number) => number,
+    toScreenY: (y: number) => number
+  ) {
+    const { ctx } = this
+    const byStatus = new Map<Vehicle["status"], number[]>()
+    let selected: [number, number] | null = null
+
+    for (const point of points) {
+      const vehicle = this.vehicles.get(point.data)
+      if (!vehicle) continue
+      const x = toScreenX(point.x)
+      const y = toScreenY(point.y)
+      let coords = byStatus.get(vehicle.status)
+      if (!coords) {
+        coords = []
+        byStatus.set(vehicle.status, coords)
+      }
+      coords.push(x, y)
+      if (point.data === this.selectedId) selected = [x, y]
+    }
+
+    // One path per status keeps fill calls constant regardless of fleet size
+    for (const [status, coords] of byStatus) {
+      if (status === "active") {
+        ctx.beginPath()
+        for (let i = 0; i < coords.length; i += 2) {
+          ctx.moveTo(coords[i] + MARKER_RADIUS + 4, coords[i + 1])
+          ctx.arc(coords[i], coords[i + 1], MARKER_RADIUS + 4, 0, Math.PI * 2)
+        }
+        ctx.fillStyle = `${STATUS_COLORS.active}33`
+        ctx.fill()
+      }
+
+      ctx.beginPath()
+      for (let i = 0; i < coords.length; i += 2) {
+        ctx.moveTo(coords[i] + MARKER_RADIUS, coords[i + 1])
+        ctx.arc(coords[i], coords[i + 1], MARKER_RADIUS, 0, Math.PI * 2)
+      }
+      ctx.fillStyle = STATUS_COLORS[status]
+      ctx.fill()
+      ctx.strokeStyle = "rgba(15, 23, 42, 0.8)"
+      ctx.lineWidth = 1.5
+      ctx.stroke()
+    }
+
+    if (selected) {
+      ctx.beginPath()
+      ctx.arc(selected[0], selected[1], MARKER_RADIUS + 5, 0, Math.PI * 2)
+      ctx.strokeStyle = "#f9fafb"
+      ctx.lineWidth = 2
+      ctx.stroke()
+    }
+
+    if (this.zoom >= LABEL_ZOOM && points.length <= MAX_LABELS) {
+      ctx.font = "11px ui-sans-serif, system-ui, sans-serif"
+      ctx.textAlign = "center"
+      ctx.textBaseline = "top"
+      ctx.fillStyle = "rgba(249, 250, 251, 0.85)"
+      for (const point of points) {
+        const vehicle = this.vehicles.get(point.data)
+        if (!vehicle) continue
+        ctx.fillText(vehicle.name, toScreenX(point.x), toScreenY(point.y) + MARKER_RADIUS + 4)
+      }
+    }
+  }
+
+  private drawCluster(cluster: Cluster) {
+    const { ctx } = this
+    const radius = clusterRadius(cluster.ids.length)
+    ctx.beginPath()
+    ctx.arc(cluster.x, cluster.y, radius, 0, Math.PI * 2)
+    ctx.fillStyle = `${STATUS_COLORS.active}40`
+    ctx.fill()
+    ctx.strokeStyle = STATUS_COLORS.active
+    ctx.lineWidth = 2
+    ctx.stroke()
+
+    ctx.font = "600 12px ui-monospace, monospace"
+    ctx.textAlign = "center"
+    ctx.textBaseline = "middle"
+    ctx.fillStyle = "#f9fafb"
+    ctx.fillText(String(cluster.ids.length), cluster.x, cluster.y)
+  }
+}
+
+function clusterRadius(count: number) {
+  return 12 + Math.min(14, Math.log10(count) * 7)
+}
+
+// Grid clustering in screen space: points sharing a CLUSTER_CELL_PX cell are
+// merged and drawn at their centroid.
+function clusterPoints(
+  points: QuadtreePoint<string>[],
+  toScreenX: (x: number) => number,
+  toScreenY: (y: number) => number
+): Cluster[] {
+  const cells = new Map<string, Cluster>()
+  for (const point of points) {
+    const x = toScreenX(point.x)
+    const y = toScreenY(point.y)
+    const key = `${Math.floor(x / CLUSTER_CELL_PX)}:${Math.floor(y / CLUSTER_CELL_PX)}`
+    const cell = cells.get(key)
+    if (cell) {
+      // Running sums; averaged below
+      cell.x += x
+      cell.y += y
+      cell.worldX += point.x
+      cell.worldY += point.y
+      cell.ids.push(point.data)
+    } else {
+      cells.set(key, { x, y, worldX: point.x, worldY: point.y, ids: [point.data] })
+    }
+  }
+
+  const clusters = Array.from(cells.values())
+  for (const cluster of clusters) {
+    const count = cluster.ids.length
+    cluster.x /= count
+    cluster.y /= count
+    cluster.worldX /= count
+    cluster.worldY /= count
+  }
+  return clusters
+}
+
+interface LiveMapProps {
+  selectedVehicleId: string | null
+  onSelectVehicle: (id: string) => void
+  className?: string
+}
+
+export function LiveMap({ selectedVehicleId, onSelectVehicle, className }: LiveMapProps) {
+  const store = useFleetStore()
+  const containerRef = useRef<HTMLDivElement>(null)
+  const canvasRef = useRef<HTMLCanvasElement>(null)
+  const rendererRef = useRef<FleetMapRenderer | null>(null)
+  const onSelectRef = useRef(onSelectVehicle)
+
+  useEffect(() => {
+    onSelectRef.current = onSelectVehicle
+  })
+
+  useEffect(() => {
+    rendererRef.current?.setSelected(selectedVehicleId)
+  }, [selectedVehicleId])
+
+  useEffect(() => {
+    const container = containerRef.current
+    const canvas = canvasRef.current
+    if (!container || !canvas) return
+
+    const renderer = new FleetMapRenderer(canvas, store.vehicles)
+    rendererRef.current = renderer
+    renderer.setSelected(selectedVehicleId)
+
+    const unsubscribe = store.vehicles.subscribe(() => renderer.invalidateData())
+
+    const resizeObserver = new ResizeObserver(([entry]) => {
+      renderer.resize(entry.contentRect.width, entry.contentRect.height, window.devicePixelRatio || 1)
+    })
+    resizeObserver.observe(container)
+
+    let drag: { x: number; y: number; moved: boolean } | null = null
+
+    const localPoint = (event: PointerEvent | WheelEvent | MouseEvent) => {
+      const rect = canvas.getBoundingClientRect()
+      return [event.clientX - rect.left, event.clientY - rect.top] as const
+    }
+
+    const handlePointerDown = (event: PointerEvent) => {
+      canvas.setPointerCapture(event.pointerId)
+      drag = { x: event.clientX, y: event.clientY, moved: false }
+    }
+
+    const handlePointerMove = (event: PointerEvent) => {
+      if (drag) {
+        const dx = event.clientX - drag.x
+        const dy = event.clientY - drag.y
+        if (!drag.moved && Math.hypot(dx, dy) < DRAG_THRESHOLD_PX) return
+        drag = { x: event.clientX, y: event.clientY, moved: true }
+        renderer.panBy(dx, dy)
+        canvas.style.cursor = "grabbing"
+        return
+      }
+      const [x, y] = localPoint(event)
+      canvas.style.cursor = renderer.hitTest(x, y) ? "pointer" : "grab"
+    }
+
+    const handlePointerUp = (event: PointerEvent) => {
+      const wasDrag = drag?.moved
+      drag = null
+      canvas.style.cursor = "grab"
+      if (wasDrag) return
+
+      const [x, y] = localPoint(event)
+      const hit = renderer.hitTest(x, y)
+      if (hit?.type === "vehicle") onSelectRef.current(hit.id)
+      if (hit?.type === "cluster") renderer.zoomToCluster(hit.cluster)
+    }
+
+    const handleWheel = (event: WheelEvent) => {
+      event.preventDefault()
+      const [x, y] = localPoint(event)
+      renderer.zoomAt(x, y, -event.deltaY * 0.002)
+    }
+
+    const handleDoubleClick = (event: MouseEvent) => {
+      const [x, y] = localPoint(event)
+      renderer.zoomAt(x, y, 1)
+    }
+
+    canvas.addEventListener("pointerdown", handlePointerDown)
+    canvas.addEventListener("pointermove", handlePointerMove)
+    canvas.addEventListener("pointerup", handlePointerUp)
+    canvas.addEventListener("wheel", handleWheel, { passive: false })
+    canvas.addEventListener("dblclick", handleDoubleClick)
+    renderer.start()
+
+    return () => {
+      renderer.stop()
+      unsubscribe()
+      resizeObserver.disconnect()
+      canvas.removeEventListener("pointerdown", handlePointerDown)
+      canvas.removeEventListener("pointermove", handlePointerMove)
+      canvas.removeEventListener("pointerup", handlePointerUp)
+      canvas.removeEventListener("wheel", handleWheel)
+      canvas.removeEventListener("dblclick", handleDoubleClick)
+      rendererRef.current = null
+    }
+    // The renderer reads the selection through setSelected; it should not be rebuilt on change
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [store])
+
+  return (
+    <div ref={containerRef} className={cn("relative overflow-hidden", className)}>
+      <canvas
+        ref={canvasRef}
+        className="absolute inset-0 size-full cursor-grab touch-none"
+        role="img"
+        aria-label="Live vehicle locations map"
+      />
+      <div className="absolute right-3 top-3 flex flex-col gap-1">
+        <Button
+          variant="outline"
+          size="icon"
+          className="size-8 glass border-primary/30"
+          aria-label="Zoom in"
+          onClick={() => rendererRef.current?.zoomBy(1)}
+        >
+          <Plus className="h-4 w-4" />
+        </Button>
+        <Button
+          variant="outline"
+          size="icon"
+          className="size-8 glass border-primary/30"
+          aria-label="Zoom out"
+          onClick={() => rendererRef.current?.zoomBy(-1)}
+        >
+          <Minus className="h-4 w-4" />
+        </Button>
+        <Button
+          variant="outline"
+          size="icon"
+          className="size-8 glass border-primary/30"
+          aria-label="Fit service area"
+          onClick={() => rendererRef.current?.fitServiceArea()}
+        >
+          <Maximize2 className="h-4 w-4" />
+        </Button>
+      </div>
+    </div>
+  )
+}
@@ -0,0 +1,102 @@
+"use client"
+
+import { AlertTriangle, Calendar, CheckCircle2, type LucideIcon } from "lucide-react"
+import { Badge } from "@/components/ui/badge"
+import { Card } from "@/components/ui/card"
+import { ScrollArea } from "@/components/ui/scroll-area"
+import type { MaintenanceRecord } from "@/lib/fleet-types"
+import { useEntity, useFleetStore, useIds } from "@/lib/use-fleet-store"
+
+const getMaintenanceStatusColor = (status: MaintenanceRecord["status"]) => {
+  switch (status) {
+    case "scheduled":
+      return "text-blue-400 bg-blue-500/20 border-blue-500/30"
+    case "completed":
+      return "text-primary bg-primary/20 border-primary/30"
+    case "overdue":
+      return "text-red-400 bg-red-500/20 border-red-500/30"
+  }
+}
+
+const MAINTENANCE_COLUMNS: {
+  status: MaintenanceRecord["status"]
+  title: string
+  border: string
+  text: string
+  icon: LucideIcon
+  duePrefix: string
+}[] = [
+  { status: "overdue", title: "Overdue", border: "border-red-500/30", text: "text-red-400", icon: AlertTriangle, duePrefix: "Due: " },
+  { status: "scheduled", title: "Scheduled", border: "border-blue-500/30", text: "text-blue-400", icon: Calendar, duePrefix: "Due: " },
+  { status: "completed", title: "Completed", border: "border-primary/30", text: "text-primary", icon: CheckCircle2, duePrefix: "" },
+]
+
+type MaintenanceColumnConfig = (typeof MAINTENANCE_COLUMNS)[number]
+
+function MaintenanceColumn({ column }: { column: MaintenanceColumnConfig }) {
+  const store = useFleetStore()
+  // The count and the list come from the same index bucket
+  const recordIds = useIds(store.maintenance, "status", column.status)
+
+  return (
+    <Card className={`glass ${column.border} p-6`}>
+      <div className="flex items-center justify-between mb-4">
+        <h3 className={`text-lg font-semibold ${column.text}`}>{column.title}</h3>
+        <Badge className={getMaintenanceStatusColor(column.status)}>
+          {recordIds.length}
+        </Badge>
+      </div>
+      <ScrollArea className="h-[300px]">
+        <div className="space-y-3 pr-4">
+          {recordIds.map((id) => (
+            <MaintenanceItem key={id} id={id} column={column} />
+          ))}
+        </div>
+      </ScrollArea>
+    </Card>
+  )
+}
+
+function MaintenanceItem({ id, column }: { id: string; column: MaintenanceColumnConfig }) {
+  const store = useFleetStore()
+  const record = useEntity(store.maintenance, id)
+  if (!record) return null
+
+  const StatusIcon = column.icon
+  return (
+    <div className={`glass-dark ${column.border} rounded-lg p-4`}>
+      <div className="flex items-start justify-between mb-2">
+        <div>
+          <p className="text-foreground font-medium text-sm">
+            {record.vehicleName}
+          </p>
+          <p className="text-muted-foreground text-xs capitalize">
+            {record.type.replace("-", " ")}
+          </p>
+        </div>
+        <StatusIcon className={`h-5 w-5 ${column.text}`} />
+      </div>
+      <p className="text-muted-foreground text-xs mb-2">{record.notes}</p>
+      <div className="flex items-center justify-between">
+        <span className={`${column.text} text-xs`}>
+          {column.duePrefix}{new Date(record.scheduledDate).toLocaleDateString()}
+        </span>
+        {record.cost && (
+          <span className="text-amber-400 font-mono text-xs">
+            ${record.cost}
+          </span>
+        )}
+      </div>
+    </div>
+  )
+}
+
+export function MaintenancePanel() {
+  return (
+    <div className="grid grid-cols-1 md:grid-cols-3 gap-6">
+      {MAINTENANCE_COLUMNS.map((column) => (
+        <MaintenanceColumn key={column.status} column={column} />
+      ))}
+    </div>
+  )
+}
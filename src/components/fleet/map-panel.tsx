@@ -0,0 +1,113 @@
+"use client"
+
+import { useCallback } from "react"
+import { RefreshCw } from "lucide-react"
+import { Button } from "@/components/ui/button"
+import { Card } from "@/components/ui/card"
+import { VirtualList } from "@/components/ui/virtual-list"
+import { useVehicleSelection } from "@/components/fleet/fleet-dashboard"
+import { LiveMap } from "@/components/fleet/live-map"
+import { getVehicleIcon } from "@/components/fleet/status"
+import { useEntity, useFleetStore, useIds } from "@/lib/use-fleet-store"
+
+function ActiveVehicleRow({ id, onSelect }: { id: string; onSelect: (id: string) => void }) {
+  const store = useFleetStore()
+  const vehicle = useEntity(store.vehicles, id)
+  if (!vehicle) return null
+
+  const VehicleIcon = getVehicleIcon(vehicle.type)
+  return (
+    <div
+      className="glass-dark rounded-lg p-4 cursor-pointer hover:bg-primary/5 hover:scale-[1.02] transition"
+      onClick={() => onSelect(vehicle.id)}
+    >
+      <div className="flex items-center gap-3">
+        <div
+          className="w-10 h-10 rounded-full flex items-center justify-center"
+          style={{ backgroundColor: `${vehicle.color}20` }}
+        >
+          <VehicleIcon className="h-5 w-5" style={{ color: vehicle.color }} />
+        </div>
+        <div className="flex-1 min-w-0">
+          <p className="text-foreground font-medium text-sm truncate">
+            {vehicle.name}
+          </p>
+          <p className="text-muted-foreground text-xs truncate">
+            {vehicle.location.address}
+          </p>
+        </div>
+        <div className="text-right">
+          <p className="text-secondary font-mono text-sm">
+            {vehicle.speed.toFixed(0)} mph
+          </p>
+          <p className="text-muted-foreground text-xs">
+            {vehicle.driver?.name || "Unassigned"}
+          </p>
+        </div>
+      </div>
+    </div>
+  )
+}
+
+export function MapPanel() {
+  const store = useFleetStore()
+  const { selectedVehicleId, selectVehicle } = useVehicleSelection()
+  const activeVehicleIds = useIds(store.vehicles, "status", "active")
+  const getVehicleKey = useCallback((index: number) => activeVehicleIds[index], [activeVehicleIds])
+
+  return (
+    <div className="grid grid-cols-1 lg:grid-cols-3 gap-6">
+      <Card className="glass border-primary/30 p-6 lg:col-span-2">
+        <div className="flex items-center justify-between mb-6">
+          <h3 className="text-lg font-semibold text-foreground">Live Vehicle Locations</h3>
+          <Button variant="outline" size="sm" className="border-primary/30">
+            <RefreshCw className="h-4 w-4 mr-2" />
+            Refresh
+          </Button>
+        </div>
+
+        <LiveMap
+          className="h-[400px] lg:h-[500px] glass-dark rounded-lg"
+          selectedVehicleId={selectedVehicleId}
+          onSelectVehicle={selectVehicle}
+        />
+
+        <div className="flex flex-wrap gap-4 mt-4">
+          <div className="flex items-center gap-2">
+            <div className="w-3 h-3 rounded-full bg-primary" />
+            <span className="text-muted-foreground text-sm">Active</span>
+          </div>
+          <div className="flex items-center gap-2">
+            <div className="w-3 h-3 rounded-full bg-blue-500" />
+            <span className="text-muted-foreground text-sm">Idle</span>
+          </div>
+          <div className="flex items-center gap-2">
+            <div className="w-3 h-3 rounded-full bg-amber-400" />
+            <span className="text-muted-foreground text-sm">Maintenance</span>
+          </div>
+          <div className="flex items-center gap-2">
+            <div className="w-3 h-3 rounded-full bg-red-400" />
+            <span className="text-muted-foreground text-sm">Offline</span>
+          </div>
+        </div>
+      </Card>
+
+      {/* Vehicle List */}
+      <Card className="glass border-secondary/30 p-6">
+        <h3 className="text-lg font-semibold text-foreground mb-4">Active Vehicles</h3>
+        <VirtualList
+          className="h-[500px] pr-4"
+          aria-label="Active vehicles"
+          count={activeVehicleIds.length}
+          getItemKey={getVehicleKey}
+          estimateSize={76}
+          gap={12}
+          onActivate={(index) => selectVehicle(activeVehicleIds[index])}
+          renderItem={(index) => (
+            <ActiveVehicleRow id={activeVehicleIds[index]} onSelect={selectVehicle} />
+          )}
+        />
+      </Card>
+    </div>
+  )
+}
@@ -0,0 +1,39 @@
+import { Accessibility, Car, Truck } from "lucide-react"
+import type { Driver, Vehicle } from "@/lib/fleet-types"
+
+// Status helpers shared by the fleet panels
+
+export const getVehicleStatusColor = (status: Vehicle["status"]) => {
+  switch (status) {
+    case "active":
+      return "text-primary bg-primary/20 border-primary/30"
+    case "idle":
+      return "text-secondary bg-secondary/20 border-secondary/30"
+    case "maintenance":
+      return "text-amber-400 bg-amber-500/20 border-amber-500/30"
+    case "offline":
+      return "text-red-400 bg-red-500/20 border-red-500/30"
+  }
+}
+
+export const getDriverStatusColor = (status: Driver["status"]) => {
+  switch (status) {
+    case "available":
+      return "text-primary bg-primary/20 border-primary/30"
+    case "on-trip":
+      return "text-blue-400 bg-blue-500/20 border-blue-500/30"
+    case "off-duty":
+      return "text-slate-400 bg-slate-500/20 border-slate-500/30"
+  }
+}
+
+export const getVehicleIcon = (type: Vehicle["type"]) => {
+  switch (type) {
+    case "van":
+      return Truck
+    case "sedan":
+      return Car
+    case "accessible":
+      return Accessibility
+  }
+}
@@ -0,0 +1,156 @@
+"use client"
+
+import { useCallback, useState } from "react"
+import { Route, Search } from "lucide-react"
+import { Badge } from "@/components/ui/badge"
+import { Card } from "@/components/ui/card"
+import { Input } from "@/components/ui/input"
+import { Progress } from "@/components/ui/progress"
+import { Separator } from "@/components/ui/separator"
+import { VirtualList } from "@/components/ui/virtual-list"
+import type { RideEta } from "@/lib/ride-eta"
+import { useCount, useEntity, useFleetStore, useIds } from "@/lib/use-fleet-store"
+import { useRideEtas } from "@/lib/use-ride-etas"
+import { useSearch, useSharedSearchClient } from "@/lib/use-search"
+
+function TripCard({ id, eta }: { id: string; eta?: RideEta }) {
+  const store = useFleetStore()
+  const trip = useEntity(store.trips, id)
+  if (!trip) return null
+
+  return (
+    <div className="glass-dark rounded-lg p-5">
+      <div className="flex flex-col md:flex-row md:items-center justify-between gap-4 mb-4">
+        <div className="flex items-center gap-4">
+          <div className="w-12 h-12 rounded-full bg-primary/20 flex items-center justify-center">
+            <Route className="h-6 w-6 text-primary" />
+          </div>
+          <div>
+            <p className="text-foreground font-medium">{trip.vehicleName}</p>
+            <p className="text-muted-foreground text-sm">Driver: {trip.driverName}</p>
+          </div>
+        </div>
+        <Badge
+          className={
+            trip.status === "in-progress"
+              ? "bg-blue-500/20 text-blue-400 border-blue-500/30"
+              : trip.status === "completed"
+              ? "bg-primary/20 text-primary border-primary/30"
+              : "bg-red-500/20 text-red-400 border-red-500/30"
+          }
+        >
+          {trip.status === "in-progress" && (
+            <div className="w-2 h-2 bg-blue-400 rounded-full mr-2 animate-pulse" />
+          )}
+          {trip.status.replace("-", " ").toUpperCase()}
+        </Badge>
+      </div>
+
+      <div className="flex items-center gap-4 mb-4">
+        <div className="flex-1">
+          <div className="flex items-center gap-2 mb-2">
+            <div className="w-3 h-3 rounded-full bg-primary" />
+            <p className="text-foreground text-sm">{trip.startLocation}</p>
+          </div>
+          <div className="ml-1.5 w-px h-4 bg-border/30" />
+          <div className="flex items-center gap-2 mt-2">
+            <div className="w-3 h-3 rounded-full bg-secondary" />
+            <p className="text-foreground text-sm">{trip.endLocation}</p>
+          </div>
+        </div>
+      </div>
+
+      {trip.status === "in-progress" && eta && (
+        <div className="mb-4">
+          <div className="flex items-center justify-between mb-2 text-xs">
+            <span className="text-muted-foreground">
+              ETA <span className="text-foreground font-mono">{Math.ceil(eta.etaSeconds / 60)} min</span>
+            </span>
+            <span className="text-muted-foreground font-mono">
+              {eta.remainingMiles.toFixed(1)} mi left
+            </span>
+          </div>
+          <Progress value={eta.progress * 100} className="h-1.5" />
+        </div>
+      )}
+
+      <Separator className="bg-border/20 mb-4" />
+
+      <div className="grid grid-cols-2 md:grid-cols-4 gap-4">
+        <div>
+          <p className="text-muted-foreground text-xs">Start Time</p>
+          <p className="text-foreground font-mono text-sm">
+            {new Date(trip.startTime).toLocaleTimeString()}
+          </p>
+        </div>
+        <div>
+          <p className="text-muted-foreground text-xs">Duration</p>
+          <p className="text-foreground font-mono text-sm">
+            {trip.endTime
+              ? `${Math.round((trip.endTime - trip.startTime) / 60000)} min`
+              : `${Math.round((Date.now() - trip.startTime) / 60000)} min`}
+          </p>
+        </div>
+        <div>
+          <p className="text-muted-foreground text-xs">Distance</p>
+          <p className="text-secondary font-mono text-sm">{trip.distance} mi</p>
+        </div>
+        <div>
+          <p className="text-muted-foreground text-xs">Fuel Used</p>
+          <p className="text-amber-400 font-mono text-sm">{trip.fuelUsed} gal</p>
+        </div>
+      </div>
+    </div>
+  )
+}
+
+export function TripsPanel() {
+  const store = useFleetStore()
+  const [tripQuery, setTripQuery] = useState("")
+  const inProgressTrips = useCount(store.trips, "status", "in-progress")
+  const completedTrips = useCount(store.trips, "status", "completed")
+
+  const tripIds = useIds(store.trips)
+  const etas = useRideEtas(useIds(store.trips, "status", "in-progress"))
+  const searchClient = useSharedSearchClient()
+  const filteredTripIds = useSearch(searchClient, tripQuery, { kinds: ["trip"] }).ids ?? tripIds
+  const getTripKey = useCallback((index: number) => filteredTripIds[index], [filteredTripIds])
+
+  return (
+    <Card className="glass border-primary/30 p-6">
+      <div className="flex items-center justify-between mb-6">
+        <h3 className="text-lg font-semibold text-foreground">Recent Trips</h3>
+        <div className="flex items-center gap-2">
+          <Badge className="bg-blue-500/20 text-blue-400 border-blue-500/30">
+            {inProgressTrips} In Progress
+          </Badge>
+          <Badge className="bg-primary/20 text-primary border-primary/30">
+            {completedTrips} Completed
+          </Badge>
+        </div>
+      </div>
+
+      <div className="relative mb-4">
+        <Search className="absolute left-3 top-1/2 -translate-y-1/2 h-4 w-4 text-muted-foreground" />
+        <Input
+          placeholder="Search trips by vehicle, driver, or location..."
+          value={tripQuery}
+          onChange={(e) => setTripQuery(e.target.value)}
+          className="pl-10 glass border-primary/30"
+        />
+      </div>
+
+      <VirtualList
+        className="h-[640px] pr-4"
+        aria-label="Trips"
+        count={filteredTripIds.length}
+        getItemKey={getTripKey}
+        estimateSize={200}
+        gap={16}
+        renderItem={(index) => (
+          <TripCard id={filteredTripIds[index]} eta={etas[filteredTripIds[index]]} />
+        )}
+      />
+    </Card>
+  )
+}
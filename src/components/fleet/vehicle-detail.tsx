@@ -0,0 +1,125 @@
+"use client"
+
+import { AnimatePresence, motion } from "framer-motion"
+import { MapPin, User, XCircle } from "lucide-react"
+import { Badge } from "@/components/ui/badge"
+import { Button } from "@/components/ui/button"
+import { Progress } from "@/components/ui/progress"
+import { getDriverStatusColor, getVehicleStatusColor } from "@/components/fleet/status"
+import { useEntity, useFleetStore } from "@/lib/use-fleet-store"
+
+function VehicleDetail({ id, onClose }: { id: string; onClose: () => void }) {
+  const store = useFleetStore()
+  const selectedVehicle = useEntity(store.vehicles, id)
+  if (!selectedVehicle) return null
+
+  return (
+    <motion.div
+      initial={{ opacity: 0 }}
+      animate={{ opacity: 1 }}
+      exit={{ opacity: 0 }}
+      className="fixed inset-0 bg-background/80 backdrop-blur-sm z-50 flex items-center justify-center p-4"
+      onClick={onClose}
+    >
+      <motion.div
+        initial={{ scale: 0.95, opacity: 0 }}
+        animate={{ scale: 1, opacity: 1 }}
+        exit={{ scale: 0.95, opacity: 0 }}
+        className="glass border-primary/30 rounded-lg p-6 w-full max-w-2xl max-h-[90vh] overflow-y-auto"
+        onClick={(e) => e.stopPropagation()}
+      >
+        <div className="flex items-start justify-between mb-6">
+          <div>
+            <h2 className="text-2xl font-bold text-foreground">{selectedVehicle.name}</h2>
+            <p className="text-muted-foreground">{selectedVehicle.licensePlate}</p>
+          </div>
+          <Button
+            variant="ghost"
+            size="sm"
+            onClick={onClose}
+          >
+            <XCircle className="h-5 w-5" />
+          </Button>
+        </div>
+
+        <div className="grid grid-cols-2 gap-4 mb-6">
+          <div className="glass-dark rounded-lg p-4">
+            <p className="text-muted-foreground text-xs mb-1">Status</p>
+            <Badge className={getVehicleStatusColor(selectedVehicle.status)}>
+              {selectedVehicle.status.toUpperCase()}
+            </Badge>
+          </div>
+          <div className="glass-dark rounded-lg p-4">
+            <p className="text-muted-foreground text-xs mb-1">Type</p>
+            <p className="text-foreground capitalize">{selectedVehicle.type}</p>
+          </div>
+        </div>
+
+        {selectedVehicle.driver && (
+          <div className="glass-dark rounded-lg p-4 mb-6">
+            <p className="text-muted-foreground text-xs mb-2">Assigned Driver</p>
+            <div className="flex items-center gap-3">
+              <div className="w-10 h-10 rounded-full bg-primary/20 flex items-center justify-center">
+                <User className="h-5 w-5 text-primary" />
+              </div>
+              <div>
+                <p className="text-foreground font-medium">{selectedVehicle.driver.name}</p>
+                <p className="text-muted-foreground text-sm">{selectedVehicle.driver.phone}</p>
+              </div>
+              <Badge className={getDriverStatusColor(selectedVehicle.driver.status)}>
+                {selectedVehicle.driver.status.replace("-", " ").toUpperCase()}
+              </Badge>
+            </div>
+          </div>
+        )}
+
+        <div className="grid grid-cols-2 gap-4 mb-6">
+          <div className="glass-dark rounded-lg p-4">
+            <p className="text-muted-foreground text-xs mb-1">Location</p>
+            <div className="flex items-center gap-2">
+              <MapPin className="h-4 w-4 text-primary" />
+              <p className="text-foreground text-sm">{selectedVehicle.location.address}</p>
+            </div>
+          </div>
+          <div className="glass-dark rounded-lg p-4">
+            <p className="text-muted-foreground text-xs mb-1">Speed</p>
+            <p className="text-secondary font-mono text-xl">
+              {selectedVehicle.speed.toFixed(0)} mph
+            </p>
+          </div>
+        </div>
+
+        <div className="grid grid-cols-2 gap-4 mb-6">
+          <div className="glass-dark rounded-lg p-4">
+            <p className="text-muted-foreground text-xs mb-2">Fuel Level</p>
+            <div className="flex items-center gap-2">
+              <Progress value={selectedVehicle.fuelLevel} className="h-2 flex-1" />
+              <span className="text-foreground font-mono">
+                {selectedVehicle.fuelLevel.toFixed(0)}%
+              </span>
+            </div>
+          </div>
+          <div className="glass-dark rounded-lg p-4">
+            <p className="text-muted-foreground text-xs mb-1">Odometer</p>
+            <p className="text-foreground font-mono text-xl">
+              {selectedVehicle.odometer.toLocaleString()} mi
+            </p>
+          </div>
+        </div>
+
+        <div className="glass-dark rounded-lg p-4">
+          <p className="text-muted-foreground text-xs mb-1">Last Update</p>
+          <p className="text-foreground">{new Date(selectedVehicle.lastUpdate).toLocaleString()}</p>
+        </div>
+      </motion.div>
+    </motion.div>
+  )
+}
+
+export function VehicleDetailModal({ id, onClose }: { id: string | null; onClose: () => void }) {
+  return (
+    <AnimatePresence>
+      {id && <VehicleDetail key={id} id={id} onClose={onClose} />}
+    </AnimatePresence>
+  )
+}
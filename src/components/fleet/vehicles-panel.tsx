@@ -0,0 +1,145 @@
+"use client"
+
+import { useCallback, useState } from "react"
+import { Filter, MapPin, Search, User } from "lucide-react"
+import { Badge } from "@/components/ui/badge"
+import { Button } from "@/components/ui/button"
+import { Card } from "@/components/ui/card"
+import { Input } from "@/components/ui/input"
+import { Progress } from "@/components/ui/progress"
+import { Separator } from "@/components/ui/separator"
+import { VirtualList } from "@/components/ui/virtual-list"
+import { useVehicleSelection } from "@/components/fleet/fleet-dashboard"
+import { getVehicleIcon, getVehicleStatusColor } from "@/components/fleet/status"
+import { useEntity, useFleetStore, useIds } from "@/lib/use-fleet-store"
+import { useSearch, useSharedSearchClient } from "@/lib/use-search"
+
+// Each row subscribes to its own entity, so a telemetry update for one
+// vehicle re-renders that vehicle's row and nothing else.
+
+function VehicleCard({ id, onSelect }: { id: string; onSelect: (id: string) => void }) {
+  const store = useFleetStore()
+  const vehicle = useEntity(store.vehicles, id)
+  if (!vehicle) return null
+
+  const VehicleIcon = getVehicleIcon(vehicle.type)
+  return (
+    <Card
+      className="glass p-5 border-l-4 cursor-pointer hover:bg-primary/5 transition-colors"
+      style={{ borderLeftColor: vehicle.color }}
+      onClick={() => onSelect(vehicle.id)}
+    >
+      <div className="flex items-start justify-between mb-4">
+        <div>
+          <h3 className="text-lg font-bold text-foreground mb-1">{vehicle.name}</h3>
+          <p className="text-muted-foreground text-xs">{vehicle.licensePlate}</p>
+        </div>
+        <VehicleIcon className="h-6 w-6" style={{ color: vehicle.color }} />
+      </div>
+
+      <Badge className={`${getVehicleStatusColor(vehicle.status)} mb-4`}>
+        {vehicle.status.toUpperCase()}
+      </Badge>
+
+      <div className="space-y-3">
+        <div className="flex items-center gap-2 text-muted-foreground text-sm">
+          <MapPin className="h-4 w-4" />
+          <span className="truncate">{vehicle.location.address}</span>
+        </div>
+
+        {vehicle.driver && (
+          <div className="flex items-center gap-2 text-muted-foreground text-sm">
+            <User className="h-4 w-4" />
+            <span>{vehicle.driver.name}</span>
+          </div>
+        )}
+
+        <Separator className="bg-border/20" />
+
+        <div className="grid grid-cols-2 gap-3">
+          <div>
+            <p className="text-muted-foreground text-xs">Fuel</p>
+            <div className="flex items-center gap-2">
+              <Progress value={vehicle.fuelLevel} className="h-1.5 flex-1" />
+              <span className="text-foreground font-mono text-xs">
+                {vehicle.fuelLevel.toFixed(0)}%
+              </span>
+            </div>
+          </div>
+          <div>
+            <p className="text-muted-foreground text-xs">Speed</p>
+            <p className="text-secondary font-mono text-sm">
+              {vehicle.speed.toFixed(0)} mph
+            </p>
+          </div>
+        </div>
+
+        <div className="grid grid-cols-2 gap-3">
+          <div>
+            <p className="text-muted-foreground text-xs">Odometer</p>
+            <p className="text-foreground font-mono text-sm">
+              {vehicle.odometer.toLocaleString()} mi
+            </p>
+          </div>
+          <div>
+            <p className="text-muted-foreground text-xs">Last Update</p>
+            <p className="text-muted-foreground font-mono text-xs">
+              {new Date(vehicle.lastUpdate).toLocaleTimeString()}
+            </p>
+          </div>
+        </div>
+      </div>
+    </Card>
+  )
+}
+
+export function VehiclesPanel() {
+  const store = useFleetStore()
+  const { selectVehicle } = useVehicleSelection()
+  const [searchQuery, setSearchQuery] = useState("")
+
+  const vehicleIds = useIds(store.vehicles)
+  const searchClient = useSharedSearchClient()
+  const filteredVehicleIds =
+    useSearch(searchClient, searchQuery, { kinds: ["vehicle"] }).ids ?? vehicleIds
+  const getVehicleKey = useCallback(
+    (index: number) => filteredVehicleIds[index],
+    [filteredVehicleIds]
+  )
+
+  return (
+    <>
+      {/* Search */}
+      <div className="flex flex-col sm:flex-row gap-4">
+        <div className="relative flex-1">
+          <Search className="absolute left-3 top-1/2 -translate-y-1/2 h-4 w-4 text-muted-foreground" />
+          <Input
+            placeholder="Search vehicles by name, plate, location, or driver..."
+            value={searchQuery}
+            onChange={(e) => setSearchQuery(e.target.value)}
+            className="pl-10 glass border-primary/30"
+          />
+        </div>
+        <Button variant="outline" className="border-primary/30">
+          <Filter className="h-4 w-4 mr-2" />
+          Filter
+        </Button>
+      </div>
+
+      {/* Vehicle Grid */}
+      <VirtualList
+        className="h-[720px] pr-4"
+        aria-label="Vehicles"
+        count={filteredVehicleIds.length}
+        getItemKey={getVehicleKey}
+        estimateSize={260}
+        minItemWidth={280}
+        gap={16}
+        onActivate={(index) => selectVehicle(filteredVehicleIds[index])}
+        renderItem={(index) => (
+          <VehicleCard id={filteredVehicleIds[index]} onSelect={selectVehicle} />
+        )}
+      />
+    </>
+  )
+}
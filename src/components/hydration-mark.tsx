@@ -0,0 +1,12 @@
+"use client"
+
+import { useEffect } from "react"
+
+// Root layout effects run once the page has hydrated; scripts/perf-budget.mjs
+// reads this mark to time hydration per route
+export function HydrationMark() {
+  useEffect(() => {
+    performance.mark("app-hydrated")
+  }, [])
+  return null
+}
@@ -0,0 +1,124 @@
+"use client"
+
+import { useCallback, useEffect, useMemo, useState } from "react"
+import { Search } from "lucide-react"
+import { Badge } from "@/components/ui/badge"
+import { Input } from "@/components/ui/input"
+import { TableCell, TableHead } from "@/components/ui/table"
+import { VirtualTable } from "@/components/ui/virtual-table"
+import { createMockTickets, seedTickets, type SupportTicket } from "@/lib/support-data"
+import { ticketSearchFields, useSearch, useSearchClient } from "@/lib/use-search"
+
+function getPriorityBadge(priority: string) {
+  switch (priority) {
+    case "high":
+      return <Badge className="bg-destructive text-destructive-foreground">High</Badge>
+    case "medium":
+      return <Badge className="bg-warning text-warning-foreground">Medium</Badge>
+    case "low":
+      return <Badge className="bg-info text-info-foreground">Low</Badge>
+    default:
+      return <Badge variant="secondary">{priority}</Badge>
+  }
+}
+
+function getStatusBadge(status: string) {
+  switch (status) {
+    case "open":
+      return <Badge variant="outline" className="border-destructive text-destructive">Open</Badge>
+    case "in_progress":
+      return <Badge variant="outline" className="border-warning text-warning">In Progress</Badge>
+    case "pending":
+      return <Badge variant="outline" className="border-muted-foreground text-muted-foreground">Pending</Badge>
+    case "resolved":
+      return <Badge variant="outline" className="border-success text-success">Resolved</Badge>
+    default:
+      return <Badge variant="outline">{status}</Badge>
+  }
+}
+
+// Each ticket renders once as a table row. On small screens the customer,
+// subject and date collapse into the first cell and the badges stack, instead
+// of rendering a second card list.
+function TicketCells({ ticket }: { ticket: SupportTicket }) {
+  return (
+    <>
+      <TableCell className="font-mono text-sm align-top sm:align-middle">
+        {ticket.id}
+        <div className="mt-1 space-y-1 whitespace-normal font-sans sm:hidden">
+          <p className="font-medium">{ticket.customer}</p>
+          <p>{ticket.subject}</p>
+          <p className="text-xs text-muted-foreground">{ticket.created}</p>
+        </div>
+      </TableCell>
+      <TableCell className="hidden font-medium sm:table-cell">{ticket.customer}</TableCell>
+      <TableCell className="hidden max-w-[300px] truncate sm:table-cell">{ticket.subject}</TableCell>
+      <TableCell className="align-top sm:align-middle">
+        <div className="flex flex-col items-end gap-1 sm:block">
+          {getPriorityBadge(ticket.priority)}
+          <span className="sm:hidden">{getStatusBadge(ticket.status)}</span>
+        </div>
+      </TableCell>
+      <TableCell className="hidden sm:table-cell">{getStatusBadge(ticket.status)}</TableCell>
+      <TableCell className="hidden text-right text-muted-foreground sm:table-cell">{ticket.created}</TableCell>
+    </>
+  )
+}
+
+export function TicketTable({ count }: { count?: number }) {
+  // Generated on the client so large test sets are not serialized into the page
+  const tickets = useMemo(() => createMockTickets(count ?? seedTickets.length), [count])
+  const ticketsById = useMemo(
+    () => new Map(tickets.map((ticket) => [ticket.id, ticket])),
+    [tickets]
+  )
+
+  const [query, setQuery] = useState("")
+  const searchClient = useSearchClient()
+  useEffect(() => {
+    searchClient.upsert(
+      tickets.map((ticket) => ({ kind: "ticket", id: ticket.id, fields: ticketSearchFields(ticket) }))
+    )
+  }, [searchClient, tickets])
+  const matchIds = useSearch(searchClient, query, { kinds: ["ticket"] }).ids
+  const rows = useMemo(
+    () => (matchIds ? matchIds.flatMap((id) => ticketsById.get(id) ?? []) : tickets),
+    [matchIds, tickets, ticketsById]
+  )
+  // Stable between renders so the virtualizer keeps its cached row offsets
+  const getRowKey = useCallback((index: number) => rows[index].id, [rows])
+
+  return (
+    <div className="space-y-4">
+      <div className="relative px-4 sm:px-0">
+        <Search className="absolute left-7 top-1/2 h-4 w-4 -translate-y-1/2 text-muted-foreground sm:left-3" />
+        <Input
+          placeholder="Search tickets by ID, customer, or subject..."
+          value={query}
+          onChange={(e) => setQuery(e.target.value)}
+          className="pl-10"
+        />
+      </div>
+      <VirtualTable
+        // Only cap the height once there is more than a screenful to scroll
+        className={tickets.length > 8 ? "h-[480px]" : undefined}
+        aria-label="Support tickets"
+        count={rows.length}
+        getRowKey={getRowKey}
+        estimateRowHeight={53}
+        header={
+          <>
+            <TableHead className="w-[100px]">Ticket ID</TableHead>
+            <TableHead className="hidden sm:table-cell">Customer</TableHead>
+            <TableHead className="hidden sm:table-cell">Subject</TableHead>
+            <TableHead className="text-right sm:text-left">Priority</TableHead>
+            <TableHead className="hidden sm:table-cell">Status</TableHead>
+            <TableHead className="hidden text-right sm:table-cell">Created</TableHead>
+          </>
+        }
+        renderRow={(index) => <TicketCells ticket={rows[index]} />}
+        empty={<p className="py-6 text-center text-sm text-muted-foreground">No tickets match your search</p>}
+      />
+    </div>
+  )
+}
@@ -0,0 +1,39 @@
+"use client"
+
+import { Clock } from "lucide-react"
+import { Progress } from "@/components/ui/progress"
+import type { RideEta } from "@/lib/ride-eta"
+import { useRideEtas } from "@/lib/use-ride-etas"
+
+// ETA and progress of a ride, starting from the server-rendered ETA and
+// kept live by polling
+export function RideEtaPanel({ rideId, initial }: { rideId: string; initial: RideEta | null }) {
+  const etas = useRideEtas([rideId], initial ? { [rideId]: initial } : {})
+  const eta = etas[rideId]
+
+  return (
+    <div className="rounded-lg bg-muted/50 p-4">
+      <div className="flex items-center justify-between mb-3">
+        <div className="flex items-center gap-2">
+          <Clock className="size-4 text-muted-foreground" />
+          <span className="text-sm text-muted-foreground">Estimated Arrival</span>
+        </div>
+        <div className="text-right">
+          <span className="text-2xl font-bold text-primary">
+            {eta ? Math.ceil(eta.etaSeconds / 60) : "--"}
+          </span>
+          <span className="ml-1 text-sm text-muted-foreground">min</span>
+        </div>
+      </div>
+      <Progress value={(eta?.progress ?? 0) * 100} className="h-2" />
+      <p className="mt-2 text-sm text-muted-foreground text-center" suppressHydrationWarning>
+        {eta
+          ? `Arriving at ${new Date(eta.arrivalAt).toLocaleTimeString([], {
+              hour: "numeric",
+              minute: "2-digit",
+            })} · ${eta.remainingMiles.toFixed(1)} mi to go`
+          : "Calculating route..."}
+      </p>
+    </div>
+  )
+}
@@ -0,0 +1,150 @@
+"use client"
+
+import * as React from "react"
+
+import { ScrollArea } from "@/components/ui/scroll-area"
+import { getNavigationIndex, useVirtualizer } from "@/lib/use-virtualizer"
+
+interface VirtualListProps {
+  count: number
+  renderItem: (index: number) => React.ReactNode
+  estimateSize: number | ((index: number) => number)
+  getItemKey?: (index: number) => string | number
+  // Lay items out in as many columns of at least this width as fit
+  minItemWidth?: number
+  gap?: number
+  overscan?: number
+  onActivate?: (index: number) => void
+  empty?: React.ReactNode
+  className?: string
+  "aria-label"?: string
+}
+
+// Scrollable list that only mounts the rows in view. Rows may have any height;
+// they are measured after mounting. Arrow keys, Page Up/Down and Home/End move
+// the active item and Enter activates it.
+function VirtualList({
+  count,
+  renderItem,
+  estimateSize,
+  getItemKey,
+  minItemWidth,
+  gap = 0,
+  overscan,
+  onActivate,
+  empty,
+  className,
+  "aria-label": ariaLabel,
+}: VirtualListProps) {
+  const id = React.useId()
+  const [activeIndex, setActiveIndex] = React.useState(-1)
+  const [width, setWidth] = React.useState(0)
+  const widthObserverRef = React.useCallback((element: HTMLDivElement | null) => {
+    if (!element) return
+    const observer = new ResizeObserver(([entry]) => setWidth(entry.contentRect.width))
+    observer.observe(element)
+    return () => observer.disconnect()
+  }, [])
+
+  const lanes = minItemWidth
+    ? Math.max(1, Math.floor((width + gap) / (minItemWidth + gap)))
+    : 1
+  const rowCount = Math.ceil(count / lanes)
+
+  const estimateRowSize = React.useCallback(
+    (row: number) =>
+      (typeof estimateSize === "number" ? estimateSize : estimateSize(row * lanes)) + gap,
+    [estimateSize, lanes, gap]
+  )
+  // Single-column rows keep their measured size when the list is filtered
+  const getRowKey = React.useCallback(
+    (row: number) => (lanes === 1 && getItemKey ? getItemKey(row) : `row-${row}`),
+    [lanes, getItemKey]
+  )
+
+  const virtualizer = useVirtualizer({
+    count: rowCount,
+    estimateSize: estimateRowSize,
+    getItemKey: getRowKey,
+    overscan,
+  })
+
+  const clampedActive = activeIndex < count ? activeIndex : -1
+  const visibleRows = virtualizer.items.length - 2 * (overscan ?? 6)
+
+  const handleKeyDown = (event: React.KeyboardEvent<HTMLDivElement>) => {
+    if (event.target !== event.currentTarget) return
+    if ((event.key === "Enter" || event.key === " ") && clampedActive >= 0) {
+      event.preventDefault()
+      onActivate?.(clampedActive)
+      return
+    }
+    const next = getNavigationIndex(event.key, clampedActive, count, {
+      lanes,
+      pageSize: Math.max(1, visibleRows),
+    })
+    if (next === null) return
+    event.preventDefault()
+    setActiveIndex(next)
+    virtualizer.scrollToIndex(Math.floor(next / lanes))
+  }
+
+  return (
+    <ScrollArea
+      data-slot="virtual-list"
+      className={className}
+      viewportRef={virtualizer.scrollRef}
+    >
+      <div ref={widthObserverRef} className="w-full">
+        {count === 0 && empty}
+        <div
+          ref={virtualizer.listRef}
+          role="listbox"
+          tabIndex={count > 0 ? 0 : -1}
+          aria-label={ariaLabel}
+          aria-activedescendant={clampedActive >= 0 ? `${id}-${clampedActive}` : undefined}
+          onKeyDown={handleKeyDown}
+          className="focus-visible:ring-ring/50 rounded-md outline-none focus-visible:ring-[3px]"
+          style={{ paddingTop: virtualizer.paddingStart, paddingBottom: virtualizer.paddingEnd }}
+        >
+          {virtualizer.items.map((row) => {
+            const first = row.index * lanes
+            const last = Math.min(count, first + lanes)
+            return (
+              <div
+                key={row.key}
+                ref={virtualizer.measureElement}
+                data-index={row.index}
+                className={lanes > 1 ? "grid" : undefined}
+                style={{
+                  gridTemplateColumns: lanes > 1 ? `repeat(${lanes}, minmax(0, 1fr))` : undefined,
+                  columnGap: gap,
+                  paddingBottom: gap,
+                }}
+              >
+                {Array.from({ length: last - first }, (_, offset) => {
+                  const index = first + offset
+                  return (
+                    <div
+                      key={getItemKey ? getItemKey(index) : index}
+                      id={`${id}-${index}`}
+                      role="option"
+                      aria-selected={index === clampedActive}
+                      data-active={index === clampedActive || undefined}
+                      className="data-[active]:ring-primary/60 rounded-lg data-[active]:ring-2"
+                      onClick={() => setActiveIndex(index)}
+                    >
+                      {renderItem(index)}
+                    </div>
+                  )
+                })}
+              </div>
+            )
+          })}
+        </div>
+      </div>
+    </ScrollArea>
+  )
+}
+
+export { VirtualList }
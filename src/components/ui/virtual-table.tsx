@@ -0,0 +1,131 @@
+"use client"
+
+import * as React from "react"
+
+import { ScrollArea } from "@/components/ui/scroll-area"
+import { TableBody, TableHeader, TableRow } from "@/components/ui/table"
+import { cn } from "@/lib/utils"
+import { getNavigationIndex, useVirtualizer } from "@/lib/use-virtualizer"
+
+// Matches the h-10 of TableHead
+const HEADER_HEIGHT = 40
+
+interface VirtualTableProps {
+  count: number
+  // Header cells (TableHead), rendered in a sticky row
+  header: React.ReactNode
+  // Body cells (TableCell) for one row
+  renderRow: (index: number) => React.ReactNode
+  estimateRowHeight: number | ((index: number) => number)
+  getRowKey?: (index: number) => string | number
+  overscan?: number
+  onActivate?: (index: number) => void
+  empty?: React.ReactNode
+  className?: string
+  headerClassName?: string
+  "aria-label"?: string
+}
+
+// Table that only mounts the rows in view, keeping the header pinned. Row
+// heights are measured after mounting, so cells may wrap.
+function VirtualTable({
+  count,
+  header,
+  renderRow,
+  estimateRowHeight,
+  getRowKey,
+  overscan,
+  onActivate,
+  empty,
+  className,
+  headerClassName,
+  "aria-label": ariaLabel,
+}: VirtualTableProps) {
+  const id = React.useId()
+  const [activeIndex, setActiveIndex] = React.useState(-1)
+
+  const estimateSize = React.useCallback(
+    (index: number) =>
+      typeof estimateRowHeight === "number" ? estimateRowHeight : estimateRowHeight(index),
+    [estimateRowHeight]
+  )
+
+  const virtualizer = useVirtualizer({
+    count,
+    estimateSize,
+    getItemKey: getRowKey,
+    overscan,
+    scrollPaddingStart: HEADER_HEIGHT,
+  })
+
+  const clampedActive = activeIndex < count ? activeIndex : -1
+  const visibleRows = virtualizer.items.length - 2 * (overscan ?? 6)
+
+  const handleKeyDown = (event: React.KeyboardEvent<HTMLTableElement>) => {
+    if (event.target !== event.currentTarget) return
+    if ((event.key === "Enter" || event.key === " ") && clampedActive >= 0) {
+      event.preventDefault()
+      onActivate?.(clampedActive)
+      return
+    }
+    const next = getNavigationIndex(event.key, clampedActive, count, {
+      pageSize: Math.max(1, visibleRows),
+    })
+    if (next === null) return
+    event.preventDefault()
+    setActiveIndex(next)
+    virtualizer.scrollToIndex(next)
+  }
+
+  return (
+    <ScrollArea
+      data-slot="virtual-table"
+      className={className}
+      viewportRef={virtualizer.scrollRef}
+    >
+      {/* A bare table rather than <Table>: its overflow wrapper would become
+          the sticky header's scroll container instead of the viewport */}
+      <table
+        data-slot="table"
+        role="grid"
+        tabIndex={count > 0 ? 0 : -1}
+        aria-label={ariaLabel}
+        aria-rowcount={count + 1}
+        aria-activedescendant={clampedActive >= 0 ? `${id}-${clampedActive}` : undefined}
+        onKeyDown={handleKeyDown}
+        className="focus-visible:ring-ring/50 w-full caption-bottom text-sm outline-none focus-visible:ring-[3px]"
+      >
+        <TableHeader className={cn("bg-card sticky top-0 z-10", headerClassName)}>
+          <TableRow aria-rowindex={1} className="hover:bg-transparent">
+            {header}
+          </TableRow>
+        </TableHeader>
+        <TableBody ref={virtualizer.listRef}>
+          {virtualizer.paddingStart > 0 && (
+            <tr aria-hidden style={{ height: virtualizer.paddingStart }} />
+          )}
+          {virtualizer.items.map((row) => (
+            <TableRow
+              key={row.key}
+              ref={virtualizer.measureElement}
+              id={`${id}-${row.index}`}
+              data-index={row.index}
+              data-state={row.index === clampedActive ? "selected" : undefined}
+              aria-rowindex={row.index + 2}
+              aria-selected={row.index === clampedActive}
+              onClick={() => setActiveIndex(row.index)}
+            >
+              {renderRow(row.index)}
+            </TableRow>
+          ))}
+          {virtualizer.paddingEnd > 0 && (
+            <tr aria-hidden style={{ height: virtualizer.paddingEnd }} />
+          )}
+        </TableBody>
+      </table>
+      {count === 0 && empty}
+    </ScrollArea>
+  )
+}
+
+export { VirtualTable }
@@ -0,0 +1,21 @@
+import type { FleetStore } from "@/lib/fleet-store"
+
+// Acknowledges alerts in the local store right away, then on the server,
+// which pushes the change to every other dashboard. If the server cannot be
+// reached, or refuses it because FLEET_INGEST_TOKEN is set, the local
+// acknowledgment stands.
+export function acknowledgeAlerts(store: FleetStore, ids: string[] | "all") {
+  if (ids === "all") {
+    store.acknowledgeAllAlerts()
+  } else {
+    store.batch(() => {
+      for (const id of ids) store.acknowledgeAlert(id)
+    })
+  }
+
+  fetch("/api/fleet/alerts/acknowledge", {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify(ids === "all" ? { all: true } : { ids }),
+  }).catch(() => {})
+}
@@ -0,0 +1,77 @@
+import { AlertEngine } from "@/lib/alert-rules"
+import { createSeedAlerts } from "@/lib/fleet-data"
+import type { Alert, TelemetryUpdate } from "@/lib/fleet-types"
+import { getVehicle } from "@/lib/telemetry-hub"
+
+type AlertListener = (alerts: Alert[]) => void
+
+// Changes are broadcast at most this often, each alert once per flush
+const FLUSH_MS = 250
+
+interface AlertHub {
+  engine: AlertEngine
+  listeners: Set<AlertListener>
+  pending: Map<string, Alert>
+  timer: ReturnType<typeof setTimeout> | null
+}
+
+// Route handlers are bundled separately, so the hub is kept on globalThis
+// like the telemetry hub
+const globalForAlerts = globalThis as typeof globalThis & {
+  __fleetAlertHub?: AlertHub
+}
+
+function getHub(): AlertHub {
+  if (!globalForAlerts.__fleetAlertHub) {
+    globalForAlerts.__fleetAlertHub = {
+      engine: new AlertEngine(undefined, createSeedAlerts()),
+      listeners: new Set(),
+      pending: new Map(),
+      timer: null,
+    }
+  }
+  return globalForAlerts.__fleetAlertHub
+}
+
+function flush() {
+  const hub = getHub()
+  hub.timer = null
+  if (hub.pending.size === 0) return
+  const alerts = Array.from(hub.pending.values())
+  hub.pending.clear()
+  for (const listener of hub.listeners) {
+    listener(alerts)
+  }
+}
+
+function queue(alerts: Alert[]) {
+  if (alerts.length === 0) return
+  const hub = getHub()
+  for (const alert of alerts) hub.pending.set(alert.id, alert)
+  hub.timer ??= setTimeout(flush, FLUSH_MS)
+}
+
+export function evaluateAlerts(updates: TelemetryUpdate[]) {
+  if (updates.length === 0) return
+  queue(getHub().engine.evaluate(updates, (id) => getVehicle(id)?.name ?? id))
+}
+
+// Acknowledges the given alerts, or every open alert; returns how many changed
+export function acknowledgeAlerts(ids: string[] | "all") {
+  const { engine } = getHub()
+  const changed = ids === "all" ? engine.acknowledgeAll() : engine.acknowledge(ids)
+  queue(changed)
+  return changed.length
+}
+
+export function getAlertHistory() {
+  return getHub().engine.getHistory()
+}
+
+export function subscribeAlerts(listener: AlertListener) {
+  const hub = getHub()
+  hub.listeners.add(listener)
+  return () => {
+    hub.listeners.delete(listener)
+  }
+}
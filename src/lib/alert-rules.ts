@@ -0,0 +1,263 @@
+import { ALERT_HISTORY_SIZE } from "@/lib/fleet-store"
+import type { Alert, RoadClass, TelemetryUpdate } from "@/lib/fleet-types"
+import { createZoneIndex, FLEET_ZONES, isRoadClass, roadClassIn, type Zone } from "@/lib/geofences"
+import type { PolygonIndex } from "@/lib/polygon-index"
+import { RingBuffer } from "@/lib/ring-buffer"
+
+export interface AlertRuleConfig {
+  speedLimits: Record<RoadClass, number>
+  // mph over the limit before alerting, and before the alert turns high
+  speedTolerance: number
+  severeOverspeed: number
+  // Stopped at or below idleSpeed for idleAfterMs
+  idleSpeed: number
+  idleAfterMs: number
+  lowFuelPercent: number
+  criticalFuelPercent: number
+  // A condition that recurs within this window updates the vehicle's
+  // existing alert instead of raising a new one
+  dedupWindowMs: number
+  historySize: number
+}
+
+export const DEFAULT_ALERT_RULES: AlertRuleConfig = {
+  speedLimits: { highway: 65, arterial: 45, local: 25 },
+  speedTolerance: 5,
+  severeOverspeed: 15,
+  idleSpeed: 1,
+  idleAfterMs: 10 * 60_000,
+  lowFuelPercent: 15,
+  criticalFuelPercent: 8,
+  dedupWindowMs: 15 * 60_000,
+  historySize: ALERT_HISTORY_SIZE,
+}
+
+const SEVERITY_RANK: Record<Alert["severity"], number> = { low: 0, medium: 1, high: 2 }
+
+// A rule that currently holds for a vehicle. `key` identifies the rule (and
+// zone, for geofences), so each can be tracked and deduplicated on its own.
+interface Condition {
+  key: string
+  type: Alert["type"]
+  severity: Alert["severity"]
+  message: string
+}
+
+interface VehicleState {
+  idleSince: number | null
+  // Conditions holding as of the last update, with the alert they raised
+  active: Map<string, { alertId: string; severity: Alert["severity"] }>
+  // Last alert raised per condition key, for the dedup window
+  raised: Map<string, { alertId: string; at: number }>
+}
+
+// Evaluates telemetry against the alert rules. Alerts are edge-triggered: a
+// condition raises one alert when it starts holding, not one per update, and
+// a condition that recurs within the dedup window bumps the existing alert's
+// occurrence count (or is dropped if that alert was acknowledged). Alerts live
+// in a ring buffer, so history stays bounded however many vehicles report.
+export class AlertEngine {
+  private readonly history: RingBuffer<Alert>
+  private readonly sequences = new Map<string, number>()
+  private readonly open = new Set<string>()
+  private readonly vehicles = new Map<string, VehicleState>()
+  private readonly zones: PolygonIndex<Zone>
+  private readonly idPrefix: string
+  private nextId = 1
+
+  constructor(
+    private readonly rules: AlertRuleConfig = DEFAULT_ALERT_RULES,
+    seed: Alert[] = [],
+    zones: Zone[] = FLEET_ZONES
+  ) {
+    this.history = new RingBuffer(rules.historySize)
+    this.zones = createZoneIndex(zones)
+    // Ids must not collide with alerts a dashboard kept from a previous run
+    this.idPrefix = `alert-${Date.now().toString(36)}`
+    for (const alert of [...seed].sort((a, b) => a.timestamp - b.timestamp)) this.store(alert)
+  }
+
+  // Alerts oldest first
+  getHistory() {
+    return this.history.toArray()
+  }
+
+  get openCount() {
+    return this.open.size
+  }
+
+  // Runs every rule for each update and returns the alerts that were raised
+  // or changed, each once
+  evaluate(updates: TelemetryUpdate[], nameOf: (vehicleId: string) => string): Alert[] {
+    const changed = new Map<string, Alert>()
+    for (const update of updates) {
+      let state = this.vehicles.get(update.vehicleId)
+      if (!state) {
+        state = { idleSince: null, active: new Map(), raised: new Map() }
+        this.vehicles.set(update.vehicleId, state)
+      }
+
+      const conditions = this.conditions(update, state)
+      const holding = new Set<string>()
+      for (const condition of conditions) {
+        holding.add(condition.key)
+        const active = state.active.get(condition.key)
+        if (!active) {
+          const alert = this.raise(update, state, condition, nameOf)
+          state.active.set(condition.key, { alertId: alert?.id ?? "", severity: condition.severity })
+          if (alert) changed.set(alert.id, alert)
+        } else if (SEVERITY_RANK[condition.severity] > SEVERITY_RANK[active.severity]) {
+          // Escalation of a condition that is still holding, e.g. speeding
+          // turning severe
+          active.severity = condition.severity
+          const alert = this.update(active.alertId, (alert) => ({
+            ...alert,
+            severity: condition.severity,
+            message: condition.message,
+            timestamp: update.timestamp,
+          }))
+          if (alert) changed.set(alert.id, alert)
+        }
+      }
+      for (const key of state.active.keys()) {
+        if (!holding.has(key)) state.active.delete(key)
+      }
+    }
+    return Array.from(changed.values())
+  }
+
+  acknowledge(ids: Iterable<string>): Alert[] {
+    const changed: Alert[] = []
+    for (const id of ids) {
+      if (!this.open.has(id)) continue
+      const alert = this.update(id, (alert) => ({ ...alert, acknowledged: true }))
+      if (alert) changed.push(alert)
+    }
+    return changed
+  }
+
+  acknowledgeAll(): Alert[] {
+    return this.acknowledge(Array.from(this.open))
+  }
+
+  private conditions(update: TelemetryUpdate, state: VehicleState): Condition[] {
+    const { rules } = this
+    const conditions: Condition[] = []
+    const zones = this.zones.query(update.lat, update.lng)
+
+    // A class the rules have no limit for falls back to the zones
+    const roadClass = isRoadClass(update.roadClass) ? update.roadClass : roadClassIn(zones)
+    const limit = rules.speedLimits[roadClass]
+    const over = update.speed - limit
+    if (over > rules.speedTolerance) {
+      conditions.push({
+        key: "speeding",
+        type: "speeding",
+        severity: over > rules.severeOverspeed ? "high" : "medium",
+        message: `${Math.round(update.speed)} mph in a ${limit} mph ${roadClass} zone`,
+      })
+    }
+
+    if (update.speed <= rules.idleSpeed) {
+      state.idleSince ??= update.timestamp
+      const idleMs = update.timestamp - state.idleSince
+      if (idleMs >= rules.idleAfterMs) {
+        conditions.push({
+          key: "idle",
+          type: "idle",
+          severity: "low",
+          message: `Idling for ${Math.round(idleMs / 60_000)} min`,
+        })
+      }
+    } else {
+      state.idleSince = null
+    }
+
+    if (update.fuelLevel < rules.lowFuelPercent) {
+      conditions.push({
+        key: "fuel-low",
+        type: "fuel-low",
+        severity: update.fuelLevel < rules.criticalFuelPercent ? "high" : "medium",
+        message: `Fuel level at ${Math.round(update.fuelLevel)}%`,
+      })
+    }
+
+    for (const zone of zones) {
+      if (zone.kind !== "ski-resort") continue
+      conditions.push({
+        key: `geofence:${zone.id}`,
+        type: "geofence",
+        severity: "low",
+        message: `Entering ${zone.name} ski resort zone`,
+      })
+    }
+
+    return conditions
+  }
+
+  private raise(
+    update: TelemetryUpdate,
+    state: VehicleState,
+    condition: Condition,
+    nameOf: (vehicleId: string) => string
+  ): Alert | null {
+    const previous = state.raised.get(condition.key)
+    if (previous && update.timestamp - previous.at < this.rules.dedupWindowMs) {
+      const existing = this.get(previous.alertId)
+      if (existing) {
+        // Already handled by a dispatcher; stay quiet until the window passes
+        if (existing.acknowledged) return null
+        previous.at = update.timestamp
+        return this.update(existing.id, (alert) => ({
+          ...alert,
+          severity:
+            SEVERITY_RANK[condition.severity] > SEVERITY_RANK[alert.severity]
+              ? condition.severity
+              : alert.severity,
+          message: condition.message,
+          timestamp: update.timestamp,
+          occurrences: (alert.occurrences ?? 1) + 1,
+        }))
+      }
+    }
+
+    const alert: Alert = {
+      id: `${this.idPrefix}-${this.nextId++}`,
+      vehicleId: update.vehicleId,
+      vehicleName: nameOf(update.vehicleId),
+      type: condition.type,
+      message: condition.message,
+      timestamp: update.timestamp,
+      severity: condition.severity,
+      acknowledged: false,
+    }
+    this.store(alert)
+    state.raised.set(condition.key, { alertId: alert.id, at: update.timestamp })
+    return alert
+  }
+
+  private get(id: string) {
+    const sequence = this.sequences.get(id)
+    return sequence === undefined ? undefined : this.history.get(sequence)
+  }
+
+  private update(id: string, change: (alert: Alert) => Alert) {
+    const alert = this.get(id)
+    if (!alert) return null
+    const sequence = this.sequences.get(id)!
+    const next = change(alert)
+    this.history.set(sequence, next)
+    if (next.acknowledged) this.open.delete(id)
+    return next
+  }
+
+  private store(alert: Alert) {
+    const evicted = this.history.push(alert)
+    if (evicted) {
+      this.sequences.delete(evicted.id)
+      this.open.delete(evicted.id)
+    }
+    this.sequences.set(alert.id, this.history.end - 1)
+    if (!alert.acknowledged) this.open.add(alert.id)
+  }
+}
@@ -0,0 +1,78 @@
+// Stands in for a pair that must not be matched. It outweighs any real cost,
+// so the solver first matches as many rows as it can and only then minimizes
+// the total cost of the pairs.
+const FORBIDDEN = 1e9
+
+// Minimum-cost assignment of rows to columns: the Hungarian algorithm with
+// row and column potentials, O(rows² · cols). `costs` is row-major, rows ×
+// cols, with Infinity for pairs that must not be matched. Returns the column
+// matched to each row, or -1 for rows left unmatched.
+export function solveAssignment(costs: Float64Array, rows: number, cols: number): Int32Array {
+  // Every row needs a column to land on, so a tall matrix gets forbidden
+  // padding columns
+  const width = Math.max(rows, cols)
+  const cost = (row: number, col: number) => {
+    if (col >= cols) return FORBIDDEN
+    const value = costs[row * cols + col]
+    return Number.isFinite(value) ? value : FORBIDDEN
+  }
+
+  // 1-based as in the textbook formulation; column 0 is a sentinel
+  const rowPotential = new Float64Array(rows + 1)
+  const colPotential = new Float64Array(width + 1)
+  // rowOf[col]: row matched to the column, 0 if none
+  const rowOf = new Int32Array(width + 1)
+  const way = new Int32Array(width + 1)
+  const slack = new Float64Array(width + 1)
+  const visited = new Uint8Array(width + 1)
+
+  for (let row = 1; row <= rows; row++) {
+    rowOf[0] = row
+    let col = 0
+    slack.fill(Infinity)
+    visited.fill(0)
+
+    // Grow an alternating tree from the new row until it reaches a free column
+    do {
+      visited[col] = 1
+      const current = rowOf[col]
+      let delta = Infinity
+      let nextCol = 0
+      for (let j = 1; j <= width; j++) {
+        if (visited[j]) continue
+        const reduced = cost(current - 1, j - 1) - rowPotential[current] - colPotential[j]
+        if (reduced < slack[j]) {
+          slack[j] = reduced
+          way[j] = col
+        }
+        if (slack[j] < delta) {
+          delta = slack[j]
+          nextCol = j
+        }
+      }
+      for (let j = 0; j <= width; j++) {
+        if (visited[j]) {
+          rowPotential[rowOf[j]] += delta
+          colPotential[j] -= delta
+        } else {
+          slack[j] -= delta
+        }
+      }
+      col = nextCol
+    } while (rowOf[col] !== 0)
+
+    // Flip the augmenting path
+    do {
+      const previous = way[col]
+      rowOf[col] = rowOf[previous]
+      col = previous
+    } while (col !== 0)
+  }
+
+  const match = new Int32Array(rows).fill(-1)
+  for (let col = 1; col <= cols; col++) {
+    const row = rowOf[col]
+    if (row !== 0 && Number.isFinite(costs[(row - 1) * cols + col - 1])) match[row - 1] = col - 1
+  }
+  return match
+}
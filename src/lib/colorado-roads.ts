@@ -0,0 +1,192 @@
+import type { RoadClass } from "@/lib/fleet-types"
+
+// Road network of the service area, loaded locally instead of from a map
+// provider: the highway corridors between towns, traced through their
+// junctions and passes, plus a street grid in each town. Coordinates are
+// approximate; travel times come from each road's typical speed.
+
+export interface Corridor {
+  name: string
+  roadClass: RoadClass
+  speedMph: number
+  // Names of ROAD_POINTS, in order
+  path: string[]
+}
+
+export interface TownGrid {
+  point: string
+  // Blocks from the center to the edge of the grid
+  radius: number
+  spacingMiles: number
+}
+
+export const ROAD_POINTS: Record<string, [lat: number, lng: number]> = {
+  "Grand Junction": [39.0639, -108.5506],
+  Clifton: [39.0792, -108.4498],
+  Palisade: [39.1103, -108.3509],
+  "De Beque": [39.3328, -108.2159],
+  Parachute: [39.4519, -108.0529],
+  Rifle: [39.5347, -107.7831],
+  "New Castle": [39.5727, -107.5362],
+  "Glenwood Springs": [39.5505, -107.3248],
+  Dotsero: [39.6447, -107.0656],
+  Gypsum: [39.6469, -106.9517],
+  Eagle: [39.6553, -106.8287],
+  Edwards: [39.645, -106.5942],
+  Avon: [39.6314, -106.5222],
+  "Dowd Junction": [39.622, -106.433],
+  Vail: [39.6403, -106.3742],
+  "Vail Pass": [39.5306, -106.2172],
+  "Copper Mountain": [39.5022, -106.1497],
+  Frisco: [39.5744, -106.0975],
+  Silverthorne: [39.6297, -106.0717],
+  "Eisenhower Tunnel": [39.6797, -105.9231],
+  Georgetown: [39.7061, -105.6975],
+  "Idaho Springs": [39.7425, -105.5136],
+  "El Rancho": [39.71, -105.35],
+  Golden: [39.7555, -105.2211],
+  Denver: [39.7392, -104.9903],
+  "Pena Junction": [39.78, -104.78],
+  "Denver International Airport": [39.8561, -104.6737],
+  Whitewater: [38.99, -108.45],
+  Delta: [38.7422, -108.069],
+  Olathe: [38.605, -107.982],
+  Montrose: [38.4783, -107.8762],
+  "Black Canyon Junction": [38.469, -107.76],
+  "Black Canyon": [38.5754, -107.7416],
+  Cimarron: [38.4458, -107.555],
+  Gunnison: [38.5458, -106.9253],
+  "Crested Butte": [38.8697, -106.9878],
+  "Monarch Pass": [38.4969, -106.3253],
+  "Poncha Springs": [38.5147, -106.0775],
+  Salida: [38.5347, -105.9989],
+  "Buena Vista": [38.8422, -106.1311],
+  "Antero Junction": [38.9197, -105.96],
+  Fairplay: [39.2247, -105.9997],
+  "Kenosha Pass": [39.4136, -105.7589],
+  Bailey: [39.4058, -105.4714],
+  Conifer: [39.5211, -105.305],
+  Morrison: [39.635, -105.15],
+  Colona: [38.33, -107.78],
+  Ridgway: [38.1528, -107.7562],
+  "Dallas Divide": [38.08, -107.88],
+  Placerville: [38.0161, -108.0512],
+  Sawpit: [37.9947, -107.9995],
+  "Society Turn": [37.94, -107.85],
+  Telluride: [37.9375, -107.8123],
+  "Mountain Village": [37.9364, -107.8466],
+  Carbondale: [39.4022, -107.2112],
+  Basalt: [39.3689, -107.0328],
+  "Snowmass Junction": [39.235, -106.93],
+  "Snowmass Village": [39.213, -106.9378],
+  Aspen: [39.1911, -106.8175],
+  "Independence Pass": [39.1083, -106.5639],
+  "Twin Lakes": [39.0825, -106.3803],
+  Leadville: [39.2508, -106.2925],
+  Minturn: [39.5864, -106.4309],
+  "Red Cliff": [39.5097, -106.367],
+  "Tennessee Pass": [39.3622, -106.3114],
+  "Fremont Pass": [39.3672, -106.1944],
+  Breckenridge: [39.4817, -106.0384],
+  "Hoosier Pass": [39.3617, -106.0625],
+}
+
+export const CORRIDORS: Corridor[] = [
+  {
+    name: "I-70",
+    roadClass: "highway",
+    speedMph: 70,
+    path: [
+      "Grand Junction", "Clifton", "Palisade", "De Beque", "Parachute", "Rifle", "New Castle",
+      "Glenwood Springs",
+    ],
+  },
+  {
+    name: "I-70",
+    roadClass: "highway",
+    speedMph: 60,
+    path: [
+      "Glenwood Springs", "Dotsero", "Gypsum", "Eagle", "Edwards", "Avon", "Dowd Junction", "Vail",
+      "Vail Pass", "Copper Mountain", "Frisco", "Silverthorne", "Eisenhower Tunnel", "Georgetown",
+      "Idaho Springs", "El Rancho", "Golden", "Denver",
+    ],
+  },
+  { name: "Pena Boulevard", roadClass: "highway", speedMph: 60, path: ["Denver", "Pena Junction", "Denver International Airport"] },
+  { name: "US-50", roadClass: "highway", speedMph: 60, path: ["Grand Junction", "Whitewater", "Delta", "Olathe", "Montrose"] },
+  {
+    name: "US-50",
+    roadClass: "highway",
+    speedMph: 55,
+    path: ["Montrose", "Black Canyon Junction", "Cimarron", "Gunnison", "Monarch Pass", "Poncha Springs", "Salida"],
+  },
+  { name: "SH-347", roadClass: "arterial", speedMph: 35, path: ["Black Canyon Junction", "Black Canyon"] },
+  { name: "SH-135", roadClass: "highway", speedMph: 50, path: ["Gunnison", "Crested Butte"] },
+  { name: "US-550", roadClass: "highway", speedMph: 55, path: ["Montrose", "Colona", "Ridgway"] },
+  {
+    name: "SH-62 / SH-145",
+    roadClass: "highway",
+    speedMph: 45,
+    path: ["Ridgway", "Dallas Divide", "Placerville", "Sawpit", "Society Turn", "Telluride"],
+  },
+  { name: "Mountain Village Boulevard", roadClass: "arterial", speedMph: 30, path: ["Society Turn", "Mountain Village"] },
+  {
+    name: "SH-82",
+    roadClass: "highway",
+    speedMph: 55,
+    path: ["Glenwood Springs", "Carbondale", "Basalt", "Snowmass Junction", "Aspen"],
+  },
+  { name: "Brush Creek Road", roadClass: "arterial", speedMph: 35, path: ["Snowmass Junction", "Snowmass Village"] },
+  {
+    name: "Independence Pass",
+    roadClass: "highway",
+    speedMph: 35,
+    path: ["Aspen", "Independence Pass", "Twin Lakes", "Leadville"],
+  },
+  {
+    name: "US-24",
+    roadClass: "highway",
+    speedMph: 45,
+    path: ["Dowd Junction", "Minturn", "Red Cliff", "Tennessee Pass", "Leadville", "Buena Vista", "Poncha Springs"],
+  },
+  { name: "SH-91", roadClass: "highway", speedMph: 50, path: ["Copper Mountain", "Fremont Pass", "Leadville"] },
+  { name: "SH-9", roadClass: "highway", speedMph: 45, path: ["Frisco", "Breckenridge", "Hoosier Pass", "Fairplay"] },
+  { name: "US-285", roadClass: "highway", speedMph: 55, path: ["Buena Vista", "Antero Junction", "Fairplay"] },
+  {
+    name: "US-285",
+    roadClass: "highway",
+    speedMph: 55,
+    path: ["Fairplay", "Kenosha Pass", "Bailey", "Conifer", "Morrison", "Denver"],
+  },
+]
+
+export const TOWN_GRIDS: TownGrid[] = [
+  { point: "Grand Junction", radius: 14, spacingMiles: 0.3 },
+  { point: "Denver", radius: 14, spacingMiles: 0.4 },
+  { point: "Montrose", radius: 7, spacingMiles: 0.3 },
+  { point: "Delta", radius: 3, spacingMiles: 0.25 },
+  { point: "Telluride", radius: 3, spacingMiles: 0.2 },
+  { point: "Mountain Village", radius: 2, spacingMiles: 0.2 },
+  { point: "Ridgway", radius: 2, spacingMiles: 0.2 },
+  { point: "Vail", radius: 4, spacingMiles: 0.25 },
+  { point: "Avon", radius: 3, spacingMiles: 0.25 },
+  { point: "Aspen", radius: 4, spacingMiles: 0.25 },
+  { point: "Snowmass Village", radius: 2, spacingMiles: 0.25 },
+  { point: "Glenwood Springs", radius: 4, spacingMiles: 0.25 },
+  { point: "Carbondale", radius: 2, spacingMiles: 0.25 },
+  { point: "Basalt", radius: 2, spacingMiles: 0.25 },
+  { point: "Rifle", radius: 3, spacingMiles: 0.25 },
+  { point: "Palisade", radius: 2, spacingMiles: 0.25 },
+  { point: "Eagle", radius: 3, spacingMiles: 0.25 },
+  { point: "Frisco", radius: 2, spacingMiles: 0.25 },
+  { point: "Silverthorne", radius: 2, spacingMiles: 0.25 },
+  { point: "Breckenridge", radius: 3, spacingMiles: 0.25 },
+  { point: "Leadville", radius: 3, spacingMiles: 0.25 },
+  { point: "Gunnison", radius: 3, spacingMiles: 0.25 },
+  { point: "Crested Butte", radius: 2, spacingMiles: 0.25 },
+  { point: "Salida", radius: 3, spacingMiles: 0.25 },
+  { point: "Buena Vista", radius: 2, spacingMiles: 0.25 },
+  { point: "Fairplay", radius: 2, spacingMiles: 0.25 },
+  { point: "Idaho Springs", radius: 2, spacingMiles: 0.25 },
+  { point: "Golden", radius: 3, spacingMiles: 0.25 },
+  { point: "Denver International Airport", radius: 2, spacingMiles: 0.3 },
+]
@@ -0,0 +1,135 @@
+import {
+  Dispatcher,
+  type Assignment,
+  type DispatchRequest,
+  type Rejection,
+} from "@/lib/dispatch"
+import { getRoadRouter, trackRide, untrackRide } from "@/lib/eta-hub"
+import { createSeedVehicles } from "@/lib/fleet-data"
+import type { Vehicle } from "@/lib/fleet-types"
+import { getVehicleSnapshot } from "@/lib/telemetry-hub"
+
+// Requests arriving within one window are assigned together
+export const DISPATCH_WINDOW_MS = 5_000
+// Outcomes kept for status lookups, oldest dropped first
+const MAX_STATUSES = 10_000
+// Arrived rides stop being tracked on their own; a ride this far past its
+// estimated drop-off has lost its vehicle's telemetry or was abandoned
+const RIDE_OVERRUN_MS = 30 * 60_000
+
+export interface DispatchStatus {
+  requestId: string
+  state: "waiting" | "assigned" | "rejected"
+  requestedAt: number
+  assignment?: Assignment
+  reason?: Rejection["reason"]
+}
+
+interface DispatchHub {
+  dispatcher: Dispatcher
+  requests: Map<string, DispatchRequest>
+  statuses: Map<string, DispatchStatus>
+  // Estimated drop-off of each assigned ride still tracked for ETAs
+  tracked: Map<string, number>
+  timer: ReturnType<typeof setTimeout> | null
+  // Dispatched against when no telemetry source has registered a fleet
+  seedVehicles: Vehicle[] | null
+}
+
+// Route handlers are bundled separately, so the hub is kept on globalThis
+// like the telemetry hub
+const globalForDispatch = globalThis as typeof globalThis & {
+  __fleetDispatchHub?: DispatchHub
+}
+
+function getHub(): DispatchHub {
+  if (!globalForDispatch.__fleetDispatchHub) {
+    globalForDispatch.__fleetDispatchHub = {
+      dispatcher: new Dispatcher(getRoadRouter()),
+      requests: new Map(),
+      statuses: new Map(),
+      tracked: new Map(),
+      timer: null,
+      seedVehicles: null,
+    }
+  }
+  return globalForDispatch.__fleetDispatchHub
+}
+
+function setStatus(hub: DispatchHub, status: DispatchStatus) {
+  hub.statuses.set(status.requestId, status)
+  if (hub.statuses.size > MAX_STATUSES) {
+    const oldest = hub.statuses.keys().next().value!
+    hub.statuses.delete(oldest)
+    hub.requests.delete(oldest)
+  }
+}
+
+function untrackOverdue(hub: DispatchHub, now: number) {
+  for (const [requestId, freeAt] of hub.tracked) {
+    if (now - freeAt < RIDE_OVERRUN_MS) continue
+    untrackRide(requestId)
+    hub.tracked.delete(requestId)
+  }
+}
+
+function closeWindow() {
+  const hub = getHub()
+  hub.timer = null
+  untrackOverdue(hub, Date.now())
+  let vehicles = getVehicleSnapshot()
+  if (vehicles.length === 0) vehicles = hub.seedVehicles ??= createSeedVehicles()
+
+  const { assignments, rejections, waiting } = hub.dispatcher.dispatch(vehicles)
+  for (const assignment of assignments) {
+    const request = hub.requests.get(assignment.requestId)
+    const status = hub.statuses.get(assignment.requestId)
+    // Dropped from the history while it waited
+    if (!request || !status) continue
+    setStatus(hub, { ...status, state: "assigned", assignment })
+    // The rider follows the vehicle to the pickup and the ride on the
+    // tracking page from here
+    trackRide(
+      {
+        id: request.id,
+        vehicleId: assignment.vehicleId,
+        pickup: request.pickup,
+        dropoff: request.dropoff,
+      },
+      "pickup"
+    )
+    hub.tracked.set(request.id, assignment.freeAt)
+  }
+  for (const { requestId, reason } of rejections) {
+    const status = hub.statuses.get(requestId)
+    if (status) setStatus(hub, { ...status, state: "rejected", reason })
+  }
+  if (waiting > 0) hub.timer = setTimeout(closeWindow, DISPATCH_WINDOW_MS)
+}
+
+// Queues a ride for the next dispatch window. Submitting a request id again
+// returns its current status.
+export function requestRide(request: Omit<DispatchRequest, "requestedAt">): DispatchStatus {
+  const hub = getHub()
+  const existing = hub.statuses.get(request.id)
+  if (existing) return existing
+
+  const requestedAt = Date.now()
+  untrackOverdue(hub, requestedAt)
+  hub.requests.set(request.id, { ...request, requestedAt })
+  hub.dispatcher.submit({ ...request, requestedAt })
+  const status: DispatchStatus = { requestId: request.id, state: "waiting", requestedAt }
+  setStatus(hub, status)
+  hub.timer ??= setTimeout(closeWindow, DISPATCH_WINDOW_MS)
+  return status
+}
+
+export function getDispatchStatuses(requestIds: string[]): Record<string, DispatchStatus> {
+  const hub = getHub()
+  const statuses: Record<string, DispatchStatus> = {}
+  for (const id of requestIds) {
+    const status = hub.statuses.get(id)
+    if (status) statuses[id] = status
+  }
+  return statuses
+}
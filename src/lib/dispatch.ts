@@ -0,0 +1,374 @@
+import { solveAssignment } from "@/lib/assignment"
+import type { Vehicle } from "@/lib/fleet-types"
+import type { LatLng } from "@/lib/geo"
+import { Quadtree } from "@/lib/quadtree"
+import { approxMiles } from "@/lib/road-graph"
+import { routeMiles, routeSeconds, type AltRouter } from "@/lib/routing"
+
+export interface DispatchRequest {
+  id: string
+  pickup: LatLng
+  dropoff: LatLng
+  // Needs a wheelchair-accessible vehicle
+  accessible: boolean
+  requestedAt: number
+}
+
+export interface Assignment {
+  requestId: string
+  vehicleId: string
+  driverId: string
+  pickupSeconds: number
+  pickupMiles: number
+  tripSeconds: number
+  tripMiles: number
+  assignedAt: number
+  // When the rider is dropped off and the vehicle can be dispatched again
+  freeAt: number
+}
+
+export interface Rejection {
+  requestId: string
+  reason: "no-route" | "no-vehicle"
+}
+
+export interface DispatchResult {
+  assignments: Assignment[]
+  rejections: Rejection[]
+  // Requests carried over to the next window
+  waiting: number
+}
+
+export interface DispatchOptions {
+  // A request no vehicle could take for this long is rejected
+  maxWaitMs: number
+  // Nearest eligible vehicles priced per request
+  candidates: number
+  searchMiles: number
+  maxPickupSeconds: number
+  // Fuel that must be left after the pickup leg and the ride, in percent
+  reserveFuelPercent: number
+  tankRangeMiles: number
+  // "greedy" takes requests one by one in arrival order, each with its
+  // fastest free vehicle; kept as the baseline to compare against
+  matching: "optimal" | "greedy"
+}
+
+export const DEFAULT_DISPATCH_OPTIONS: DispatchOptions = {
+  maxWaitMs: 10 * 60_000,
+  candidates: 8,
+  searchMiles: 30,
+  maxPickupSeconds: 45 * 60,
+  reserveFuelPercent: 15,
+  tankRangeMiles: 350,
+  matching: "optimal",
+}
+
+const MILES_PER_DEGREE_LAT = 69
+const TRIP_CACHE_SIZE = 4096
+
+interface Leg {
+  seconds: number
+  miles: number
+}
+
+interface PendingRequest {
+  request: DispatchRequest
+  pickupNode: number
+  trip: Leg | null
+  // Drive from each vehicle node searched so far to the pickup. The graph
+  // doesn't change, so a request waiting for a later window only searches
+  // for vehicles that moved.
+  legs: Map<number, Leg>
+}
+
+interface Candidate {
+  row: number
+  vehicle: number
+  pickupSeconds: number
+  pickupMiles: number
+}
+
+// Assigns ride requests to vehicles in batches. Requests are collected until
+// the caller closes a window with dispatch(); each window is then solved as
+// one minimum-cost assignment over total pickup time, so two riders near one
+// vehicle don't leave the second with a long wait because the first got the
+// vehicle on arrival order.
+//
+// Candidates for a request are the nearest vehicles, from a spatial index,
+// that pass the hard constraints: accessible when the rider needs it, a
+// driver on duty and free, and fuel for the pickup leg and the ride. Their
+// pickup times come from one road-graph search per request.
+export class Dispatcher {
+  readonly options: DispatchOptions
+  private pending: PendingRequest[] = []
+  private readonly busyUntil = new Map<string, number>()
+  // Road-graph node of each vehicle at its last known position; most
+  // vehicles sit still between windows
+  private readonly vehicleNodes = new Map<string, { lat: number; lng: number; node: number }>()
+  private readonly trips = new Map<string, Leg | null>()
+
+  constructor(
+    readonly router: AltRouter,
+    options: Partial<DispatchOptions> = {}
+  ) {
+    this.options = { ...DEFAULT_DISPATCH_OPTIONS, ...options }
+  }
+
+  get waiting() {
+    return this.pending.length
+  }
+
+  submit(request: DispatchRequest) {
+    const { graph } = this.router
+    const pickupNode = graph.nearestNode(request.pickup.lat, request.pickup.lng)
+    const dropoffNode = graph.nearestNode(request.dropoff.lat, request.dropoff.lng)
+    this.pending.push({
+      request,
+      pickupNode,
+      trip: this.trip(pickupNode, dropoffNode),
+      legs: new Map(),
+    })
+  }
+
+  // Closes the current window: assigns what it can, rejects requests that
+  // can't be served or have waited too long and keeps the rest
+  dispatch(vehicles: Vehicle[], now = Date.now()): DispatchResult {
+    const rejections: Rejection[] = []
+    const batch: PendingRequest[] = []
+    for (const entry of this.pending) {
+      if (entry.trip) batch.push(entry)
+      else rejections.push({ requestId: entry.request.id, reason: "no-route" })
+    }
+
+    const available = this.availableVehicles(vehicles, now)
+    const candidates = this.findCandidates(batch, available)
+    const matched = new Map<number, Candidate>()
+    for (const group of independentGroups(candidates, batch.length)) {
+      for (const candidate of this.match(group)) matched.set(candidate.row, candidate)
+    }
+
+    const assignments: Assignment[] = []
+    const waiting: PendingRequest[] = []
+    for (let row = 0; row < batch.length; row++) {
+      const { request, trip } = batch[row]
+      const choice = matched.get(row)
+      if (!choice) {
+        if (now - request.requestedAt >= this.options.maxWaitMs) {
+          rejections.push({ requestId: request.id, reason: "no-vehicle" })
+        } else {
+          waiting.push(batch[row])
+        }
+        continue
+      }
+      const vehicle = available[choice.vehicle]
+      const { pickupSeconds } = choice
+      const freeAt = now + (pickupSeconds + trip!.seconds) * 1000
+      this.busyUntil.set(vehicle.id, freeAt)
+      assignments.push({
+        requestId: request.id,
+        vehicleId: vehicle.id,
+        driverId: vehicle.driver!.id,
+        pickupSeconds,
+        pickupMiles: choice.pickupMiles,
+        tripSeconds: trip!.seconds,
+        tripMiles: trip!.miles,
+        assignedAt: now,
+        freeAt,
+      })
+    }
+    this.pending = waiting
+    return { assignments, rejections, waiting: waiting.length }
+  }
+
+  private availableVehicles(vehicles: Vehicle[], now: number) {
+    const available: Vehicle[] = []
+    for (const vehicle of vehicles) {
+      if (vehicle.status !== "active" && vehicle.status !== "idle") continue
+      if (vehicle.driver?.status !== "available") continue
+      if (vehicle.fuelLevel <= this.options.reserveFuelPercent) continue
+      const busyUntil = this.busyUntil.get(vehicle.id)
+      if (busyUntil !== undefined) {
+        if (busyUntil > now) continue
+        this.busyUntil.delete(vehicle.id)
+      }
+      available.push(vehicle)
+    }
+    return available
+  }
+
+  private findCandidates(batch: PendingRequest[], vehicles: Vehicle[]) {
+    const candidates: Candidate[] = []
+    if (batch.length === 0 || vehicles.length === 0) return candidates
+
+    let minLat = Infinity
+    let minLng = Infinity
+    let maxLat = -Infinity
+    let maxLng = -Infinity
+    for (const { location } of vehicles) {
+      minLat = Math.min(minLat, location.lat)
+      maxLat = Math.max(maxLat, location.lat)
+      minLng = Math.min(minLng, location.lng)
+      maxLng = Math.max(maxLng, location.lng)
+    }
+    const index = new Quadtree<number>(minLng, minLat, maxLng, maxLat)
+    vehicles.forEach((vehicle, i) => index.insert({ x: vehicle.location.lng, y: vehicle.location.lat, data: i }))
+
+    const { candidates: limit, searchMiles, maxPickupSeconds, reserveFuelPercent, tankRangeMiles } =
+      this.options
+
+    batch.forEach(({ request, pickupNode, trip, legs }, row) => {
+      const { lat, lng } = request.pickup
+      const tripFuel = (trip!.miles / tankRangeMiles) * 100 + reserveFuelPercent
+
+      // Vehicles cluster in towns, so the search starts close and widens
+      // until it has enough candidates rather than sorting a whole valley
+      const nearby: { vehicle: number; miles: number }[] = []
+      for (let radius = searchMiles / 8; nearby.length < limit; radius *= 2) {
+        radius = Math.min(radius, searchMiles)
+        const dLat = radius / MILES_PER_DEGREE_LAT
+        const dLng = dLat / Math.cos((lat * Math.PI) / 180)
+        nearby.length = 0
+        for (const point of index.queryRect(lng - dLng, lat - dLat, lng + dLng, lat + dLat)) {
+          const vehicle = vehicles[point.data]
+          if (request.accessible && vehicle.type !== "accessible") continue
+          if (vehicle.fuelLevel < tripFuel) continue
+          const miles = approxMiles(lat, lng, point.y, point.x)
+          if (miles <= radius) nearby.push({ vehicle: point.data, miles })
+        }
+        if (radius === searchMiles) break
+      }
+      if (nearby.length === 0) return
+      nearby.sort((a, b) => a.miles - b.miles)
+      if (nearby.length > limit) nearby.length = limit
+
+      const targets = nearby.map(({ vehicle }) => this.vehicleNode(vehicles[vehicle]))
+      const unsearched = targets.filter((node) => !legs.has(node))
+      if (unsearched.length > 0) {
+        // Roads are two-way, so the search runs outwards from the pickup
+        const travel = this.router.travelToMany(pickupNode, unsearched, maxPickupSeconds)
+        unsearched.forEach((node, i) => legs.set(node, { seconds: travel.seconds[i], miles: travel.miles[i] }))
+      }
+
+      nearby.forEach(({ vehicle }, i) => {
+        const leg = legs.get(targets[i])!
+        if (!Number.isFinite(leg.seconds)) return
+        const fuelNeeded = tripFuel + (leg.miles / tankRangeMiles) * 100
+        if (vehicles[vehicle].fuelLevel < fuelNeeded) return
+        candidates.push({ row, vehicle, pickupSeconds: leg.seconds, pickupMiles: leg.miles })
+      })
+    })
+    return candidates
+  }
+
+  private vehicleNode({ id, location }: Vehicle) {
+    const cached = this.vehicleNodes.get(id)
+    if (cached?.lat === location.lat && cached.lng === location.lng) return cached.node
+    const node = this.router.graph.nearestNode(location.lat, location.lng)
+    this.vehicleNodes.set(id, { lat: location.lat, lng: location.lng, node })
+    return node
+  }
+
+  // Picks one candidate per request of a group, minimizing total pickup time
+  // (or greedily in arrival order), with each vehicle used at most once
+  private match(group: Candidate[]) {
+    const rowOf = new Map<number, number>()
+    const columnOf = new Map<number, number>()
+    // Rows in arrival order, which greedy matching depends on
+    for (const row of Array.from(new Set(group.map((candidate) => candidate.row))).sort((a, b) => a - b)) {
+      rowOf.set(row, rowOf.size)
+    }
+    for (const { vehicle } of group) {
+      if (!columnOf.has(vehicle)) columnOf.set(vehicle, columnOf.size)
+    }
+
+    const rows = rowOf.size
+    const columns = columnOf.size
+    const costs = new Float64Array(rows * columns).fill(Infinity)
+    const cells: Candidate[] = new Array(rows * columns)
+    for (const candidate of group) {
+      const cell = rowOf.get(candidate.row)! * columns + columnOf.get(candidate.vehicle)!
+      costs[cell] = candidate.pickupSeconds
+      cells[cell] = candidate
+    }
+    const match =
+      this.options.matching === "optimal"
+        ? solveAssignment(costs, rows, columns)
+        : matchGreedy(costs, rows, columns)
+
+    const chosen: Candidate[] = []
+    match.forEach((column, row) => {
+      if (column !== -1) chosen.push(cells[row * columns + column])
+    })
+    return chosen
+  }
+
+  // Rides between the same nodes (hospital to home, airport to resort) are
+  // routed once
+  private trip(from: number, to: number) {
+    const key = `${from}>${to}`
+    if (this.trips.has(key)) {
+      const trip = this.trips.get(key) ?? null
+      this.trips.delete(key)
+      this.trips.set(key, trip)
+      return trip
+    }
+    const path = this.router.route(from, to)
+    const trip = path ? { seconds: routeSeconds(path), miles: routeMiles(path) } : null
+    this.trips.set(key, trip)
+    if (this.trips.size > TRIP_CACHE_SIZE) {
+      this.trips.delete(this.trips.keys().next().value!)
+    }
+    return trip
+  }
+}
+
+// Requests that share no candidate vehicle can't change each other's
+// assignment, so requests linked through shared candidates form a group that
+// is solved on its own. A window spanning Grand Junction and Denver becomes a
+// few small problems instead of one large one.
+function independentGroups(candidates: Candidate[], rows: number) {
+  const parent = Int32Array.from({ length: rows }, (_, row) => row)
+  const find = (row: number) => {
+    while (parent[row] !== row) {
+      parent[row] = parent[parent[row]]
+      row = parent[row]
+    }
+    return row
+  }
+  const firstRow = new Map<number, number>()
+  for (const { row, vehicle } of candidates) {
+    const first = firstRow.get(vehicle)
+    if (first === undefined) firstRow.set(vehicle, row)
+    else parent[find(row)] = find(first)
+  }
+
+  const groups = new Map<number, Candidate[]>()
+  for (const candidate of candidates) {
+    const root = find(candidate.row)
+    const group = groups.get(root)
+    if (group) group.push(candidate)
+    else groups.set(root, [candidate])
+  }
+  return groups.values()
+}
+
+// Each row in order takes its cheapest column still free
+function matchGreedy(costs: Float64Array, rows: number, cols: number) {
+  const match = new Int32Array(rows).fill(-1)
+  const taken = new Uint8Array(cols)
+  for (let row = 0; row < rows; row++) {
+    let best = -1
+    for (let col = 0; col < cols; col++) {
+      const cost = costs[row * cols + col]
+      if (!taken[col] && Number.isFinite(cost) && (best === -1 || cost < costs[row * cols + best])) {
+        best = col
+      }
+    }
+    if (best !== -1) {
+      match[row] = best
+      taken[best] = 1
+    }
+  }
+  return match
+}
@@ -0,0 +1,70 @@
+import { createSeedTrips, seedActiveRide } from "@/lib/fleet-data"
+import type { TelemetryUpdate } from "@/lib/fleet-types"
+import { findPlace } from "@/lib/places"
+import { EtaService, type RideEta, type RidePhase, type RideRequest } from "@/lib/ride-eta"
+import { buildRoadGraph } from "@/lib/road-graph"
+import { AltRouter } from "@/lib/routing"
+import { getVehicle } from "@/lib/telemetry-hub"
+
+// Route handlers are bundled separately, so the service is kept on globalThis
+// like the telemetry hub. Building the graph and its landmarks takes tens of
+// milliseconds and happens on first use.
+const globalForEta = globalThis as typeof globalThis & {
+  __fleetEta?: EtaService
+}
+
+function getService(): EtaService {
+  if (!globalForEta.__fleetEta) {
+    const service = new EtaService(new AltRouter(buildRoadGraph()))
+    globalForEta.__fleetEta = service
+
+    // In-progress trips of the seed fleet and the rider's active ride
+    const rides = createSeedTrips()
+      .filter((trip) => trip.status === "in-progress")
+      .map((trip) => ({
+        id: trip.id,
+        vehicleId: trip.vehicleId,
+        pickup: trip.startLocation,
+        dropoff: trip.endLocation,
+      }))
+    for (const ride of [...rides, seedActiveRide]) {
+      const pickup = findPlace(ride.pickup)
+      const dropoff = findPlace(ride.dropoff)
+      if (!pickup || !dropoff) continue
+      trackRide({ id: ride.id, vehicleId: ride.vehicleId, pickup, dropoff })
+    }
+  }
+  return globalForEta.__fleetEta
+}
+
+// The router behind the ETAs, shared so the graph and landmarks are built once
+export function getRoadRouter() {
+  return getService().router
+}
+
+// Starts tracking from the vehicle's last reported position; a ride that is
+// already tracked keeps its state. Rides just dispatched start in the pickup
+// phase, so their ETA covers the drive to the rider.
+export function trackRide(ride: RideRequest, phase: RidePhase = "ride"): RideEta | null {
+  return getService().track(ride, getVehicle(ride.vehicleId)?.location, phase)
+}
+
+// For rides that end without arriving, e.g. cancelled ones
+export function untrackRide(rideId: string) {
+  getService().untrack(rideId)
+}
+
+export function updateRideEtas(updates: TelemetryUpdate[]) {
+  if (updates.length === 0) return []
+  return getService().update(updates)
+}
+
+export function getRideEtas(rideIds: string[]): Record<string, RideEta> {
+  const service = getService()
+  const etas: Record<string, RideEta> = {}
+  for (const id of rideIds) {
+    const eta = service.get(id)
+    if (eta) etas[id] = eta
+  }
+  return etas
+}
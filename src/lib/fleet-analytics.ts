@@ -0,0 +1,448 @@
+import { createSeedVehicles, seedUtilization } from "@/lib/fleet-data"
+import type { TelemetryUpdate } from "@/lib/fleet-types"
+import { createRandom } from "@/lib/random"
+import {
+  ANALYTICS_RANGES,
+  bucketIndex,
+  bucketStart,
+  clampSeriesWidth,
+  pointsForWidth,
+  RESOLUTIONS,
+  seriesResolution,
+  UsageHistory,
+  type AnalyticsRangeKey,
+  type BucketSeries,
+  type Resolution,
+  type Retention,
+  type SeriesMetric,
+  type SeriesMode,
+  type SeriesPoints,
+  type SeriesResult,
+  type UsageSample,
+  type UsageTotals,
+} from "@/lib/time-series"
+
+const HOUR_MS = 3_600_000
+const DAY_MS = 24 * HOUR_MS
+
+// Fleet-wide history is small, so it keeps two days of minute data and every
+// rollup forever. Per-vehicle history is kept shorter, in single precision.
+const FLEET_RETENTION: Retention = {
+  minute: 2 * DAY_MS,
+  hour: Infinity,
+  day: Infinity,
+  week: Infinity,
+}
+const VEHICLE_RETENTION: Retention = {
+  minute: 6 * HOUR_MS,
+  hour: 14 * DAY_MS,
+  day: 400 * DAY_MS,
+  week: Infinity,
+}
+
+const TANK_GALLONS = 20
+const FUEL_PRICE_PER_GALLON = 3.3
+// Gaps longer than this between two updates are not counted as observed time
+const MAX_SAMPLE_GAP_MS = 5 * 60_000
+const MOVING_MPH = 1
+const CACHE_SIZE = 256
+const SEED_DAYS = 90
+
+interface CacheEntry {
+  state: unknown
+  // End of the last bucket the query reads
+  end: number
+  // analytics.generation and watermark when the state was last refreshed
+  generation: number
+  watermark: number
+  // Earliest late sample written since then, Infinity if none
+  dirtyFrom: number
+}
+
+interface FleetAnalytics {
+  fleet: UsageHistory
+  vehicles: Map<string, UsageHistory>
+  names: Map<string, string>
+  // Last reading per vehicle, to turn telemetry into usage deltas
+  readings: Map<string, { timestamp: number; fuelLevel: number }>
+  // Bumped on every write
+  generation: number
+  // Newest sample written; samples in an earlier minute than it are late
+  watermark: number
+  cache: Map<string, CacheEntry>
+  seeded: boolean
+  // First live telemetry sample; the synthetic history stops there
+  liveFrom: number
+}
+
+// Route handlers are bundled separately, so the store is kept on globalThis
+// like the telemetry hub
+const globalForAnalytics = globalThis as typeof globalThis & {
+  __fleetAnalytics?: FleetAnalytics
+}
+
+function getAnalytics(): FleetAnalytics {
+  if (!globalForAnalytics.__fleetAnalytics) {
+    const analytics: FleetAnalytics = {
+      fleet: new UsageHistory(FLEET_RETENTION),
+      vehicles: new Map(),
+      names: new Map(),
+      readings: new Map(),
+      generation: 0,
+      watermark: -Infinity,
+      cache: new Map(),
+      seeded: false,
+      liveFrom: Infinity,
+    }
+    globalForAnalytics.__fleetAnalytics = analytics
+  }
+  return globalForAnalytics.__fleetAnalytics
+}
+
+// The store for queries. The synthetic history is built on the first query
+// rather than by whichever request touches analytics first, so telemetry
+// ingest never pays for it.
+function getSeededAnalytics(): FleetAnalytics {
+  const analytics = getAnalytics()
+  if (!analytics.seeded) {
+    analytics.seeded = true
+    seedHistory(analytics, Math.min(Date.now(), analytics.liveFrom))
+  }
+  return analytics
+}
+
+function addSample(analytics: FleetAnalytics, vehicleId: string, sample: UsageSample) {
+  let history = analytics.vehicles.get(vehicleId)
+  if (!history) {
+    history = new UsageHistory(VEHICLE_RETENTION, Float32Array)
+    analytics.vehicles.set(vehicleId, history)
+  }
+  history.add(sample)
+  analytics.fleet.add(sample)
+
+  analytics.generation++
+  if (bucketIndex(sample.timestamp, "minute") >= bucketIndex(analytics.watermark, "minute")) {
+    analytics.watermark = Math.max(analytics.watermark, sample.timestamp)
+    return
+  }
+  // Late: cached queries covering it re-read from here
+  for (const entry of analytics.cache.values()) {
+    if (sample.timestamp < entry.end) entry.dirtyFrom = Math.min(entry.dirtyFrom, sample.timestamp)
+  }
+}
+
+// Synthetic history for the seed fleet: 15-minute samples going back
+// SEED_DAYS, and minute samples for the span the fleet keeps minute data, so
+// every resolution has data at its native granularity.
+function seedHistory(analytics: FleetAnalytics, now: number) {
+  const random = createRandom(6)
+  const end = bucketStart(bucketIndex(now, "minute"), "minute")
+  const minuteFrom = end - FLEET_RETENTION.minute
+  const vehicles = createSeedVehicles(now)
+
+  vehicles.forEach((vehicle, i) => {
+    if (!analytics.names.has(vehicle.id)) analytics.names.set(vehicle.id, vehicle.name)
+    const utilization = (seedUtilization[i]?.utilization ?? 60) / 100
+    const mpg = (vehicle.type === "sedan" ? 24 : 17) + random() * 3
+
+    for (let t = end - SEED_DAYS * DAY_MS; t < end; ) {
+      const stepMs = t >= minuteFrom ? 60_000 : 15 * 60_000
+      const date = new Date(t)
+      // Service runs lighter overnight (Mountain time) and at weekends
+      const hour = (date.getUTCHours() + 17) % 24
+      const weekday = date.getUTCDay()
+      const load = (hour < 5 ? 0.3 : 1) * (weekday === 0 || weekday === 6 ? 0.7 : 1)
+      const active = Math.min(utilization * load * (0.85 + random() * 0.3), 1)
+
+      const seconds = stepMs / 1000
+      const activeSeconds = seconds * active
+      const miles = (activeSeconds / 3600) * (22 + random() * 10)
+      const gallons = miles / mpg
+      addSample(analytics, vehicle.id, {
+        timestamp: t,
+        seconds,
+        activeSeconds,
+        miles,
+        gallons,
+        cost: gallons * (FUEL_PRICE_PER_GALLON + (random() - 0.5) * 0.2),
+      })
+      t += stepMs
+    }
+  })
+}
+
+export function registerVehicleNames(vehicles: { id: string; name: string }[]) {
+  const analytics = getAnalytics()
+  for (const vehicle of vehicles) analytics.names.set(vehicle.id, vehicle.name)
+}
+
+// Turns consecutive telemetry readings into usage samples: distance from
+// speed over the elapsed time, fuel burned from the drop in fuel level.
+// Refuelling (a rise) burns nothing.
+export function recordTelemetry(updates: TelemetryUpdate[]) {
+  if (updates.length === 0) return
+  const analytics = getAnalytics()
+  for (const update of updates) {
+    const previous = analytics.readings.get(update.vehicleId)
+    analytics.readings.set(update.vehicleId, {
+      timestamp: update.timestamp,
+      fuelLevel: update.fuelLevel,
+    })
+    if (!previous) continue
+
+    const elapsed = update.timestamp - previous.timestamp
+    if (elapsed <= 0 || elapsed > MAX_SAMPLE_GAP_MS) continue
+    analytics.liveFrom = Math.min(analytics.liveFrom, previous.timestamp)
+    const seconds = elapsed / 1000
+    const gallons = (Math.max(previous.fuelLevel - update.fuelLevel, 0) / 100) * TANK_GALLONS
+    addSample(analytics, update.vehicleId, {
+      timestamp: update.timestamp,
+      seconds,
+      activeSeconds: update.speed > MOVING_MPH ? seconds : 0,
+      miles: (update.speed * seconds) / 3600,
+      gallons,
+      cost: gallons * FUEL_PRICE_PER_GALLON,
+    })
+  }
+}
+
+// Query results are cached by bucket-aligned range and refreshed rather than
+// recomputed: samples arrive at the newest minute, so everything before the
+// watermark a result was last refreshed at still holds, and only buckets from
+// there on are read again. A range that ended before it is reused as is
+// until a late sample lands inside it. `refresh` gets the previous state and
+// the earliest time that may have changed (-Infinity for a new entry).
+function cached<S>(
+  key: string,
+  end: number,
+  refresh: (previous: S | undefined, dirtyFrom: number) => S
+): S {
+  const analytics = getSeededAnalytics()
+  let entry = analytics.cache.get(key)
+  if (entry) {
+    // Refresh its position for LRU eviction
+    analytics.cache.delete(key)
+    analytics.cache.set(key, entry)
+    if (entry.generation === analytics.generation) return entry.state as S
+    const dirtyFrom = Math.min(
+      entry.dirtyFrom,
+      bucketStart(bucketIndex(entry.watermark, "minute"), "minute")
+    )
+    if (dirtyFrom < end) entry.state = refresh(entry.state as S, dirtyFrom)
+  } else {
+    entry = { state: refresh(undefined, -Infinity), end, generation: 0, watermark: 0, dirtyFrom: 0 }
+    analytics.cache.set(key, entry)
+    if (analytics.cache.size > CACHE_SIZE) {
+      analytics.cache.delete(analytics.cache.keys().next().value!)
+    }
+  }
+  entry.generation = analytics.generation
+  entry.watermark = analytics.watermark
+  entry.dirtyFrom = Infinity
+  return entry.state as S
+}
+
+// Start of the first bucket `refresh` has to read again
+function refreshFrom(series: BucketSeries, from: number, dirtyFrom: number) {
+  const { resolution } = series
+  return Math.max(
+    bucketStart(bucketIndex(from, resolution), resolution),
+    bucketStart(bucketIndex(dirtyFrom, resolution), resolution)
+  )
+}
+
+// A series read, keeping the buckets before the dirty point
+function refreshPoints(
+  series: BucketSeries,
+  metric: SeriesMetric,
+  from: number,
+  to: number,
+  previous: SeriesPoints | undefined,
+  dirtyFrom: number
+): SeriesPoints {
+  const cut = refreshFrom(series, from, dirtyFrom)
+  const tail = series.read(metric, cut, to)
+  if (!previous) return tail
+  let kept = previous.times.length
+  while (kept > 0 && previous.times[kept - 1] >= cut) kept--
+  if (kept === 0) return tail
+
+  const times = new Float64Array(kept + tail.times.length)
+  const values = new Float64Array(kept + tail.times.length)
+  times.set(previous.times.subarray(0, kept))
+  values.set(previous.values.subarray(0, kept))
+  times.set(tail.times, kept)
+  values.set(tail.values, kept)
+  return { times, values }
+}
+
+// Sums over a range as the settled buckets before `cut` plus the rest
+interface RangeSums {
+  resolution: Resolution
+  cut: number
+  prefix: UsageTotals
+  totals: UsageTotals
+}
+
+function refreshSums(
+  series: BucketSeries,
+  from: number,
+  to: number,
+  previous: RangeSums | undefined,
+  dirtyFrom: number
+): RangeSums {
+  const cut = refreshFrom(series, from, dirtyFrom)
+  // Buckets between the old and new cut have not changed since the last
+  // refresh, so they extend the prefix
+  const prefix =
+    previous && previous.resolution === series.resolution && previous.cut <= cut
+      ? series.sum(previous.cut, cut, { ...previous.prefix })
+      : series.sum(from, cut)
+  return {
+    resolution: series.resolution,
+    cut,
+    prefix,
+    totals: series.sum(cut, to, { ...prefix }),
+  }
+}
+
+// The end of the bucket containing the last instant of the range
+function rangeEnd(to: number, resolution: Resolution) {
+  return bucketStart(bucketIndex(to - 1, resolution) + 1, resolution)
+}
+
+export interface AnalyticsRange {
+  from: number
+  to: number
+}
+
+// Reads `range` (a preset) or `from`/`to` (epoch ms) from query parameters.
+// The end is rounded up to the minute so repeated requests share cache keys.
+export function parseAnalyticsRange(params: URLSearchParams): AnalyticsRange | null {
+  const preset = params.get("range")
+  if (preset !== null && !(preset in ANALYTICS_RANGES)) return null
+  const to = params.has("to")
+    ? Number(params.get("to"))
+    : bucketStart(bucketIndex(Date.now(), "minute") + 1, "minute")
+  const from = params.has("from")
+    ? Number(params.get("from"))
+    : to - ANALYTICS_RANGES[(preset ?? "7d") as AnalyticsRangeKey]
+  if (!Number.isFinite(from) || !Number.isFinite(to) || from >= to) return null
+  return { from, to }
+}
+
+export interface SeriesRequest extends AnalyticsRange {
+  metric: SeriesMetric
+  width: number
+  mode: SeriesMode
+  vehicleId?: string
+}
+
+export interface SeriesResponse extends SeriesResult, AnalyticsRange {
+  metric: SeriesMetric
+}
+
+export function getSeries(request: SeriesRequest): SeriesResponse | null {
+  const analytics = getSeededAnalytics()
+  const history = request.vehicleId ? analytics.vehicles.get(request.vehicleId) : analytics.fleet
+  if (!history) return null
+
+  const width = clampSeriesWidth(request.width)
+  const { metric, from, to, mode, vehicleId = "" } = request
+  const resolution = seriesResolution(history, { metric, from, to, width, mode })
+  const series = history.get(resolution)
+  const first = bucketIndex(from, resolution)
+  const last = bucketIndex(to - 1, resolution)
+  const key = `series|${metric}|${vehicleId}|${resolution}|${first}|${last}|${width}`
+
+  const state = cached(
+    key,
+    rangeEnd(to, resolution),
+    (previous: { data: SeriesPoints; points: [number, number][] } | undefined, dirtyFrom) => {
+      const data = refreshPoints(series, metric, from, to, previous?.data, dirtyFrom)
+      return { data, points: pointsForWidth(data, width) }
+    }
+  )
+  return { metric, from, to, resolution, points: state.points }
+}
+
+export interface VehicleUsage {
+  id: string
+  name: string
+  utilization: number
+  miles: number
+  gallons: number
+}
+
+export interface UsageSummary extends AnalyticsRange {
+  totals: UsageTotals & { mpg: number; costPerMile: number }
+  // Most utilized vehicles first
+  vehicles: VehicleUsage[]
+}
+
+// Totals are summed from the finest rollup that covers the range in at most
+// this many buckets
+const SUMMARY_MAX_BUCKETS = 400
+
+// Vehicles are summed at the fleet's resolution or coarser, so every query
+// sharing the fleet's buckets reads the same vehicle buckets too
+function coarser(a: Resolution, b: Resolution) {
+  return RESOLUTIONS.indexOf(a) >= RESOLUTIONS.indexOf(b) ? a : b
+}
+
+interface SummaryState {
+  fleet: RangeSums
+  vehicles: Map<string, RangeSums>
+  summary: Omit<UsageSummary, "from" | "to">
+}
+
+export function getUsageSummary(range: AnalyticsRange, limit = 10): UsageSummary {
+  const analytics = getSeededAnalytics()
+  const { from, to } = range
+  const resolution = analytics.fleet.pick(from, to, SUMMARY_MAX_BUCKETS)
+  const first = bucketIndex(from, resolution)
+  const last = bucketIndex(to - 1, resolution)
+
+  const state = cached(
+    `summary|${resolution}|${first}|${last}|${limit}`,
+    rangeEnd(to, resolution),
+    (previous: SummaryState | undefined, dirtyFrom): SummaryState => {
+      const fleet = refreshSums(analytics.fleet.get(resolution), from, to, previous?.fleet, dirtyFrom)
+      const sums = new Map<string, RangeSums>()
+      const vehicles: VehicleUsage[] = []
+      for (const [id, history] of analytics.vehicles) {
+        const series = history.get(
+          coarser(history.pick(from, to, SUMMARY_MAX_BUCKETS), resolution)
+        )
+        const vehicleSums = refreshSums(series, from, to, previous?.vehicles.get(id), dirtyFrom)
+        sums.set(id, vehicleSums)
+        const usage = vehicleSums.totals
+        if (usage.seconds === 0) continue
+        vehicles.push({
+          id,
+          name: analytics.names.get(id) ?? id,
+          utilization: (usage.activeSeconds / usage.seconds) * 100,
+          miles: usage.miles,
+          gallons: usage.gallons,
+        })
+      }
+      vehicles.sort((a, b) => b.utilization - a.utilization)
+      if (vehicles.length > limit) vehicles.length = limit
+
+      const totals = fleet.totals
+      return {
+        fleet,
+        vehicles: sums,
+        summary: {
+          totals: {
+            ...totals,
+            mpg: totals.gallons > 0 ? totals.miles / totals.gallons : 0,
+            costPerMile: totals.miles > 0 ? totals.cost / totals.miles : 0,
+          },
+          vehicles,
+        },
+      }
+    }
+  )
+  return { from, to, ...state.summary }
+}
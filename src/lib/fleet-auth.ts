@@ -0,0 +1,7 @@
+// Operator routes (telemetry ingest, alert acknowledgment, ride tracking) are
+// open unless FLEET_INGEST_TOKEN is set, in which case they need it as a
+// bearer token.
+export function isAuthorized(request: Request) {
+  const token = process.env.FLEET_INGEST_TOKEN
+  return !token || request.headers.get("authorization") === `Bearer ${token}`
+}
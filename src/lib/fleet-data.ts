@@ -0,0 +1,434 @@
+import type {
+  Alert,
+  Driver,
+  MaintenanceRecord,
+  Trip,
+  UtilizationRecord,
+  Vehicle,
+} from "@/lib/fleet-types"
+
+// Drivers - Mountain Express Colorado
+export const seedDrivers: Driver[] = [
+  {
+    id: "driver-1",
+    name: "Alex M.",
+    phone: "(970) 555-1234",
+    license: "CDL-B",
+    status: "on-trip",
+    rating: 4.9,
+    totalTrips: 456,
+    safetyScore: 98,
+  },
+  {
+    id: "driver-2",
+    name: "Jordan W.",
+    phone: "(970) 555-2345",
+    license: "CDL-B",
+    status: "on-trip",
+    rating: 4.8,
+    totalTrips: 342,
+    safetyScore: 96,
+  },
+  {
+    id: "driver-3",
+    name: "Sam C.",
+    phone: "(970) 555-3456",
+    license: "CDL-B",
+    status: "on-trip",
+    rating: 4.9,
+    totalTrips: 521,
+    safetyScore: 99,
+  },
+  {
+    id: "driver-4",
+    name: "Mike B.",
+    phone: "(970) 555-4567",
+    license: "CDL-B",
+    status: "on-trip",
+    rating: 4.7,
+    totalTrips: 289,
+    safetyScore: 94,
+  },
+  {
+    id: "driver-5",
+    name: "Emma R.",
+    phone: "(970) 555-5678",
+    license: "CDL-B",
+    status: "on-trip",
+    rating: 4.8,
+    totalTrips: 378,
+    safetyScore: 97,
+  },
+  {
+    id: "driver-6",
+    name: "Dan N.",
+    phone: "(970) 555-6789",
+    license: "Class C",
+    status: "available",
+    rating: 4.6,
+    totalTrips: 178,
+    safetyScore: 92,
+  },
+  {
+    id: "driver-7",
+    name: "Lisa T.",
+    phone: "(970) 555-7890",
+    license: "CDL-B",
+    status: "available",
+    rating: 4.5,
+    totalTrips: 234,
+    safetyScore: 91,
+  },
+  {
+    id: "driver-8",
+    name: "Chris M.",
+    phone: "(970) 555-8901",
+    license: "CDL-B",
+    status: "off-duty",
+    rating: 4.7,
+    totalTrips: 412,
+    safetyScore: 95,
+  },
+]
+
+// Vehicles - Mountain Express fleet
+export function createSeedVehicles(now = Date.now()): Vehicle[] {
+  return [
+    {
+      id: "vehicle-1",
+      name: "Express Van 01",
+      type: "van",
+      licensePlate: "CO-SUN-001",
+      status: "active",
+      driver: seedDrivers[0],
+      location: { lat: 39.0639, lng: -108.5506, address: "Grand Junction, CO" },
+      fuelLevel: 78,
+      odometer: 45230,
+      lastUpdate: now,
+      speed: 55,
+      color: "hsl(var(--primary))",
+    },
+    {
+      id: "vehicle-2",
+      name: "Express Van 02",
+      type: "van",
+      licensePlate: "CO-SUN-002",
+      status: "active",
+      driver: seedDrivers[1],
+      location: { lat: 38.4783, lng: -107.8762, address: "Montrose, CO" },
+      fuelLevel: 62,
+      odometer: 32100,
+      lastUpdate: now,
+      speed: 45,
+      color: "hsl(var(--secondary))",
+    },
+    {
+      id: "vehicle-3",
+      name: "Express Van 03",
+      type: "van",
+      licensePlate: "CO-SUN-003",
+      status: "active",
+      driver: seedDrivers[2],
+      location: { lat: 37.9375, lng: -107.8123, address: "Telluride, CO" },
+      fuelLevel: 85,
+      odometer: 28750,
+      lastUpdate: now,
+      speed: 35,
+      color: "hsl(199 89% 48%)",
+    },
+    {
+      id: "vehicle-4",
+      name: "Express Van 04",
+      type: "van",
+      licensePlate: "CO-SUN-004",
+      status: "active",
+      driver: seedDrivers[3],
+      location: { lat: 39.6403, lng: -106.3742, address: "Vail, CO" },
+      fuelLevel: 45,
+      odometer: 52300,
+      lastUpdate: now,
+      speed: 60,
+      color: "hsl(212 90% 52%)",
+    },
+    {
+      id: "vehicle-5",
+      name: "Express Sedan 01",
+      type: "sedan",
+      licensePlate: "CO-SUN-005",
+      status: "maintenance",
+      location: { lat: 39.7392, lng: -104.9903, address: "Denver Service Center" },
+      fuelLevel: 35,
+      odometer: 67200,
+      lastUpdate: now - 86400000,
+      speed: 0,
+      color: "hsl(var(--warning))",
+    },
+    {
+      id: "vehicle-6",
+      name: "Express Sedan 02",
+      type: "sedan",
+      licensePlate: "CO-SUN-006",
+      status: "idle",
+      driver: seedDrivers[5],
+      location: { lat: 39.1911, lng: -106.8175, address: "Aspen Depot" },
+      fuelLevel: 92,
+      odometer: 18500,
+      lastUpdate: now,
+      speed: 0,
+      color: "hsl(225 73% 57%)",
+    },
+    {
+      id: "vehicle-7",
+      name: "Express Accessible 01",
+      type: "accessible",
+      licensePlate: "CO-SUN-007",
+      status: "active",
+      driver: seedDrivers[4],
+      location: { lat: 39.0639, lng: -108.5506, address: "Grand Junction, CO" },
+      fuelLevel: 68,
+      odometer: 38900,
+      lastUpdate: now,
+      speed: 42,
+      color: "hsl(var(--info))",
+    },
+    {
+      id: "vehicle-8",
+      name: "Express Accessible 02",
+      type: "accessible",
+      licensePlate: "CO-SUN-008",
+      status: "idle",
+      driver: seedDrivers[6],
+      location: { lat: 39.7392, lng: -104.9903, address: "Denver Hub" },
+      fuelLevel: 55,
+      odometer: 24600,
+      lastUpdate: now,
+      speed: 0,
+      color: "hsl(251 91% 67%)",
+    },
+  ]
+}
+
+// Trips - Colorado routes
+export function createSeedTrips(now = Date.now()): Trip[] {
+  return [
+    {
+      id: "trip-1",
+      vehicleId: "vehicle-1",
+      vehicleName: "Express Van 01",
+      driverId: "driver-1",
+      driverName: "Alex M.",
+      startLocation: "Grand Junction Airport",
+      endLocation: "Telluride Mountain Village",
+      startTime: now - 3600000,
+      distance: 124.5,
+      fuelUsed: 8.2,
+      status: "in-progress",
+    },
+    {
+      id: "trip-2",
+      vehicleId: "vehicle-2",
+      vehicleName: "Express Van 02",
+      driverId: "driver-2",
+      driverName: "Jordan W.",
+      startLocation: "Montrose Regional Airport",
+      endLocation: "Black Canyon Resort",
+      startTime: now - 7200000,
+      distance: 45.3,
+      fuelUsed: 3.8,
+      status: "in-progress",
+    },
+    {
+      id: "trip-3",
+      vehicleId: "vehicle-3",
+      vehicleName: "Express Van 03",
+      driverId: "driver-3",
+      driverName: "Sam C.",
+      startLocation: "Telluride Ski Resort",
+      endLocation: "Mountain Village Plaza",
+      startTime: now - 1800000,
+      distance: 8.1,
+      fuelUsed: 0.6,
+      status: "in-progress",
+    },
+    {
+      id: "trip-4",
+      vehicleId: "vehicle-4",
+      vehicleName: "Express Van 04",
+      driverId: "driver-4",
+      driverName: "Mike B.",
+      startLocation: "Vail Village",
+      endLocation: "Denver International Airport",
+      startTime: now - 14400000,
+      endTime: now - 10800000,
+      distance: 115.8,
+      fuelUsed: 7.2,
+      status: "completed",
+    },
+    {
+      id: "trip-5",
+      vehicleId: "vehicle-7",
+      vehicleName: "Express Accessible 01",
+      driverId: "driver-5",
+      driverName: "Emma R.",
+      startLocation: "Grand Junction Medical Center",
+      endLocation: "Mesa County Senior Center",
+      startTime: now - 5400000,
+      distance: 12.7,
+      fuelUsed: 1.3,
+      status: "in-progress",
+    },
+  ]
+}
+
+// The rider's ride shown on the tracking page, tracked from startup like the
+// in-progress trips
+export const seedActiveRide = {
+  id: "RIDE-2847",
+  vehicleId: "vehicle-7",
+  pickup: "Grand Junction Medical Center",
+  dropoff: "1247 Patterson Road, Grand Junction",
+}
+
+// Maintenance Records
+export function createSeedMaintenance(now = Date.now()): MaintenanceRecord[] {
+  return [
+    {
+      id: "maint-1",
+      vehicleId: "vehicle-5",
+      vehicleName: "Express Sedan 01",
+      type: "repair",
+      scheduledDate: now - 86400000,
+      status: "overdue",
+      cost: 1250,
+      notes: "Transmission service needed",
+    },
+    {
+      id: "maint-2",
+      vehicleId: "vehicle-1",
+      vehicleName: "Express Van 01",
+      type: "oil-change",
+      scheduledDate: now + 172800000,
+      status: "scheduled",
+      cost: 85,
+      notes: "Regular 5000 mile service",
+    },
+    {
+      id: "maint-3",
+      vehicleId: "vehicle-2",
+      vehicleName: "Express Van 02",
+      type: "tire-rotation",
+      scheduledDate: now + 432000000,
+      status: "scheduled",
+      cost: 60,
+      notes: "Mountain driving wear check",
+    },
+    {
+      id: "maint-4",
+      vehicleId: "vehicle-8",
+      vehicleName: "Express Accessible 02",
+      type: "inspection",
+      scheduledDate: now - 259200000,
+      status: "overdue",
+      cost: 150,
+      notes: "Wheelchair lift inspection",
+    },
+    {
+      id: "maint-5",
+      vehicleId: "vehicle-3",
+      vehicleName: "Express Van 03",
+      type: "brake-service",
+      scheduledDate: now + 604800000,
+      status: "scheduled",
+      cost: 320,
+      notes: "Mountain brake check",
+    },
+    {
+      id: "maint-6",
+      vehicleId: "vehicle-4",
+      vehicleName: "Express Van 04",
+      type: "oil-change",
+      scheduledDate: now - 604800000,
+      status: "completed",
+      cost: 65,
+      notes: "Completed on schedule",
+    },
+  ]
+}
+
+// Alerts
+export function createSeedAlerts(now = Date.now()): Alert[] {
+  return [
+    {
+      id: "alert-1",
+      vehicleId: "vehicle-4",
+      vehicleName: "Express Van 04",
+      type: "speeding",
+      message: "Vehicle exceeded 65 mph on I-70 mountain corridor",
+      timestamp: now - 1800000,
+      severity: "medium",
+      acknowledged: false,
+    },
+    {
+      id: "alert-2",
+      vehicleId: "vehicle-5",
+      vehicleName: "Express Sedan 01",
+      type: "maintenance",
+      message: "Overdue for transmission service",
+      timestamp: now - 86400000,
+      severity: "high",
+      acknowledged: false,
+    },
+    {
+      id: "alert-3",
+      vehicleId: "vehicle-2",
+      vehicleName: "Express Van 02",
+      type: "fuel-low",
+      message: "Fuel level at 45% - recommend refuel in Montrose",
+      timestamp: now - 3600000,
+      severity: "medium",
+      acknowledged: false,
+    },
+    {
+      id: "alert-4",
+      vehicleId: "vehicle-3",
+      vehicleName: "Express Van 03",
+      type: "geofence",
+      message: "Entering Telluride mountain zone",
+      timestamp: now - 7200000,
+      severity: "low",
+      acknowledged: true,
+    },
+    {
+      id: "alert-5",
+      vehicleId: "vehicle-1",
+      vehicleName: "Express Van 01",
+      type: "harsh-braking",
+      message: "Harsh braking event on Highway 145",
+      timestamp: now - 900000,
+      severity: "low",
+      acknowledged: false,
+    },
+    {
+      id: "alert-6",
+      vehicleId: "vehicle-8",
+      vehicleName: "Express Accessible 02",
+      type: "maintenance",
+      message: "Wheelchair lift inspection overdue",
+      timestamp: now - 259200000,
+      severity: "high",
+      acknowledged: false,
+    },
+  ]
+}
+
+// Utilization Data
+export const seedUtilization: UtilizationRecord[] = [
+  { name: "Express Van 01", utilization: 87, trips: 42, miles: 1250 },
+  { name: "Express Van 02", utilization: 72, trips: 38, miles: 890 },
+  { name: "Express Van 03", utilization: 81, trips: 45, miles: 1120 },
+  { name: "Express Van 04", utilization: 78, trips: 36, miles: 1080 },
+  { name: "Express Sedan 01", utilization: 12, trips: 5, miles: 180 },
+  { name: "Express Sedan 02", utilization: 65, trips: 28, miles: 420 },
+  { name: "Accessible 01", utilization: 68, trips: 32, miles: 680 },
+  { name: "Accessible 02", utilization: 45, trips: 22, miles: 310 },
+]
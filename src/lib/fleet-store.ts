@@ -0,0 +1,301 @@
+import type {
+  Alert,
+  Driver,
+  MaintenanceRecord,
+  TelemetryUpdate,
+  Trip,
+  Vehicle,
+} from "@/lib/fleet-types"
+
+type Listener = () => void
+
+// Alerts kept by the server's alert engine, and by each dashboard
+export const ALERT_HISTORY_SIZE = 1000
+
+// Collects listeners while a batch is open so a burst of changes (e.g. one
+// telemetry frame) notifies each subscriber at most once.
+class Notifier {
+  private depth = 0
+  private readonly pending = new Set<Listener>()
+
+  batch(fn: () => void) {
+    this.depth++
+    try {
+      fn()
+    } finally {
+      if (--this.depth === 0) {
+        const listeners = Array.from(this.pending)
+        this.pending.clear()
+        for (const listener of listeners) listener()
+      }
+    }
+  }
+
+  emit(listeners: Set<Listener> | undefined) {
+    if (!listeners) return
+    if (this.depth > 0) {
+      for (const listener of listeners) this.pending.add(listener)
+      return
+    }
+    for (const listener of Array.from(listeners)) listener()
+  }
+}
+
+const ALL_BUCKET = "*"
+const EMPTY_IDS: readonly string[] = []
+
+function bucketId(index: string, key: string) {
+  return `${index}:${key}`
+}
+
+// Entities keyed by id, with secondary indexes that map an index key (e.g.
+// status "active") to the set of matching ids. Writes only touch the buckets
+// whose membership changed, so counts stay O(1) and subscribers to other
+// buckets or other entities are never notified.
+export class EntityTable<T extends { id: string }, I extends string = never> {
+  private readonly entities = new Map<string, T>()
+  private readonly buckets = new Map<string, Set<string>>()
+  private readonly snapshots = new Map<string, readonly string[]>()
+  private readonly entityListeners = new Map<string, Set<Listener>>()
+  private readonly bucketListeners = new Map<string, Set<Listener>>()
+  private readonly tableListeners = new Set<Listener>()
+  private readonly indexes: [I, (entity: T) => string | undefined][]
+
+  constructor(
+    indexes: Record<I, (entity: T) => string | undefined>,
+    private readonly notifier = new Notifier()
+  ) {
+    this.indexes = Object.entries(indexes) as [I, (entity: T) => string | undefined][]
+  }
+
+  get size() {
+    return this.entities.size
+  }
+
+  get(id: string) {
+    return this.entities.get(id)
+  }
+
+  // Stable array of ids in a bucket; the same array is returned until the
+  // bucket's membership changes.
+  ids(index?: I, key?: string): readonly string[] {
+    const id = index === undefined || key === undefined ? ALL_BUCKET : bucketId(index, key)
+    let snapshot = this.snapshots.get(id)
+    if (!snapshot) {
+      const bucket = this.buckets.get(id)
+      if (!bucket || bucket.size === 0) return EMPTY_IDS
+      snapshot = Array.from(bucket)
+      this.snapshots.set(id, snapshot)
+    }
+    return snapshot
+  }
+
+  count(index?: I, key?: string) {
+    if (index === undefined || key === undefined) return this.entities.size
+    return this.buckets.get(bucketId(index, key))?.size ?? 0
+  }
+
+  upsert(entity: T) {
+    const prev = this.entities.get(entity.id)
+    this.entities.set(entity.id, entity)
+
+    if (!prev) this.addToBucket(ALL_BUCKET, entity.id)
+
+    for (const [index, keyOf] of this.indexes) {
+      const nextKey = keyOf(entity)
+      const prevKey = prev ? keyOf(prev) : undefined
+      if (prev && nextKey === prevKey) continue
+      if (prevKey !== undefined) this.removeFromBucket(bucketId(index, prevKey), entity.id)
+      if (nextKey !== undefined) this.addToBucket(bucketId(index, nextKey), entity.id)
+    }
+
+    this.notifier.emit(this.entityListeners.get(entity.id))
+    this.notifier.emit(this.tableListeners)
+  }
+
+  upsertMany(entities: Iterable<T>) {
+    this.notifier.batch(() => {
+      for (const entity of entities) this.upsert(entity)
+    })
+  }
+
+  patch(id: string, changes: Partial<T> | ((entity: T) => T)) {
+    const entity = this.entities.get(id)
+    if (!entity) return false
+    this.upsert(typeof changes === "function" ? changes(entity) : { ...entity, ...changes })
+    return true
+  }
+
+  remove(id: string) {
+    const entity = this.entities.get(id)
+    if (!entity) return false
+    this.entities.delete(id)
+    this.removeFromBucket(ALL_BUCKET, id)
+    for (const [index, keyOf] of this.indexes) {
+      const key = keyOf(entity)
+      if (key !== undefined) this.removeFromBucket(bucketId(index, key), id)
+    }
+    this.notifier.emit(this.entityListeners.get(id))
+    this.notifier.emit(this.tableListeners)
+    return true
+  }
+
+  // Fires on any write; for consumers that redraw the whole table (e.g. the
+  // canvas map) rather than rendering per-entity components
+  subscribe(listener: Listener) {
+    this.tableListeners.add(listener)
+    return () => {
+      this.tableListeners.delete(listener)
+    }
+  }
+
+  subscribeEntity(id: string, listener: Listener) {
+    return this.addListener(this.entityListeners, id, listener)
+  }
+
+  subscribeIds(listener: Listener, index?: I, key?: string) {
+    const id = index === undefined || key === undefined ? ALL_BUCKET : bucketId(index, key)
+    return this.addListener(this.bucketListeners, id, listener)
+  }
+
+  private addToBucket(id: string, entityId: string) {
+    let bucket = this.buckets.get(id)
+    if (!bucket) {
+      bucket = new Set()
+      this.buckets.set(id, bucket)
+    }
+    bucket.add(entityId)
+    this.snapshots.delete(id)
+    this.notifier.emit(this.bucketListeners.get(id))
+  }
+
+  private removeFromBucket(id: string, entityId: string) {
+    if (!this.buckets.get(id)?.delete(entityId)) return
+    this.snapshots.delete(id)
+    this.notifier.emit(this.bucketListeners.get(id))
+  }
+
+  private addListener(registry: Map<string, Set<Listener>>, id: string, listener: Listener) {
+    let listeners = registry.get(id)
+    if (!listeners) {
+      listeners = new Set()
+      registry.set(id, listeners)
+    }
+    listeners.add(listener)
+    return () => {
+      listeners.delete(listener)
+      if (listeners.size === 0) registry.delete(id)
+    }
+  }
+}
+
+export interface FleetSeed {
+  drivers?: Driver[]
+  vehicles?: Vehicle[]
+  trips?: Trip[]
+  maintenance?: MaintenanceRecord[]
+  alerts?: Alert[]
+}
+
+export class FleetStore {
+  private readonly notifier = new Notifier()
+
+  readonly drivers = new EntityTable<Driver, "status">(
+    { status: (driver) => driver.status },
+    this.notifier
+  )
+
+  readonly vehicles = new EntityTable<Vehicle, "status" | "type" | "driver">(
+    {
+      status: (vehicle) => vehicle.status,
+      type: (vehicle) => vehicle.type,
+      driver: (vehicle) => vehicle.driver?.id,
+    },
+    this.notifier
+  )
+
+  readonly trips = new EntityTable<Trip, "status" | "vehicle" | "driver">(
+    {
+      status: (trip) => trip.status,
+      vehicle: (trip) => trip.vehicleId,
+      driver: (trip) => trip.driverId,
+    },
+    this.notifier
+  )
+
+  readonly maintenance = new EntityTable<MaintenanceRecord, "status" | "vehicle">(
+    {
+      status: (record) => record.status,
+      vehicle: (record) => record.vehicleId,
+    },
+    this.notifier
+  )
+
+  // Alerts are indexed by open/acknowledged and by severity of open alerts,
+  // which are the two counts the dashboard badges show.
+  readonly alerts = new EntityTable<Alert, "status" | "openSeverity" | "vehicle">(
+    {
+      status: (alert) => (alert.acknowledged ? "acknowledged" : "open"),
+      openSeverity: (alert) => (alert.acknowledged ? undefined : alert.severity),
+      vehicle: (alert) => alert.vehicleId,
+    },
+    this.notifier
+  )
+
+  constructor(seed: FleetSeed = {}) {
+    this.load(seed)
+  }
+
+  batch(fn: () => void) {
+    this.notifier.batch(fn)
+  }
+
+  load({ drivers = [], vehicles = [], trips = [], maintenance = [], alerts = [] }: FleetSeed) {
+    this.batch(() => {
+      this.drivers.upsertMany(drivers)
+      this.vehicles.upsertMany(vehicles)
+      this.trips.upsertMany(trips)
+      this.maintenance.upsertMany(maintenance)
+      // Oldest first, so bucket order matches arrival order of later alerts
+      this.alerts.upsertMany([...alerts].sort((a, b) => a.timestamp - b.timestamp))
+    })
+  }
+
+  applyTelemetry(updates: TelemetryUpdate[]) {
+    this.batch(() => {
+      for (const update of updates) {
+        this.vehicles.patch(update.vehicleId, (vehicle) => ({
+          ...vehicle,
+          location: { ...vehicle.location, lat: update.lat, lng: update.lng },
+          speed: update.speed,
+          fuelLevel: update.fuelLevel,
+          lastUpdate: update.timestamp,
+        }))
+      }
+    })
+  }
+
+  // New or changed alerts from the server, oldest first. Like the server's
+  // history, only the newest ALERT_HISTORY_SIZE alerts are kept.
+  applyAlerts(alerts: Alert[]) {
+    this.batch(() => {
+      this.alerts.upsertMany(alerts)
+      const ids = this.alerts.ids()
+      for (let i = 0; i < ids.length - ALERT_HISTORY_SIZE; i++) {
+        this.alerts.remove(ids[i])
+      }
+    })
+  }
+
+  acknowledgeAlert(id: string) {
+    this.alerts.patch(id, { acknowledged: true })
+  }
+
+  acknowledgeAllAlerts() {
+    this.batch(() => {
+      for (const id of this.alerts.ids("status", "open")) {
+        this.acknowledgeAlert(id)
+      }
+    })
+  }
+}
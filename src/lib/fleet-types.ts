@@ -0,0 +1,90 @@
+// Shared fleet domain types used by the dashboard, route handlers and simulator
+
+export interface Driver {
+  id: string
+  name: string
+  phone: string
+  license: string
+  status: "available" | "on-trip" | "off-duty"
+  rating: number
+  avatar?: string
+  totalTrips: number
+  safetyScore: number
+}
+
+export interface Vehicle {
+  id: string
+  name: string
+  type: "van" | "sedan" | "accessible"
+  licensePlate: string
+  status: "active" | "idle" | "maintenance" | "offline"
+  driver?: Driver
+  location: { lat: number; lng: number; address: string }
+  fuelLevel: number
+  odometer: number
+  lastUpdate: number
+  speed: number
+  color: string
+}
+
+export interface Trip {
+  id: string
+  vehicleId: string
+  vehicleName: string
+  driverId: string
+  driverName: string
+  startLocation: string
+  endLocation: string
+  startTime: number
+  endTime?: number
+  distance: number
+  fuelUsed: number
+  status: "in-progress" | "completed" | "cancelled"
+}
+
+export interface MaintenanceRecord {
+  id: string
+  vehicleId: string
+  vehicleName: string
+  type: "oil-change" | "tire-rotation" | "inspection" | "repair" | "brake-service"
+  scheduledDate: number
+  status: "scheduled" | "completed" | "overdue"
+  cost?: number
+  notes?: string
+}
+
+export interface Alert {
+  id: string
+  vehicleId: string
+  vehicleName: string
+  type: "speeding" | "idle" | "maintenance" | "geofence" | "fuel-low" | "harsh-braking"
+  message: string
+  timestamp: number
+  severity: "low" | "medium" | "high"
+  acknowledged: boolean
+  // Times the condition recurred within the dedup window; 1 when omitted
+  occurrences?: number
+}
+
+export interface UtilizationRecord {
+  name: string
+  utilization: number
+  trips: number
+  miles: number
+}
+
+// A single position/speed/fuel change for one vehicle. Only these fields move
+// at telemetry rate, so they are all the stream carries.
+export interface TelemetryUpdate {
+  vehicleId: string
+  lat: number
+  lng: number
+  speed: number
+  fuelLevel: number
+  timestamp: number
+  // Set by sources that know the road; otherwise inferred from speed zones
+  roadClass?: RoadClass
+}
+
+// Speed limits are set per road class
+export type RoadClass = "highway" | "arterial" | "local"
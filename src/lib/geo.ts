@@ -0,0 +1,40 @@
+// Web Mercator helpers. World coordinates are normalized to [0, 1] on both
+// axes; multiply by TILE_SIZE * 2^zoom to get pixels at a zoom level.
+
+export const TILE_SIZE = 256
+
+const EARTH_RADIUS_MILES = 3958.8
+const MAX_LATITUDE = 85.05112878
+
+export interface LatLng {
+  lat: number
+  lng: number
+}
+
+export function lngToWorldX(lng: number) {
+  return (lng + 180) / 360
+}
+
+export function latToWorldY(lat: number) {
+  const clamped = Math.max(-MAX_LATITUDE, Math.min(MAX_LATITUDE, lat))
+  const sin = Math.sin((clamped * Math.PI) / 180)
+  return 0.5 - Math.log((1 + sin) / (1 - sin)) / (4 * Math.PI)
+}
+
+export function worldXToLng(x: number) {
+  return x * 360 - 180
+}
+
+export function worldYToLat(y: number) {
+  const n = Math.PI - 2 * Math.PI * y
+  return (180 / Math.PI) * Math.atan(Math.sinh(n))
+}
+
+export function haversineMiles(a: LatLng, b: LatLng) {
+  const dLat = ((b.lat - a.lat) * Math.PI) / 180
+  const dLng = ((b.lng - a.lng) * Math.PI) / 180
+  const h =
+    Math.sin(dLat / 2) ** 2 +
+    Math.cos((a.lat * Math.PI) / 180) * Math.cos((b.lat * Math.PI) / 180) * Math.sin(dLng / 2) ** 2
+  return 2 * EARTH_RADIUS_MILES * Math.asin(Math.sqrt(h))
+}
@@ -0,0 +1,83 @@
+import type { RoadClass } from "@/lib/fleet-types"
+import type { LatLng } from "@/lib/geo"
+import { SERVICE_HUBS, type Place } from "@/lib/places"
+import { PolygonIndex } from "@/lib/polygon-index"
+
+// Without a road network, a vehicle's road class is taken from the zone it is
+// in: resort villages are local streets, towns are arterials, and everything
+// else is highway.
+export interface Zone {
+  id: string
+  name: string
+  kind: "ski-resort" | "town"
+  roadClass: RoadClass
+  polygon: LatLng[]
+}
+
+const MILES_PER_DEGREE_LAT = 69
+
+// Regular polygon approximating a circle of `radiusMiles` around a place
+function ringAround({ lat, lng }: LatLng, radiusMiles: number, sides = 8): LatLng[] {
+  const dLat = radiusMiles / MILES_PER_DEGREE_LAT
+  const dLng = dLat / Math.cos((lat * Math.PI) / 180)
+  return Array.from({ length: sides }, (_, i) => {
+    const angle = (i / sides) * Math.PI * 2
+    return { lat: lat + dLat * Math.cos(angle), lng: lng + dLng * Math.sin(angle) }
+  })
+}
+
+const SKI_RESORTS: Place[] = [
+  { name: "Vail", lat: 39.6061, lng: -106.355 },
+  { name: "Beaver Creek", lat: 39.6042, lng: -106.5165 },
+  { name: "Breckenridge", lat: 39.4817, lng: -106.0384 },
+  { name: "Keystone", lat: 39.6045, lng: -105.9548 },
+  { name: "Copper Mountain", lat: 39.5022, lng: -106.1497 },
+  { name: "Aspen Mountain", lat: 39.1864, lng: -106.8182 },
+  { name: "Snowmass", lat: 39.2084, lng: -106.949 },
+  { name: "Telluride", lat: 37.9363, lng: -107.8466 },
+  { name: "Crested Butte", lat: 38.8991, lng: -106.9651 },
+  { name: "Winter Park", lat: 39.8868, lng: -105.7625 },
+  { name: "Steamboat", lat: 40.4572, lng: -106.8045 },
+  { name: "Purgatory", lat: 37.6303, lng: -107.814 },
+]
+
+const slug = (name: string) => name.toLowerCase().replace(/[^a-z0-9]+/g, "-")
+
+// Ski resort geofences, plus town speed zones around each service hub
+export const FLEET_ZONES: Zone[] = [
+  ...SKI_RESORTS.map((resort) => ({
+    id: `resort-${slug(resort.name)}`,
+    name: resort.name,
+    kind: "ski-resort" as const,
+    roadClass: "local" as const,
+    polygon: ringAround(resort, 2),
+  })),
+  ...SERVICE_HUBS.map((hub) => ({
+    id: `town-${slug(hub.name)}`,
+    name: hub.name,
+    kind: "town" as const,
+    roadClass: "arterial" as const,
+    polygon: ringAround(hub, 4),
+  })),
+]
+
+const ROAD_CLASS_RANK: Record<RoadClass, number> = { highway: 0, arterial: 1, local: 2 }
+
+export function isRoadClass(value: unknown): value is RoadClass {
+  return typeof value === "string" && Object.hasOwn(ROAD_CLASS_RANK, value)
+}
+
+export function createZoneIndex(zones: Zone[] = FLEET_ZONES) {
+  const index = new PolygonIndex<Zone>()
+  for (const zone of zones) index.insert(zone.polygon, zone)
+  return index
+}
+
+// The most restrictive road class among the zones containing a point
+export function roadClassIn(zones: Zone[]): RoadClass {
+  let roadClass: RoadClass = "highway"
+  for (const zone of zones) {
+    if (ROAD_CLASS_RANK[zone.roadClass] > ROAD_CLASS_RANK[roadClass]) roadClass = zone.roadClass
+  }
+  return roadClass
+}
@@ -0,0 +1,56 @@
+// Largest-Triangle-Three-Buckets downsampling (Steinarsson, 2013). Picks
+// `threshold` of the points so the line keeps its visual shape: the first and
+// last points are always kept, and from each bucket in between the point that
+// forms the largest triangle with the previous pick and the next bucket's
+// average. Returns the indices of the kept points, in order.
+// `threshold` below 3 is treated as 3.
+export function lttb(xs: ArrayLike<number>, ys: ArrayLike<number>, threshold: number): Uint32Array {
+  const length = xs.length
+  threshold = Math.max(Math.floor(threshold), 3)
+  if (threshold >= length) {
+    const all = new Uint32Array(length)
+    for (let i = 0; i < length; i++) all[i] = i
+    return all
+  }
+
+  const picked = new Uint32Array(threshold)
+  const bucketSize = (length - 2) / (threshold - 2)
+  let previous = 0
+  picked[0] = 0
+
+  for (let bucket = 0; bucket < threshold - 2; bucket++) {
+    // Average of the next bucket, the third triangle corner
+    const nextStart = Math.floor((bucket + 1) * bucketSize) + 1
+    const nextEnd = Math.min(Math.floor((bucket + 2) * bucketSize) + 1, length)
+    let averageX = 0
+    let averageY = 0
+    for (let i = nextStart; i < nextEnd; i++) {
+      averageX += xs[i]
+      averageY += ys[i]
+    }
+    const nextCount = Math.max(nextEnd - nextStart, 1)
+    averageX /= nextCount
+    averageY /= nextCount
+
+    const start = Math.floor(bucket * bucketSize) + 1
+    const end = Math.floor((bucket + 1) * bucketSize) + 1
+    const previousX = xs[previous]
+    const previousY = ys[previous]
+    let maxArea = -1
+    let chosen = start
+    for (let i = start; i < end; i++) {
+      const area = Math.abs(
+        (previousX - averageX) * (ys[i] - previousY) - (previousX - xs[i]) * (averageY - previousY)
+      )
+      if (area > maxArea) {
+        maxArea = area
+        chosen = i
+      }
+    }
+    picked[bucket + 1] = chosen
+    previous = chosen
+  }
+
+  picked[threshold - 1] = length - 1
+  return picked
+}
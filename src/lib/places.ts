@@ -0,0 +1,64 @@
+import type { LatLng } from "@/lib/geo"
+
+export interface Place {
+  name: string
+  lat: number
+  lng: number
+}
+
+// Mountain Express service hubs
+export const SERVICE_HUBS: Place[] = [
+  { name: "Grand Junction", lat: 39.0639, lng: -108.5506 },
+  { name: "Montrose", lat: 38.4783, lng: -107.8762 },
+  { name: "Telluride", lat: 37.9375, lng: -107.8123 },
+  { name: "Vail", lat: 39.6403, lng: -106.3742 },
+  { name: "Aspen", lat: 39.1911, lng: -106.8175 },
+  { name: "Denver", lat: 39.7392, lng: -104.9903 },
+]
+
+// Bounding box of the Western Slope and Front Range service area
+export const SERVICE_AREA_BOUNDS = {
+  minLat: 37.0,
+  maxLat: 40.6,
+  minLng: -109.0,
+  maxLng: -104.6,
+}
+
+// Named pickup and dropoff points used by rides and trips
+export const LANDMARKS: Place[] = [
+  { name: "Grand Junction Medical Center", lat: 39.0887, lng: -108.5616 },
+  { name: "1247 Patterson Road, Grand Junction", lat: 39.0896, lng: -108.5229 },
+  { name: "Grand Junction Airport", lat: 39.1224, lng: -108.5267 },
+  { name: "Mesa County Senior Center", lat: 39.0683, lng: -108.5647 },
+  { name: "Montrose Regional Hospital", lat: 38.4877, lng: -107.8656 },
+  { name: "245 S Cascade Ave, Montrose", lat: 38.4757, lng: -107.8806 },
+  { name: "Montrose Regional Airport", lat: 38.5098, lng: -107.8938 },
+  { name: "Black Canyon Resort", lat: 38.5754, lng: -107.7416 },
+  { name: "Telluride Town Park", lat: 37.9353, lng: -107.8036 },
+  { name: "Telluride Ski Resort", lat: 37.9363, lng: -107.8466 },
+  { name: "Telluride Mountain Village", lat: 37.9331, lng: -107.8493 },
+  { name: "Mountain Village Center", lat: 37.9364, lng: -107.8466 },
+  { name: "Mountain Village Plaza", lat: 37.9350, lng: -107.8480 },
+  { name: "Vail Village", lat: 39.6403, lng: -106.3742 },
+  { name: "Vail Medical Center", lat: 39.6417, lng: -106.3770 },
+  { name: "392 E Lionshead Circle, Vail", lat: 39.6431, lng: -106.3893 },
+  { name: "Aspen Valley Hospital", lat: 39.2032, lng: -106.8359 },
+  { name: "Denver International Airport", lat: 39.8561, lng: -104.6737 },
+  { name: "1600 Broadway, Denver", lat: 39.7420, lng: -104.9875 },
+]
+
+const PLACES_BY_NAME = new Map(
+  [...SERVICE_HUBS, ...LANDMARKS].map((place) => [place.name.toLowerCase(), place])
+)
+
+export function findPlace(name: string): Place | undefined {
+  return PLACES_BY_NAME.get(name.trim().toLowerCase())
+}
+
+// A place name or a { lat, lng } position, as accepted by the ride APIs
+export function parseLocation(value: unknown): LatLng | undefined {
+  if (typeof value === "string") return findPlace(value)
+  if (typeof value !== "object" || value === null) return undefined
+  const { lat, lng } = value as Record<string, unknown>
+  return typeof lat === "number" && typeof lng === "number" ? { lat, lng } : undefined
+}
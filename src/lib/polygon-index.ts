@@ -0,0 +1,79 @@
+import type { LatLng } from "@/lib/geo"
+
+export interface IndexedPolygon<T> {
+  // Vertices in order; the ring is closed implicitly
+  points: LatLng[]
+  data: T
+  minLat: number
+  maxLat: number
+  minLng: number
+  maxLng: number
+}
+
+// Ray casting: count crossings of a ray going east from the point
+export function pointInPolygon(lat: number, lng: number, points: LatLng[]) {
+  let inside = false
+  for (let i = 0, j = points.length - 1; i < points.length; j = i++) {
+    const a = points[i]
+    const b = points[j]
+    if (a.lat > lat !== b.lat > lat) {
+      const crossLng = a.lng + ((lat - a.lat) / (b.lat - a.lat)) * (b.lng - a.lng)
+      if (lng < crossLng) inside = !inside
+    }
+  }
+  return inside
+}
+
+// Uniform grid over polygon bounding boxes. A point lookup reads one cell
+// and only runs the exact point-in-polygon test on the few polygons whose
+// boxes overlap it, so checking a vehicle against every zone is O(1) no
+// matter how many zones there are.
+export class PolygonIndex<T> {
+  private readonly cells = new Map<string, IndexedPolygon<T>[]>()
+  private count = 0
+
+  constructor(private readonly cellDegrees = 0.1) {}
+
+  get size() {
+    return this.count
+  }
+
+  insert(points: LatLng[], data: T) {
+    const polygon: IndexedPolygon<T> = {
+      points,
+      data,
+      minLat: Math.min(...points.map((point) => point.lat)),
+      maxLat: Math.max(...points.map((point) => point.lat)),
+      minLng: Math.min(...points.map((point) => point.lng)),
+      maxLng: Math.max(...points.map((point) => point.lng)),
+    }
+    const [minRow, minCol] = this.cellOf(polygon.minLat, polygon.minLng)
+    const [maxRow, maxCol] = this.cellOf(polygon.maxLat, polygon.maxLng)
+    for (let row = minRow; row <= maxRow; row++) {
+      for (let col = minCol; col <= maxCol; col++) {
+        const key = `${row}:${col}`
+        const cell = this.cells.get(key)
+        if (cell) cell.push(polygon)
+        else this.cells.set(key, [polygon])
+      }
+    }
+    this.count++
+  }
+
+  // Data of every polygon containing the point
+  query(lat: number, lng: number, out: T[] = []): T[] {
+    const [row, col] = this.cellOf(lat, lng)
+    const cell = this.cells.get(`${row}:${col}`)
+    if (!cell) return out
+    for (const polygon of cell) {
+      if (lat < polygon.minLat || lat > polygon.maxLat) continue
+      if (lng < polygon.minLng || lng > polygon.maxLng) continue
+      if (pointInPolygon(lat, lng, polygon.points)) out.push(polygon.data)
+    }
+    return out
+  }
+
+  private cellOf(lat: number, lng: number): [number, number] {
+    return [Math.floor(lat / this.cellDegrees), Math.floor(lng / this.cellDegrees)]
+  }
+}
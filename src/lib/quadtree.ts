@@ -0,0 +1,113 @@
+export interface QuadtreePoint<T> {
+  x: number
+  y: number
+  data: T
+}
+
+const MAX_DEPTH = 12
+
+// Point quadtree for range and nearest-neighbour queries. Built once per data
+// change and queried many times (hit-testing, viewport culling).
+export class Quadtree<T> {
+  private points: QuadtreePoint<T>[] = []
+  private children: Quadtree<T>[] | null = null
+
+  constructor(
+    readonly minX: number,
+    readonly minY: number,
+    readonly maxX: number,
+    readonly maxY: number,
+    private readonly capacity = 16,
+    private readonly depth = 0
+  ) {}
+
+  insert(point: QuadtreePoint<T>): boolean {
+    if (!this.contains(point.x, point.y)) return false
+
+    if (!this.children) {
+      if (this.points.length < this.capacity || this.depth >= MAX_DEPTH) {
+        this.points.push(point)
+        return true
+      }
+      this.subdivide()
+    }
+
+    for (const child of this.children!) {
+      if (child.insert(point)) return true
+    }
+    return false
+  }
+
+  queryRect(
+    minX: number,
+    minY: number,
+    maxX: number,
+    maxY: number,
+    out: QuadtreePoint<T>[] = []
+  ): QuadtreePoint<T>[] {
+    if (maxX < this.minX || minX > this.maxX || maxY < this.minY || minY > this.maxY) {
+      return out
+    }
+    for (const point of this.points) {
+      if (point.x >= minX && point.x <= maxX && point.y >= minY && point.y <= maxY) {
+        out.push(point)
+      }
+    }
+    if (this.children) {
+      for (const child of this.children) child.queryRect(minX, minY, maxX, maxY, out)
+    }
+    return out
+  }
+
+  // Closest point within maxDistance of (x, y), or null
+  nearest(x: number, y: number, maxDistance = Infinity): QuadtreePoint<T> | null {
+    const best = { point: null as QuadtreePoint<T> | null, distanceSq: maxDistance * maxDistance }
+    this.searchNearest(x, y, best)
+    return best.point
+  }
+
+  private searchNearest(
+    x: number,
+    y: number,
+    best: { point: QuadtreePoint<T> | null; distanceSq: number }
+  ) {
+    // Skip nodes whose bounds are farther away than the current best
+    const dx = Math.max(this.minX - x, 0, x - this.maxX)
+    const dy = Math.max(this.minY - y, 0, y - this.maxY)
+    if (dx * dx + dy * dy > best.distanceSq) return
+
+    for (const point of this.points) {
+      const distanceSq = (point.x - x) ** 2 + (point.y - y) ** 2
+      if (distanceSq <= best.distanceSq) {
+        best.point = point
+        best.distanceSq = distanceSq
+      }
+    }
+    if (this.children) {
+      for (const child of this.children) child.searchNearest(x, y, best)
+    }
+  }
+
+  private contains(x: number, y: number) {
+    return x >= this.minX && x <= this.maxX && y >= this.minY && y <= this.maxY
+  }
+
+  private subdivide() {
+    const midX = (this.minX + this.maxX) / 2
+    const midY = (this.minY + this.maxY) / 2
+    const depth = this.depth + 1
+    this.children = [
+      new Quadtree<T>(this.minX, this.minY, midX, midY, this.capacity, depth),
+      new Quadtree<T>(midX, this.minY, this.maxX, midY, this.capacity, depth),
+      new Quadtree<T>(this.minX, midY, midX, this.maxY, this.capacity, depth),
+      new Quadtree<T>(midX, midY, this.maxX, this.maxY, this.capacity, depth),
+    ]
+    const points = this.points
+    this.points = []
+    for (const point of points) {
+      for (const child of this.children) {
+        if (child.insert(point)) break
+      }
+    }
+  }
+}
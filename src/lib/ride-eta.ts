@@ -0,0 +1,358 @@
+import type { TelemetryUpdate } from "@/lib/fleet-types"
+import type { LatLng } from "@/lib/geo"
+import { approxMiles } from "@/lib/road-graph"
+import { routeMiles, routeSeconds, type AltRouter, type RoutePath } from "@/lib/routing"
+
+export interface RideRequest {
+  id: string
+  vehicleId: string
+  pickup: LatLng
+  dropoff: LatLng
+}
+
+// "pickup" while the vehicle drives to the rider, "ride" once they are on
+// board
+export type RidePhase = "pickup" | "ride"
+
+export interface RideEta {
+  rideId: string
+  vehicleId: string
+  phase: RidePhase
+  // To the dropoff, including the drive to the pickup
+  etaSeconds: number
+  remainingMiles: number
+  // Share of the pickup-to-dropoff route already covered, 0 to 1
+  progress: number
+  arrivalAt: number
+  updatedAt: number
+}
+
+// Farther than this from the route, the vehicle has left it and is rerouted
+const OFF_ROUTE_MILES = 0.3
+// Route segments searched ahead of the last match. Matching is incremental:
+// each position is compared with the stretch of route just past the previous
+// one, not the whole route.
+const MATCH_LOOKAHEAD = 60
+const ARRIVED_MILES = 0.05
+// Final ETAs of arrived rides kept for pages still polling them
+const FINISHED_RIDES = 1024
+// A ride whose vehicle has not reported for this long is dropped, so rides
+// that never arrive (a vehicle gone offline, a ride that was never driven)
+// do not pile up
+const STALE_RIDE_MS = 2 * 60 * 60_000
+// Most rides tracked at once; past it the ride heard from least recently is
+// dropped
+const MAX_TRACKED_RIDES = 20_000
+
+interface RouteMatch {
+  segment: number
+  // Position along the segment, 0 to 1
+  along: number
+}
+
+// Projects a position onto segment a-b on a local flat projection
+function projectOntoSegment(
+  lat: number,
+  lng: number,
+  aLat: number,
+  aLng: number,
+  bLat: number,
+  bLng: number
+) {
+  const scale = Math.cos((lat * Math.PI) / 180)
+  const dx = (bLng - aLng) * scale
+  const dy = bLat - aLat
+  const lengthSquared = dx * dx + dy * dy
+  const along =
+    lengthSquared === 0
+      ? 0
+      : Math.max(0, Math.min(1, (((lng - aLng) * scale) * dx + (lat - aLat) * dy) / lengthSquared))
+  const miles = approxMiles(lat, lng, aLat + (bLat - aLat) * along, aLng + (bLng - aLng) * along)
+  return { along, miles }
+}
+
+// ETA and progress of one ride. Positions are matched against the current
+// route near where the vehicle was last seen, so an update costs a few
+// segment projections; the router only runs when the vehicle leaves the
+// route.
+//
+// A ride that starts in the pickup phase follows the vehicle to the pickup
+// first; the ride route is added on top of that leg until the vehicle gets
+// there.
+class RideTracker {
+  eta: RideEta
+  // Last time the vehicle reported, or when tracking started
+  seenAt = 0
+  private matched = 0
+
+  constructor(
+    readonly ride: RideRequest,
+    private phase: RidePhase,
+    // The route being followed and the node it leads to: the pickup, then
+    // the dropoff
+    private path: RoutePath,
+    private target: number,
+    private readonly dropoff: number,
+    // Pickup to dropoff, the basis for progress
+    private readonly ridePath: RoutePath,
+    private readonly service: EtaService
+  ) {
+    this.eta = {
+      rideId: ride.id,
+      vehicleId: ride.vehicleId,
+      phase,
+      etaSeconds: 0,
+      remainingMiles: 0,
+      progress: 0,
+      arrivalAt: 0,
+      updatedAt: 0,
+    }
+  }
+
+  // Returns false when the position changed nothing
+  update(lat: number, lng: number, timestamp: number): boolean {
+    let match = this.match(lat, lng)
+    if (!match) {
+      const path = this.service.pathFrom(lat, lng, this.target)
+      if (!path) return false
+      this.path = path
+      this.matched = 0
+      match = this.match(lat, lng) ?? { segment: 0, along: 0 }
+    }
+    this.matched = match.segment
+
+    const { path } = this
+    const last = path.nodes.length - 1
+    const next = Math.min(match.segment + 1, last)
+    const coveredMiles =
+      path.miles[match.segment] + (path.miles[next] - path.miles[match.segment]) * match.along
+    const coveredSeconds =
+      path.seconds[match.segment] + (path.seconds[next] - path.seconds[match.segment]) * match.along
+    let remainingMiles = path.miles[last] - coveredMiles
+    let etaSeconds = path.seconds[last] - coveredSeconds
+    if (remainingMiles < ARRIVED_MILES) {
+      remainingMiles = 0
+      etaSeconds = 0
+    }
+
+    const rideMiles = routeMiles(this.ridePath)
+    let progress = 0
+    if (this.phase === "pickup") {
+      if (remainingMiles === 0) {
+        // Rider on board: follow the ride route from here
+        this.phase = "ride"
+        this.path = this.ridePath
+        this.target = this.dropoff
+        this.matched = 0
+        return this.update(lat, lng, timestamp)
+      }
+      remainingMiles += rideMiles
+      etaSeconds += routeSeconds(this.ridePath)
+    } else {
+      progress = rideMiles > 0 ? Math.max(0, Math.min(1, 1 - remainingMiles / rideMiles)) : 1
+    }
+
+    const previous = this.eta
+    if (
+      previous.updatedAt !== 0 &&
+      previous.phase === this.phase &&
+      Math.round(previous.etaSeconds) === Math.round(etaSeconds) &&
+      Math.round(previous.progress * 1000) === Math.round(progress * 1000)
+    ) {
+      return false
+    }
+    this.eta = {
+      ...previous,
+      phase: this.phase,
+      etaSeconds,
+      remainingMiles,
+      progress,
+      arrivalAt: timestamp + etaSeconds * 1000,
+      updatedAt: timestamp,
+    }
+    return true
+  }
+
+  private match(lat: number, lng: number): RouteMatch | null {
+    const { graph } = this.service.router
+    const { nodes } = this.path
+    if (nodes.length === 1) {
+      const miles = approxMiles(lat, lng, graph.lat[nodes[0]], graph.lng[nodes[0]])
+      return miles <= OFF_ROUTE_MILES ? { segment: 0, along: 0 } : null
+    }
+
+    let best: RouteMatch | null = null
+    let bestMiles = OFF_ROUTE_MILES
+    const end = Math.min(nodes.length - 1, this.matched + MATCH_LOOKAHEAD)
+    for (let segment = Math.max(0, this.matched - 1); segment < end; segment++) {
+      const a = nodes[segment]
+      const b = nodes[segment + 1]
+      const { along, miles } = projectOntoSegment(
+        lat,
+        lng,
+        graph.lat[a],
+        graph.lng[a],
+        graph.lat[b],
+        graph.lng[b]
+      )
+      if (miles <= bestMiles) {
+        best = { segment, along }
+        bestMiles = miles
+      }
+    }
+    return best
+  }
+}
+
+// Live ETAs for many concurrent rides. Routes are cached by origin and
+// destination node, so rides sharing a trip (hospital to home, airport to
+// resort) and vehicles rerouting onto a road other rides already use are
+// served from memory.
+//
+// Rides are kept in the order their vehicles last reported, so stale rides
+// and, past the cap, the least recently heard from are dropped from the front.
+export class EtaService {
+  private readonly routes = new Map<string, RoutePath | null>()
+  private readonly rides = new Map<string, RideTracker>()
+  private readonly finished = new Map<string, RideEta>()
+  private readonly ridesByVehicle = new Map<string, Set<string>>()
+  cacheHits = 0
+  cacheMisses = 0
+
+  constructor(
+    readonly router: AltRouter,
+    private readonly cacheSize = 4096,
+    private readonly maxRides = MAX_TRACKED_RIDES
+  ) {}
+
+  get rideCount() {
+    return this.rides.size
+  }
+
+  // Starts tracking a ride from the vehicle's current position (the pickup
+  // if unknown). In the pickup phase the vehicle is on its way to the rider;
+  // in the ride phase the rider is on board. Tracking a ride again, or one
+  // that has arrived, returns its current ETA.
+  track(
+    ride: RideRequest,
+    position: LatLng = ride.pickup,
+    phase: RidePhase = "ride",
+    now = Date.now()
+  ): RideEta | null {
+    const existing = this.rides.get(ride.id)?.eta ?? this.finished.get(ride.id)
+    if (existing) return existing
+
+    const { graph } = this.router
+    const pickup = graph.nearestNode(ride.pickup.lat, ride.pickup.lng)
+    const destination = graph.nearestNode(ride.dropoff.lat, ride.dropoff.lng)
+    const ridePath = this.path(pickup, destination)
+    if (!ridePath) return null
+    const approach = phase === "pickup" ? this.pathFrom(position.lat, position.lng, pickup) : ridePath
+    if (!approach) return null
+
+    const tracker = new RideTracker(
+      ride,
+      phase,
+      approach,
+      phase === "pickup" ? pickup : destination,
+      destination,
+      ridePath,
+      this
+    )
+    tracker.update(position.lat, position.lng, now)
+    if (tracker.eta.remainingMiles === 0) {
+      this.finish(tracker.eta)
+      return tracker.eta
+    }
+    this.expire(now)
+    if (this.rides.size >= this.maxRides) this.untrack(this.rides.keys().next().value!)
+    tracker.seenAt = now
+    this.rides.set(ride.id, tracker)
+    let vehicleRides = this.ridesByVehicle.get(ride.vehicleId)
+    if (!vehicleRides) {
+      vehicleRides = new Set()
+      this.ridesByVehicle.set(ride.vehicleId, vehicleRides)
+    }
+    vehicleRides.add(ride.id)
+    return tracker.eta
+  }
+
+  // Stops tracking a ride, e.g. when it is cancelled. Arrived rides are
+  // untracked on their own.
+  untrack(rideId: string) {
+    const tracker = this.rides.get(rideId)
+    if (!tracker) return
+    this.rides.delete(rideId)
+    const vehicleRides = this.ridesByVehicle.get(tracker.ride.vehicleId)
+    vehicleRides?.delete(rideId)
+    if (vehicleRides?.size === 0) this.ridesByVehicle.delete(tracker.ride.vehicleId)
+  }
+
+  get(rideId: string): RideEta | undefined {
+    return this.rides.get(rideId)?.eta ?? this.finished.get(rideId)
+  }
+
+  // Feeds positions to the rides of the vehicles that reported and returns
+  // the ETAs that changed. Rides that arrive stop being tracked.
+  update(updates: TelemetryUpdate[]): RideEta[] {
+    const changed: RideEta[] = []
+    let latest = 0
+    for (const update of updates) {
+      latest = Math.max(latest, update.timestamp)
+      const rideIds = this.ridesByVehicle.get(update.vehicleId)
+      if (!rideIds) continue
+      for (const rideId of rideIds) {
+        const tracker = this.rides.get(rideId)!
+        // Heard from: move to the back
+        tracker.seenAt = Math.max(tracker.seenAt, update.timestamp)
+        this.rides.delete(rideId)
+        this.rides.set(rideId, tracker)
+        if (!tracker.update(update.lat, update.lng, update.timestamp)) continue
+        changed.push(tracker.eta)
+        if (tracker.eta.remainingMiles === 0) this.finish(tracker.eta)
+      }
+    }
+    if (latest > 0) this.expire(latest)
+    return changed
+  }
+
+  // Drops rides not heard from in STALE_RIDE_MS, oldest first
+  private expire(now: number) {
+    for (const [rideId, tracker] of this.rides) {
+      if (now - tracker.seenAt <= STALE_RIDE_MS) break
+      this.untrack(rideId)
+    }
+  }
+
+  private finish(eta: RideEta) {
+    this.untrack(eta.rideId)
+    this.finished.set(eta.rideId, eta)
+    if (this.finished.size > FINISHED_RIDES) {
+      this.finished.delete(this.finished.keys().next().value!)
+    }
+  }
+
+  // Route from a position to a destination node
+  pathFrom(lat: number, lng: number, destination: number) {
+    return this.path(this.router.graph.nearestNode(lat, lng), destination)
+  }
+
+  private path(from: number, to: number) {
+    const key = `${from}>${to}`
+    if (this.routes.has(key)) {
+      const path = this.routes.get(key) ?? null
+      // Least recently used entries are evicted first
+      this.routes.delete(key)
+      this.routes.set(key, path)
+      this.cacheHits++
+      return path
+    }
+    this.cacheMisses++
+    const path = this.router.route(from, to)
+    this.routes.set(key, path)
+    if (this.routes.size > this.cacheSize) {
+      this.routes.delete(this.routes.keys().next().value!)
+    }
+    return path
+  }
+}
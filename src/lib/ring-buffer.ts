@@ -0,0 +1,57 @@
+// Fixed-capacity buffer that overwrites its oldest item. Every push gets a
+// sequence number, so an item can be read or replaced in place for as long
+// as it is still retained.
+export class RingBuffer<T> {
+  private readonly items: (T | undefined)[]
+  private next = 0
+
+  constructor(readonly capacity: number) {
+    this.items = new Array(capacity)
+  }
+
+  get size() {
+    return Math.min(this.next, this.capacity)
+  }
+
+  // Sequence number of the oldest retained item
+  get first() {
+    return Math.max(this.next - this.capacity, 0)
+  }
+
+  // Sequence number the next push will get
+  get end() {
+    return this.next
+  }
+
+  // Appends an item and returns the one it overwrote, if any
+  push(item: T): T | undefined {
+    const slot = this.next % this.capacity
+    const evicted = this.next >= this.capacity ? this.items[slot] : undefined
+    this.items[slot] = item
+    this.next++
+    return evicted
+  }
+
+  has(sequence: number) {
+    return sequence >= this.first && sequence < this.next
+  }
+
+  get(sequence: number): T | undefined {
+    return this.has(sequence) ? this.items[sequence % this.capacity] : undefined
+  }
+
+  set(sequence: number, item: T) {
+    if (!this.has(sequence)) return false
+    this.items[sequence % this.capacity] = item
+    return true
+  }
+
+  // Oldest first
+  toArray(): T[] {
+    const out: T[] = []
+    for (let sequence = this.first; sequence < this.next; sequence++) {
+      out.push(this.items[sequence % this.capacity] as T)
+    }
+    return out
+  }
+}
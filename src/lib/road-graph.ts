@@ -0,0 +1,228 @@
+import { CORRIDORS, ROAD_POINTS, TOWN_GRIDS, type Corridor, type TownGrid } from "@/lib/colorado-roads"
+
+const MILES_PER_DEGREE_LAT = 69
+// Corridors are split into segments of at most this length, so a position
+// can be matched to the stretch of road it is on
+const MAX_SEGMENT_MILES = 1
+const LOCAL_SPEED_MPH = 25
+// Every few blocks a town street is an arterial
+const GRID_ARTERIAL_EVERY = 4
+const ARTERIAL_SPEED_MPH = 35
+// On- and off-ramps between a town grid and the corridors through it
+const CONNECTOR_SPEED_MPH = 30
+const CELL_DEGREES = 0.05
+
+// Distance on a local flat projection; accurate to well under a percent at
+// the scale of a town or a corridor segment, and much cheaper than haversine
+export function approxMiles(lat1: number, lng1: number, lat2: number, lng2: number) {
+  const dy = (lat2 - lat1) * MILES_PER_DEGREE_LAT
+  const dx = (lng2 - lng1) * MILES_PER_DEGREE_LAT * Math.cos((((lat1 + lat2) / 2) * Math.PI) / 180)
+  return Math.sqrt(dx * dx + dy * dy)
+}
+
+// Undirected road network in compressed adjacency form: the edges of node n
+// are offsets[n]..offsets[n + 1] in targets, seconds and miles. Flat typed
+// arrays keep the graph compact and fast to traverse.
+export class RoadGraph {
+  readonly nodeCount: number
+  private readonly cells = new Map<number, number[]>()
+
+  constructor(
+    readonly lat: Float64Array,
+    readonly lng: Float64Array,
+    readonly offsets: Int32Array,
+    readonly targets: Int32Array,
+    readonly seconds: Float32Array,
+    readonly miles: Float32Array
+  ) {
+    this.nodeCount = lat.length
+    for (let node = 0; node < this.nodeCount; node++) {
+      const key = this.cellKey(Math.floor(lat[node] / CELL_DEGREES), Math.floor(lng[node] / CELL_DEGREES))
+      const cell = this.cells.get(key)
+      if (cell) cell.push(node)
+      else this.cells.set(key, [node])
+    }
+  }
+
+  get edgeCount() {
+    return this.targets.length / 2
+  }
+
+  // Closest node to a position, searching rings of grid cells outwards until
+  // no unsearched cell can hold anything closer
+  nearestNode(lat: number, lng: number) {
+    const row = Math.floor(lat / CELL_DEGREES)
+    const col = Math.floor(lng / CELL_DEGREES)
+    const ringMiles = CELL_DEGREES * MILES_PER_DEGREE_LAT * Math.cos((lat * Math.PI) / 180)
+    let best = -1
+    let bestMiles = Infinity
+    for (let ring = 0; ring < 200; ring++) {
+      if (best !== -1 && (ring - 1) * ringMiles > bestMiles) break
+      for (let r = row - ring; r <= row + ring; r++) {
+        for (let c = col - ring; c <= col + ring; c++) {
+          if (Math.max(Math.abs(r - row), Math.abs(c - col)) !== ring) continue
+          const cell = this.cells.get(this.cellKey(r, c))
+          if (!cell) continue
+          for (const node of cell) {
+            const miles = approxMiles(lat, lng, this.lat[node], this.lng[node])
+            if (miles < bestMiles) {
+              best = node
+              bestMiles = miles
+            }
+          }
+        }
+      }
+    }
+    return best
+  }
+
+  // Numeric keys keep the ring search cheap; columns stay well within
+  // ±50000 for any longitude
+  private cellKey(row: number, col: number) {
+    return row * 100_000 + col
+  }
+}
+
+interface PendingEdge {
+  from: number
+  to: number
+  miles: number
+  seconds: number
+}
+
+// Collects nodes and edges, then packs them into a RoadGraph
+class RoadGraphBuilder {
+  private readonly lat: number[] = []
+  private readonly lng: number[] = []
+  private readonly edges: PendingEdge[] = []
+  private readonly named = new Map<string, number>()
+
+  addNode(lat: number, lng: number) {
+    this.lat.push(lat)
+    this.lng.push(lng)
+    return this.lat.length - 1
+  }
+
+  // Junctions are shared by every corridor through them
+  namedNode(name: string) {
+    let node = this.named.get(name)
+    if (node === undefined) {
+      const point = ROAD_POINTS[name]
+      if (!point) throw new Error(`Unknown road point: ${name}`)
+      node = this.addNode(point[0], point[1])
+      this.named.set(name, node)
+    }
+    return node
+  }
+
+  addEdge(from: number, to: number, speedMph: number) {
+    const miles = approxMiles(this.lat[from], this.lng[from], this.lat[to], this.lng[to])
+    this.edges.push({ from, to, miles, seconds: (miles / speedMph) * 3600 })
+  }
+
+  nodePosition(node: number): [number, number] {
+    return [this.lat[node], this.lng[node]]
+  }
+
+  get nodeCount() {
+    return this.lat.length
+  }
+
+  build() {
+    const nodeCount = this.lat.length
+    const degree = new Int32Array(nodeCount + 1)
+    for (const edge of this.edges) {
+      degree[edge.from + 1]++
+      degree[edge.to + 1]++
+    }
+    const offsets = new Int32Array(nodeCount + 1)
+    for (let node = 0; node < nodeCount; node++) offsets[node + 1] = offsets[node] + degree[node + 1]
+
+    const cursor = offsets.slice(0, nodeCount)
+    const targets = new Int32Array(offsets[nodeCount])
+    const seconds = new Float32Array(offsets[nodeCount])
+    const miles = new Float32Array(offsets[nodeCount])
+    const place = (from: number, to: number, edge: PendingEdge) => {
+      const slot = cursor[from]++
+      targets[slot] = to
+      seconds[slot] = edge.seconds
+      miles[slot] = edge.miles
+    }
+    for (const edge of this.edges) {
+      place(edge.from, edge.to, edge)
+      place(edge.to, edge.from, edge)
+    }
+    return new RoadGraph(
+      Float64Array.from(this.lat),
+      Float64Array.from(this.lng),
+      offsets,
+      targets,
+      seconds,
+      miles
+    )
+  }
+}
+
+function addCorridor(builder: RoadGraphBuilder, corridor: Corridor) {
+  for (let i = 1; i < corridor.path.length; i++) {
+    const start = builder.namedNode(corridor.path[i - 1])
+    const end = builder.namedNode(corridor.path[i])
+    const [lat1, lng1] = builder.nodePosition(start)
+    const [lat2, lng2] = builder.nodePosition(end)
+    const steps = Math.max(1, Math.ceil(approxMiles(lat1, lng1, lat2, lng2) / MAX_SEGMENT_MILES))
+    let previous = start
+    for (let step = 1; step < steps; step++) {
+      const t = step / steps
+      const node = builder.addNode(lat1 + (lat2 - lat1) * t, lng1 + (lng2 - lng1) * t)
+      builder.addEdge(previous, node, corridor.speedMph)
+      previous = node
+    }
+    builder.addEdge(previous, end, corridor.speedMph)
+  }
+}
+
+// A square street grid centered on the town, tied into every corridor node
+// that falls inside it
+function addTownGrid(builder: RoadGraphBuilder, town: TownGrid, corridorNodes: number) {
+  const [centerLat, centerLng] = ROAD_POINTS[town.point]
+  const dLat = town.spacingMiles / MILES_PER_DEGREE_LAT
+  const dLng = dLat / Math.cos((centerLat * Math.PI) / 180)
+  const size = town.radius * 2 + 1
+  const first = builder.nodeCount
+
+  for (let row = 0; row < size; row++) {
+    for (let col = 0; col < size; col++) {
+      const node = builder.addNode(
+        centerLat + (row - town.radius) * dLat,
+        centerLng + (col - town.radius) * dLng
+      )
+      if (col > 0) {
+        const speed = row % GRID_ARTERIAL_EVERY === 0 ? ARTERIAL_SPEED_MPH : LOCAL_SPEED_MPH
+        builder.addEdge(node - 1, node, speed)
+      }
+      if (row > 0) {
+        const speed = col % GRID_ARTERIAL_EVERY === 0 ? ARTERIAL_SPEED_MPH : LOCAL_SPEED_MPH
+        builder.addEdge(node - size, node, speed)
+      }
+    }
+  }
+
+  for (let node = 0; node < corridorNodes; node++) {
+    const [lat, lng] = builder.nodePosition(node)
+    const row = Math.round((lat - centerLat) / dLat) + town.radius
+    const col = Math.round((lng - centerLng) / dLng) + town.radius
+    if (row < 0 || row >= size || col < 0 || col >= size) continue
+    builder.addEdge(node, first + row * size + col, CONNECTOR_SPEED_MPH)
+  }
+}
+
+export function buildRoadGraph(
+  corridors: Corridor[] = CORRIDORS,
+  towns: TownGrid[] = TOWN_GRIDS
+): RoadGraph {
+  const builder = new RoadGraphBuilder()
+  for (const corridor of corridors) addCorridor(builder, corridor)
+  const corridorNodes = builder.nodeCount
+  for (const town of towns) addTownGrid(builder, town, corridorNodes)
+  return builder.build()
+}
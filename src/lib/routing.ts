@@ -0,0 +1,313 @@
+import type { RoadGraph } from "@/lib/road-graph"
+
+// A shortest path through the road graph. miles[i] and seconds[i] are the
+// cumulative distance and travel time from the start to nodes[i].
+export interface RoutePath {
+  nodes: Int32Array
+  miles: Float64Array
+  seconds: Float64Array
+}
+
+export function routeMiles(path: RoutePath) {
+  return path.miles[path.miles.length - 1]
+}
+
+export function routeSeconds(path: RoutePath) {
+  return path.seconds[path.seconds.length - 1]
+}
+
+// Binary min-heap of node ids keyed by cost, in typed arrays. Entries are
+// never decreased in place; a node is pushed again with its lower cost and
+// the stale entry is skipped when it surfaces.
+class NodeHeap {
+  private nodes = new Int32Array(1024)
+  private keys = new Float64Array(1024)
+  size = 0
+
+  clear() {
+    this.size = 0
+  }
+
+  push(node: number, key: number) {
+    if (this.size === this.nodes.length) {
+      const nodes = new Int32Array(this.size * 2)
+      const keys = new Float64Array(this.size * 2)
+      nodes.set(this.nodes)
+      keys.set(this.keys)
+      this.nodes = nodes
+      this.keys = keys
+    }
+    let i = this.size++
+    while (i > 0) {
+      const parent = (i - 1) >> 1
+      if (this.keys[parent] <= key) break
+      this.nodes[i] = this.nodes[parent]
+      this.keys[i] = this.keys[parent]
+      i = parent
+    }
+    this.nodes[i] = node
+    this.keys[i] = key
+  }
+
+  // Removes the entry with the lowest key and returns its node
+  pop() {
+    const top = this.nodes[0]
+    const lastNode = this.nodes[--this.size]
+    const lastKey = this.keys[this.size]
+    let i = 0
+    for (;;) {
+      let child = i * 2 + 1
+      if (child >= this.size) break
+      if (child + 1 < this.size && this.keys[child + 1] < this.keys[child]) child++
+      if (this.keys[child] >= lastKey) break
+      this.nodes[i] = this.nodes[child]
+      this.keys[i] = this.keys[child]
+      i = child
+    }
+    this.nodes[i] = lastNode
+    this.keys[i] = lastKey
+    return top
+  }
+}
+
+// Landmarks whose distances give the tightest bound for one query
+const ACTIVE_LANDMARKS = 4
+
+// Shortest travel-time routes with ALT: A* search whose heuristic is a lower
+// bound from precomputed distances to a few landmarks, via the triangle
+// inequality |d(L, t) - d(L, v)| <= d(v, t). Landmarks are picked far apart
+// on the edge of the network, so the bound is tight for most queries and the
+// search settles a small corridor of nodes instead of the whole graph.
+//
+// Precomputation is one Dijkstra per landmark. A router is not reentrant:
+// queries reuse its search buffers.
+export class AltRouter {
+  readonly landmarks: Int32Array
+  // distances[l * nodeCount + v]: travel seconds between landmark l and v
+  private readonly distances: Float32Array
+  private readonly heap = new NodeHeap()
+  private readonly cost: Float64Array
+  private readonly parent: Int32Array
+  private readonly seen: Uint32Array
+  private readonly closed: Uint32Array
+  private readonly heuristic: Float64Array
+  private readonly miles: Float64Array
+  private readonly wanted: Uint32Array
+  private readonly active = new Int32Array(ACTIVE_LANDMARKS)
+  private search = 0
+  // Nodes settled by the last query, to gauge how much work ALT saves
+  lastSettled = 0
+
+  constructor(readonly graph: RoadGraph, landmarkCount = 12) {
+    const n = graph.nodeCount
+    this.cost = new Float64Array(n)
+    this.parent = new Int32Array(n)
+    this.seen = new Uint32Array(n)
+    this.closed = new Uint32Array(n)
+    this.heuristic = new Float64Array(n)
+    this.miles = new Float64Array(n)
+    this.wanted = new Uint32Array(n)
+
+    // Farthest-point selection: each landmark is the node farthest from the
+    // ones already chosen
+    landmarkCount = Math.max(1, Math.min(landmarkCount, n))
+    this.landmarks = new Int32Array(landmarkCount)
+    this.distances = new Float32Array(landmarkCount * n)
+    let next = this.farthestFrom(this.dijkstra(0), new Float64Array(n).fill(Infinity))
+    const nearest = new Float64Array(n).fill(Infinity)
+    for (let l = 0; l < landmarkCount; l++) {
+      this.landmarks[l] = next
+      const distances = this.dijkstra(next)
+      this.distances.set(distances, l * n)
+      next = this.farthestFrom(distances, nearest)
+    }
+  }
+
+  // Fastest route between two nodes, or null if they are not connected
+  route(from: number, to: number): RoutePath | null {
+    const { graph, heap, cost, parent, seen, closed, heuristic } = this
+    const search = this.nextSearch()
+    const activeCount = this.pickLandmarks(from, to)
+
+    cost[from] = 0
+    parent[from] = -1
+    seen[from] = search
+    heuristic[from] = this.lowerBound(from, to, activeCount)
+    heap.push(from, heuristic[from])
+    let settled = 0
+
+    while (heap.size > 0) {
+      const node = heap.pop()
+      if (closed[node] === search) continue
+      closed[node] = search
+      settled++
+      if (node === to) break
+
+      const base = cost[node]
+      for (let edge = graph.offsets[node]; edge < graph.offsets[node + 1]; edge++) {
+        const next = graph.targets[edge]
+        if (closed[next] === search) continue
+        const nextCost = base + graph.seconds[edge]
+        if (seen[next] !== search) {
+          seen[next] = search
+          heuristic[next] = this.lowerBound(next, to, activeCount)
+        } else if (nextCost >= cost[next]) {
+          continue
+        }
+        cost[next] = nextCost
+        parent[next] = node
+        heap.push(next, nextCost + heuristic[next])
+      }
+    }
+    heap.clear()
+    this.lastSettled = settled
+
+    if (closed[to] !== search) return null
+    return this.tracePath(from, to)
+  }
+
+  // Fastest travel seconds and miles from one node to each of `targets`, or
+  // Infinity past `maxSeconds`. One Dijkstra that stops once every target is
+  // settled answers what would otherwise be a route per target.
+  travelToMany(from: number, targets: ArrayLike<number>, maxSeconds = Infinity) {
+    const { graph, heap, cost, miles, seen, closed, wanted } = this
+    const search = this.nextSearch()
+    let remaining = 0
+    for (let i = 0; i < targets.length; i++) {
+      if (wanted[targets[i]] !== search) {
+        wanted[targets[i]] = search
+        remaining++
+      }
+    }
+
+    cost[from] = 0
+    miles[from] = 0
+    seen[from] = search
+    heap.push(from, 0)
+    while (heap.size > 0 && remaining > 0) {
+      const node = heap.pop()
+      if (closed[node] === search) continue
+      if (cost[node] > maxSeconds) break
+      closed[node] = search
+      if (wanted[node] === search) remaining--
+
+      for (let edge = graph.offsets[node]; edge < graph.offsets[node + 1]; edge++) {
+        const next = graph.targets[edge]
+        const nextCost = cost[node] + graph.seconds[edge]
+        if (seen[next] === search && nextCost >= cost[next]) continue
+        seen[next] = search
+        cost[next] = nextCost
+        miles[next] = miles[node] + graph.miles[edge]
+        heap.push(next, nextCost)
+      }
+    }
+    heap.clear()
+
+    const seconds = new Float64Array(targets.length).fill(Infinity)
+    const targetMiles = new Float64Array(targets.length).fill(Infinity)
+    for (let i = 0; i < targets.length; i++) {
+      if (closed[targets[i]] !== search) continue
+      seconds[i] = cost[targets[i]]
+      targetMiles[i] = miles[targets[i]]
+    }
+    return { seconds, miles: targetMiles }
+  }
+
+  private tracePath(from: number, to: number): RoutePath {
+    const reversed: number[] = []
+    for (let node = to; node !== -1; node = this.parent[node]) {
+      reversed.push(node)
+      if (node === from) break
+    }
+    const nodes = Int32Array.from(reversed.reverse())
+    const miles = new Float64Array(nodes.length)
+    const seconds = new Float64Array(nodes.length)
+    const { graph } = this
+    for (let i = 1; i < nodes.length; i++) {
+      const edge = this.edgeBetween(nodes[i - 1], nodes[i])
+      miles[i] = miles[i - 1] + graph.miles[edge]
+      seconds[i] = seconds[i - 1] + graph.seconds[edge]
+    }
+    return { nodes, miles, seconds }
+  }
+
+  // The fastest edge from one node to another
+  private edgeBetween(from: number, to: number) {
+    const { graph } = this
+    let best = -1
+    for (let edge = graph.offsets[from]; edge < graph.offsets[from + 1]; edge++) {
+      if (graph.targets[edge] === to && (best === -1 || graph.seconds[edge] < graph.seconds[best])) {
+        best = edge
+      }
+    }
+    return best
+  }
+
+  // Of all landmarks, the ones bounding d(from, to) most tightly
+  private pickLandmarks(from: number, to: number) {
+    const n = this.graph.nodeCount
+    const scored: { landmark: number; bound: number }[] = []
+    for (let l = 0; l < this.landmarks.length; l++) {
+      const bound = Math.abs(this.distances[l * n + to] - this.distances[l * n + from])
+      if (Number.isFinite(bound)) scored.push({ landmark: l, bound })
+    }
+    scored.sort((a, b) => b.bound - a.bound)
+    const count = Math.min(ACTIVE_LANDMARKS, scored.length)
+    for (let i = 0; i < count; i++) this.active[i] = scored[i].landmark
+    return count
+  }
+
+  private lowerBound(node: number, to: number, activeCount: number) {
+    const n = this.graph.nodeCount
+    let bound = 0
+    for (let i = 0; i < activeCount; i++) {
+      const offset = this.active[i] * n
+      const estimate = Math.abs(this.distances[offset + to] - this.distances[offset + node])
+      if (estimate > bound) bound = estimate
+    }
+    return bound
+  }
+
+  // Travel seconds from one node to every other
+  private dijkstra(source: number) {
+    const { graph, heap, closed } = this
+    const search = this.nextSearch()
+    const distances = new Float32Array(graph.nodeCount).fill(Infinity)
+    distances[source] = 0
+    heap.push(source, 0)
+    while (heap.size > 0) {
+      const node = heap.pop()
+      if (closed[node] === search) continue
+      closed[node] = search
+      for (let edge = graph.offsets[node]; edge < graph.offsets[node + 1]; edge++) {
+        const next = graph.targets[edge]
+        const nextCost = distances[node] + graph.seconds[edge]
+        if (nextCost < distances[next]) {
+          distances[next] = nextCost
+          heap.push(next, nextCost)
+        }
+      }
+    }
+    return distances
+  }
+
+  // Folds `distances` into each node's distance to its nearest landmark and
+  // returns the node farthest from all of them
+  private farthestFrom(distances: Float32Array, nearest: Float64Array) {
+    let farthest = 0
+    for (let node = 0; node < nearest.length; node++) {
+      if (distances[node] < nearest[node]) nearest[node] = distances[node]
+      if (Number.isFinite(nearest[node]) && nearest[node] > nearest[farthest]) farthest = node
+    }
+    return farthest
+  }
+
+  private nextSearch() {
+    if (++this.search === 0xffffffff) {
+      this.seen.fill(0)
+      this.closed.fill(0)
+      this.search = 1
+    }
+    return this.search
+  }
+}
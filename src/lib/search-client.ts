@@ -0,0 +1,101 @@
+import {
+  handleSearchRequest,
+  SearchIndex,
+  type SearchDocument,
+  type SearchOptions,
+  type SearchRef,
+  type SearchRequest,
+  type SearchResponse,
+  type SearchResult,
+} from "@/lib/search-index"
+
+type Listener = () => void
+
+// Main-thread handle to a SearchIndex living in a Web Worker. Messages are
+// processed in order, so a search always sees the updates sent before it.
+// Falls back to an in-thread index where workers are unavailable. The worker
+// is started lazily on first use, so constructing a client during render
+// (including on the server) is free.
+export class SearchClient {
+  private worker: Worker | null = null
+  private local: SearchIndex | null = null
+  private nextRequestId = 1
+  private readonly pending = new Map<number, (result: SearchResult) => void>()
+  private readonly listeners = new Set<Listener>()
+  private version = 0
+
+  upsert(documents: SearchDocument[]) {
+    if (documents.length === 0) return
+    this.send({ type: "upsert", documents })
+    this.changed()
+  }
+
+  remove(refs: SearchRef[]) {
+    if (refs.length === 0) return
+    this.send({ type: "remove", refs })
+    this.changed()
+  }
+
+  search(query: string, options: SearchOptions = {}): Promise<SearchResult> {
+    const requestId = this.nextRequestId++
+    return new Promise((resolve) => {
+      this.pending.set(requestId, resolve)
+      this.send({ type: "search", requestId, query, options })
+    })
+  }
+
+  // Bumped on every index write, so open queries know to re-run
+  getVersion = () => this.version
+
+  subscribe = (listener: Listener) => {
+    this.listeners.add(listener)
+    return () => {
+      this.listeners.delete(listener)
+    }
+  }
+
+  // Drops the index; the next call starts a fresh one
+  dispose() {
+    this.worker?.terminate()
+    this.worker = null
+    this.local = null
+    this.pending.clear()
+  }
+
+  private changed() {
+    this.version++
+    for (const listener of Array.from(this.listeners)) listener()
+  }
+
+  private send(request: SearchRequest) {
+    if (!this.worker && !this.local) this.start()
+    if (this.worker) {
+      this.worker.postMessage(request)
+      return
+    }
+    const response = handleSearchRequest(this.local!, request)
+    if (response) this.resolve(response)
+  }
+
+  private start() {
+    if (typeof Worker !== "undefined") {
+      try {
+        this.worker = new Worker(new URL("./search.worker.ts", import.meta.url))
+        this.worker.addEventListener("message", (event: MessageEvent<SearchResponse>) => {
+          this.resolve(event.data)
+        })
+        return
+      } catch {
+        // Fall through to the in-thread index
+      }
+    }
+    this.local = new SearchIndex()
+  }
+
+  private resolve({ requestId, result }: SearchResponse) {
+    const resolve = this.pending.get(requestId)
+    if (!resolve) return
+    this.pending.delete(requestId)
+    resolve(result)
+  }
+}
@@ -0,0 +1,307 @@
+export interface SearchDocument {
+  kind: string
+  id: string
+  // Searchable text, most important first; matches in earlier fields rank higher
+  fields: string[]
+}
+
+export interface SearchOptions {
+  kinds?: string[]
+  limit?: number
+}
+
+// Columnar so large result sets are cheap to post back from the worker
+export interface SearchResult {
+  kinds: string[]
+  ids: string[]
+  scores: number[]
+  total: number
+}
+
+const EMPTY_RESULT: SearchResult = { kinds: [], ids: [], scores: [], total: 0 }
+const SPACE = 32
+// Fields are stored joined into one string, so each token needs one scan. The
+// trailing space keeps " " + token finding words at the start of a field.
+const FIELD_SEPARATOR = "\n "
+const SEPARATOR_CODE = 10
+// Compact once this share of document slots are tombstones
+const COMPACT_RATIO = 0.5
+const COMPACT_MIN = 1024
+
+// Lowercase, strip accents and collapse everything that is not a letter or
+// digit into single spaces, so "CO-SUN-0001" and "co sun 0001" index alike.
+export function normalize(text: string) {
+  // Decomposing is only needed to strip accents; skip it for plain ASCII
+  // eslint-disable-next-line no-control-regex
+  const ascii = /^[\x00-\x7f]*$/.test(text)
+  return (ascii ? text : text.normalize("NFKD").replace(/[\u0300-\u036f]/g, ""))
+    .toLowerCase()
+    .replace(/[^a-z0-9]+/g, " ")
+    .trim()
+}
+
+// Grams for one word: "^a" and "^ab" word prefixes for short queries, plus
+// every trigram for substring queries.
+function addWordGrams(word: string, grams: Set<string>) {
+  grams.add(`^${word.slice(0, 1)}`)
+  if (word.length > 1) grams.add(`^${word.slice(0, 2)}`)
+  for (let i = 0; i + 3 <= word.length; i++) grams.add(word.slice(i, i + 3))
+}
+
+function queryGrams(token: string) {
+  if (token.length < 3) return [`^${token}`]
+  const grams = new Set<string>()
+  for (let i = 0; i + 3 <= token.length; i++) grams.add(token.slice(i, i + 3))
+  return Array.from(grams)
+}
+
+// Index of the first element >= value, searching from `from` with an
+// exponential probe; posting lists are sorted, and the probe keeps
+// intersecting a short list with a long one close to O(short * log long).
+function gallop(list: number[], value: number, from: number) {
+  let step = 1
+  let high = from
+  while (high < list.length && list[high] < value) {
+    from = high + 1
+    high += step
+    step *= 2
+  }
+  high = Math.min(high, list.length)
+  while (from < high) {
+    const mid = (from + high) >> 1
+    if (list[mid] < value) from = mid + 1
+    else high = mid
+  }
+  return from
+}
+
+function intersect(small: number[], large: number[]) {
+  const out: number[] = []
+  let position = 0
+  for (const value of small) {
+    position = gallop(large, value, position)
+    if (position >= large.length) break
+    if (large[position] === value) out.push(value)
+  }
+  return out
+}
+
+// Next match of the token after `pos`; `shift` skips the leading space of a
+// word-start needle
+function nextOccurrence(text: string, needle: string, shift: number, pos: number) {
+  const next = text.indexOf(needle, pos + 1 - shift)
+  return next === -1 ? -1 : next + shift
+}
+
+// Best score for one query token in a document: whole word 4, word prefix 2,
+// inside a word 1, times a weight that favours earlier fields. Scores are
+// integers so results can be ordered with a counting sort. Tokens shorter than
+// three characters only match word prefixes. 0 means the token does not occur.
+function scoreToken(text: string, token: string) {
+  let best = 0
+  let field = 0
+  let scanned = 0
+  // Short tokens only count at word starts, so skip straight to those
+  const needle = token.length < 3 ? ` ${token}` : token
+  const shift = needle.length - token.length
+  let pos = text.startsWith(token) ? 0 : nextOccurrence(text, needle, shift, -1)
+  for (; pos !== -1; pos = nextOccurrence(text, needle, shift, pos)) {
+    for (; scanned < pos; scanned++) {
+      if (text.charCodeAt(scanned) === SEPARATOR_CODE) field++
+    }
+    const end = pos + token.length
+    const before = pos === 0 ? SPACE : text.charCodeAt(pos - 1)
+    const after = end === text.length ? SPACE : text.charCodeAt(end)
+    const wordStart = before === SPACE
+    const wordEnd = after === SPACE || after === SEPARATOR_CODE
+    const score = wordStart ? (wordEnd ? 4 : 2) : token.length < 3 ? 0 : 1
+    best = Math.max(best, score * (field < 3 ? 4 - field : 1))
+    // A whole-word match in the first field cannot be beaten
+    if (score === 4 && field === 0) break
+  }
+  return best
+}
+
+// Positions of the `limit` highest scores, best first. A counting sort over
+// the small integer score range is linear and stable, so ties keep the order
+// candidates were found in, which is insertion order.
+function rankByScore(scores: number[], limit: number) {
+  let max = 0
+  for (const score of scores) max = Math.max(max, score)
+  const starts = new Int32Array(max + 2)
+  for (const score of scores) starts[max - score + 1]++
+  for (let i = 1; i < starts.length; i++) starts[i] += starts[i - 1]
+  const order = new Array<number>(scores.length)
+  for (let i = 0; i < scores.length; i++) order[starts[max - scores[i]]++] = i
+  if (order.length > limit) order.length = limit
+  return order
+}
+
+// Inverted index from word prefixes and trigrams to document numbers. Posting
+// lists are append-only and sorted; updates tombstone the old document number
+// and append a new one, and the index compacts itself once tombstones pile up.
+export class SearchIndex {
+  private keys: (string | null)[] = []
+  private kinds: string[] = []
+  private ids: string[] = []
+  private texts: string[] = []
+  private byKey = new Map<string, number>()
+  private postings = new Map<string, number[]>()
+  private tombstones = 0
+
+  get size() {
+    return this.byKey.size
+  }
+
+  upsert(document: SearchDocument) {
+    const key = `${document.kind}\u0000${document.id}`
+    const text = document.fields.map(normalize).join(FIELD_SEPARATOR)
+    const existing = this.byKey.get(key)
+    if (existing !== undefined) {
+      if (this.texts[existing] === text) return
+      this.tombstone(existing)
+    }
+    this.append(key, document.kind, document.id, text)
+    this.maybeCompact()
+  }
+
+  upsertMany(documents: Iterable<SearchDocument>) {
+    for (const document of documents) this.upsert(document)
+  }
+
+  remove(kind: string, id: string) {
+    const key = `${kind}\u0000${id}`
+    const existing = this.byKey.get(key)
+    if (existing === undefined) return false
+    this.byKey.delete(key)
+    this.tombstone(existing)
+    this.maybeCompact()
+    return true
+  }
+
+  // Ranked matches for every token in the query (AND), best first; ties keep
+  // insertion order
+  search(query: string, { kinds, limit = Infinity }: SearchOptions = {}): SearchResult {
+    const tokens = Array.from(new Set(normalize(query).split(" ").filter(Boolean)))
+    if (tokens.length === 0) return EMPTY_RESULT
+
+    const lists: number[][] = []
+    for (const token of tokens) {
+      for (const gram of queryGrams(token)) {
+        const list = this.postings.get(gram)
+        if (!list) return EMPTY_RESULT
+        lists.push(list)
+      }
+    }
+    lists.sort((a, b) => a.length - b.length)
+    let candidates = lists[0]
+    for (let i = 1; i < lists.length && candidates.length > 0; i++) {
+      candidates = intersect(candidates, lists[i])
+    }
+
+    const kindFilter = kinds ? new Set(kinds) : null
+    const matches: number[] = []
+    const matchScores: number[] = []
+    for (const doc of candidates) {
+      if (this.keys[doc] === null) continue
+      if (kindFilter && !kindFilter.has(this.kinds[doc])) continue
+      let score = 0
+      for (const token of tokens) {
+        const tokenScore = scoreToken(this.texts[doc], token)
+        if (tokenScore === 0) {
+          score = 0
+          break
+        }
+        score += tokenScore
+      }
+      if (score === 0) continue
+      matches.push(doc)
+      matchScores.push(score)
+    }
+
+    const order = rankByScore(matchScores, limit)
+    return {
+      kinds: order.map((i) => this.kinds[matches[i]]),
+      ids: order.map((i) => this.ids[matches[i]]),
+      scores: order.map((i) => matchScores[i]),
+      total: matches.length,
+    }
+  }
+
+  private append(key: string, kind: string, id: string, text: string) {
+    const doc = this.keys.length
+    this.keys.push(key)
+    this.kinds.push(kind)
+    this.ids.push(id)
+    this.texts.push(text)
+    this.byKey.set(key, doc)
+
+    const grams = new Set<string>()
+    for (const word of text.split(/[ \n]/)) {
+      if (word) addWordGrams(word, grams)
+    }
+    for (const gram of grams) {
+      const list = this.postings.get(gram)
+      if (list) list.push(doc)
+      else this.postings.set(gram, [doc])
+    }
+  }
+
+  private tombstone(doc: number) {
+    this.keys[doc] = null
+    this.texts[doc] = ""
+    this.tombstones++
+  }
+
+  private maybeCompact() {
+    if (this.tombstones < COMPACT_MIN || this.tombstones < this.keys.length * COMPACT_RATIO) return
+    const { keys, kinds, ids, texts } = this
+    this.keys = []
+    this.kinds = []
+    this.ids = []
+    this.texts = []
+    this.byKey = new Map()
+    this.postings = new Map()
+    this.tombstones = 0
+    for (let doc = 0; doc < keys.length; doc++) {
+      const key = keys[doc]
+      if (key !== null) this.append(key, kinds[doc], ids[doc], texts[doc])
+    }
+  }
+}
+
+// Messages between SearchClient and the search worker
+export interface SearchRef {
+  kind: string
+  id: string
+}
+
+export type SearchRequest =
+  | { type: "upsert"; documents: SearchDocument[] }
+  | { type: "remove"; refs: SearchRef[] }
+  | { type: "search"; requestId: number; query: string; options: SearchOptions }
+
+export interface SearchResponse {
+  requestId: number
+  result: SearchResult
+}
+
+// Shared by the worker and the in-thread fallback
+export function handleSearchRequest(
+  index: SearchIndex,
+  request: SearchRequest
+): SearchResponse | null {
+  switch (request.type) {
+    case "upsert":
+      index.upsertMany(request.documents)
+      return null
+    case "remove":
+      for (const { kind, id } of request.refs) index.remove(kind, id)
+      return null
+    case "search":
+      return {
+        requestId: request.requestId,
+        result: index.search(request.query, request.options),
+      }
+  }
+}
@@ -0,0 +1,8 @@
+import { handleSearchRequest, SearchIndex, type SearchRequest } from "@/lib/search-index"
+
+const index = new SearchIndex()
+
+addEventListener("message", (event: MessageEvent<SearchRequest>) => {
+  const response = handleSearchRequest(index, event.data)
+  if (response) postMessage(response)
+})
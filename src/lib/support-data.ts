@@ -0,0 +1,94 @@
+import { createRandom } from "@/lib/random"
+
+export interface SupportTicket {
+  id: string
+  customer: string
+  subject: string
+  priority: "high" | "medium" | "low"
+  status: "open" | "in_progress" | "pending" | "resolved"
+  created: string
+}
+
+// Mock data for support tickets
+export const seedTickets: SupportTicket[] = [
+  {
+    id: "TKT-001",
+    customer: "Maria Garcia",
+    subject: "Wheelchair ramp not deployed",
+    priority: "high",
+    status: "open",
+    created: "2 hours ago",
+  },
+  {
+    id: "TKT-002",
+    customer: "James Wilson",
+    subject: "Driver arrived late",
+    priority: "medium",
+    status: "in_progress",
+    created: "4 hours ago",
+  },
+  {
+    id: "TKT-003",
+    customer: "Sarah Chen",
+    subject: "Billing question about Medicaid",
+    priority: "low",
+    status: "pending",
+    created: "1 day ago",
+  },
+  {
+    id: "TKT-004",
+    customer: "Robert Johnson",
+    subject: "Request for regular pickup schedule",
+    priority: "low",
+    status: "resolved",
+    created: "2 days ago",
+  },
+  {
+    id: "TKT-005",
+    customer: "Emily Davis",
+    subject: "Vehicle cleanliness concern",
+    priority: "medium",
+    status: "open",
+    created: "3 hours ago",
+  },
+  {
+    id: "TKT-006",
+    customer: "Michael Brown",
+    subject: "Lost item in vehicle",
+    priority: "high",
+    status: "in_progress",
+    created: "5 hours ago",
+  },
+]
+
+const FIRST_NAMES = ["Ana", "Ben", "Carmen", "David", "Elena", "Frank", "Grace", "Hector", "Iris", "Jamal"]
+const LAST_NAMES = ["Lopez", "Miller", "Nguyen", "Ortiz", "Patel", "Quinn", "Reyes", "Smith", "Torres", "Young"]
+const PRIORITIES: SupportTicket["priority"][] = ["high", "medium", "medium", "low", "low"]
+const STATUSES: SupportTicket["status"][] = ["open", "in_progress", "pending", "resolved", "resolved"]
+
+function plural(value: number, unit: string) {
+  return `${value} ${unit}${value === 1 ? "" : "s"} ago`
+}
+
+// Seed tickets padded with reproducible synthetic ones, for load testing the
+// ticket list
+export function createMockTickets(count: number, seed = 1): SupportTicket[] {
+  const random = createRandom(seed)
+  const pick = <T>(values: T[]) => values[Math.floor(random() * values.length)]
+  const tickets = seedTickets.slice(0, count)
+
+  for (let i = tickets.length; i < count; i++) {
+    const hours = 1 + Math.floor(random() * 24 * 14)
+    const days = Math.floor(hours / 24)
+    tickets.push({
+      id: `TKT-${String(i + 1).padStart(3, "0")}`,
+      customer: `${pick(FIRST_NAMES)} ${pick(LAST_NAMES)}`,
+      subject: pick(seedTickets).subject,
+      priority: pick(PRIORITIES),
+      status: pick(STATUSES),
+      created: days === 0 ? plural(hours, "hour") : plural(days, "day"),
+    })
+  }
+
+  return tickets
+}
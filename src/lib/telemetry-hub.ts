@@ -0,0 +1,69 @@
+import type { TelemetryUpdate, Vehicle } from "@/lib/fleet-types"
+
+type TelemetryListener = (updates: TelemetryUpdate[]) => void
+
+interface TelemetryHub {
+  vehicles: Map<string, Vehicle>
+  listeners: Set<TelemetryListener>
+}
+
+// Route handlers are bundled separately, so the hub is kept on globalThis to
+// make the ingest and stream routes share one instance (and survive HMR).
+const globalForHub = globalThis as typeof globalThis & {
+  __fleetTelemetryHub?: TelemetryHub
+}
+
+function getHub(): TelemetryHub {
+  if (!globalForHub.__fleetTelemetryHub) {
+    globalForHub.__fleetTelemetryHub = {
+      vehicles: new Map(),
+      listeners: new Set(),
+    }
+  }
+  return globalForHub.__fleetTelemetryHub
+}
+
+export function registerVehicles(vehicles: Vehicle[]) {
+  const hub = getHub()
+  for (const vehicle of vehicles) {
+    hub.vehicles.set(vehicle.id, vehicle)
+  }
+}
+
+export function getVehicle(id: string): Vehicle | undefined {
+  return getHub().vehicles.get(id)
+}
+
+export function getVehicleSnapshot(): Vehicle[] {
+  return Array.from(getHub().vehicles.values())
+}
+
+export function publishTelemetry(updates: TelemetryUpdate[]) {
+  if (updates.length === 0) return
+  const hub = getHub()
+
+  // Keep the snapshot current so late subscribers start from fresh positions
+  for (const update of updates) {
+    const vehicle = hub.vehicles.get(update.vehicleId)
+    if (!vehicle) continue
+    hub.vehicles.set(update.vehicleId, {
+      ...vehicle,
+      location: { ...vehicle.location, lat: update.lat, lng: update.lng },
+      speed: update.speed,
+      fuelLevel: update.fuelLevel,
+      lastUpdate: update.timestamp,
+    })
+  }
+
+  for (const listener of hub.listeners) {
+    listener(updates)
+  }
+}
+
+export function subscribeTelemetry(listener: TelemetryListener) {
+  const hub = getHub()
+  hub.listeners.add(listener)
+  return () => {
+    hub.listeners.delete(listener)
+  }
+}
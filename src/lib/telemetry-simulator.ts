@@ -0,0 +1,119 @@
+import { createSeedVehicles } from "@/lib/fleet-data"
+import type { Driver, TelemetryUpdate, Vehicle } from "@/lib/fleet-types"
+import { SERVICE_AREA_BOUNDS as BOUNDS, SERVICE_HUBS } from "@/lib/places"
+import { createRandom, type Random } from "@/lib/random"
+
+const TYPES: Vehicle["type"][] = ["van", "van", "sedan", "accessible"]
+const COLORS = ["hsl(var(--primary))", "hsl(var(--secondary))", "hsl(199 89% 48%)", "hsl(251 91% 67%)"]
+
+const FIRST_NAMES = ["Alex", "Jordan", "Sam", "Taylor", "Morgan", "Casey", "Riley", "Jamie", "Quinn", "Avery"]
+const LAST_INITIALS = "ABCDEFGHJKLMNPRSTW"
+// Share of idle vehicles whose driver is on duty
+const IDLE_ON_DUTY = 0.85
+
+const MILES_PER_DEGREE_LAT = 69
+const TANK_RANGE_MILES = 350
+
+// Driver for a synthetic vehicle, staffed like the seed fleet: busy while the
+// vehicle is active, usually free when it is idle, none in maintenance
+function createDriver(random: Random, index: number, status: Vehicle["status"]): Driver | undefined {
+  if (status === "maintenance") return undefined
+  const number = String(index + 1).padStart(4, "0")
+  const firstName = FIRST_NAMES[Math.floor(random() * FIRST_NAMES.length)]
+  const initial = LAST_INITIALS[Math.floor(random() * LAST_INITIALS.length)]
+  return {
+    id: `driver-${index + 1}`,
+    name: `${firstName} ${initial}.`,
+    phone: `(970) 555-${number}`,
+    license: random() < 0.5 ? "CDL-B" : "Class C",
+    status: status === "active" ? "on-trip" : random() < IDLE_ON_DUTY ? "available" : "off-duty",
+    rating: Math.round((4.5 + random() * 0.5) * 10) / 10,
+    totalTrips: Math.floor(random() * 600),
+    safetyScore: Math.round(85 + random() * 15),
+  }
+}
+
+// Seed fleet padded with synthetic vehicles and drivers around the service hubs
+export function createSimulatedFleet(count: number, seed = 1, now = Date.now()): Vehicle[] {
+  const random = createRandom(seed)
+  // Separate stream so adding drivers leaves the vehicles themselves unchanged
+  const driverRandom = createRandom(seed + 1)
+  const vehicles = createSeedVehicles(now).slice(0, count)
+
+  for (let i = vehicles.length; i < count; i++) {
+    const hub = SERVICE_HUBS[i % SERVICE_HUBS.length]
+    const type = TYPES[Math.floor(random() * TYPES.length)]
+    const active = random() < 0.7
+    const number = String(i + 1).padStart(4, "0")
+    const status: Vehicle["status"] = active ? "active" : random() < 0.8 ? "idle" : "maintenance"
+    vehicles.push({
+      id: `vehicle-${i + 1}`,
+      name: `${type === "accessible" ? "Accessible" : type === "van" ? "Van" : "Sedan"} ${number}`,
+      type,
+      licensePlate: `CO-SUN-${number}`,
+      status,
+      location: {
+        lat: hub.lat + (random() - 0.5) * 0.4,
+        lng: hub.lng + (random() - 0.5) * 0.4,
+        address: `${hub.name}, CO`,
+      },
+      fuelLevel: 30 + random() * 70,
+      odometer: Math.round(10000 + random() * 60000),
+      lastUpdate: now,
+      speed: active ? 25 + random() * 40 : 0,
+      color: COLORS[i % COLORS.length],
+      driver: createDriver(driverRandom, i, status),
+    })
+  }
+
+  return vehicles
+}
+
+// Drives active vehicles along a wandering heading and reports what moved
+export class TelemetrySimulator {
+  private readonly random: Random
+  private readonly headings = new Map<string, number>()
+
+  constructor(private readonly vehicles: Vehicle[], seed = 1) {
+    this.random = createRandom(seed)
+    for (const vehicle of vehicles) {
+      this.headings.set(vehicle.id, this.random() * Math.PI * 2)
+    }
+  }
+
+  tick(now = Date.now(), dtSeconds = 1): TelemetryUpdate[] {
+    const updates: TelemetryUpdate[] = []
+
+    for (const vehicle of this.vehicles) {
+      if (vehicle.status !== "active") continue
+
+      let heading = (this.headings.get(vehicle.id) ?? 0) + (this.random() - 0.5) * 0.3
+      const speed = Math.min(75, Math.max(0, vehicle.speed + (this.random() - 0.5) * 10))
+      const miles = (speed * dtSeconds) / 3600
+
+      let { lat, lng } = vehicle.location
+      lat += (miles * Math.cos(heading)) / MILES_PER_DEGREE_LAT
+      lng += (miles * Math.sin(heading)) / (MILES_PER_DEGREE_LAT * Math.cos((lat * Math.PI) / 180))
+
+      // Turn around at the edge of the service area
+      if (lat < BOUNDS.minLat || lat > BOUNDS.maxLat || lng < BOUNDS.minLng || lng > BOUNDS.maxLng) {
+        heading += Math.PI
+        lat = Math.min(BOUNDS.maxLat, Math.max(BOUNDS.minLat, lat))
+        lng = Math.min(BOUNDS.maxLng, Math.max(BOUNDS.minLng, lng))
+      }
+
+      let fuelLevel = vehicle.fuelLevel - (miles / TANK_RANGE_MILES) * 100
+      if (fuelLevel < 5) fuelLevel = 100
+
+      this.headings.set(vehicle.id, heading)
+      vehicle.location = { ...vehicle.location, lat, lng }
+      vehicle.speed = speed
+      vehicle.fuelLevel = fuelLevel
+      vehicle.lastUpdate = now
+
+      updates.push({ vehicleId: vehicle.id, lat, lng, speed, fuelLevel, timestamp: now })
+    }
+
+    return updates
+  }
+}
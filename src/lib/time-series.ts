@@ -0,0 +1,332 @@
+import { lttb } from "@/lib/lttb"
+
+// One observation window for one vehicle. Everything a chart shows is derived
+// from these sums, so they can be added up into buckets of any size.
+export interface UsageSample {
+  timestamp: number
+  // Time the sample covers, and the part of it spent moving
+  seconds: number
+  activeSeconds: number
+  miles: number
+  gallons: number
+  cost: number
+}
+
+export type SeriesMetric = "gallons" | "cost" | "miles" | "mpg" | "utilization"
+export const SERIES_METRICS: SeriesMetric[] = ["gallons", "cost", "miles", "mpg", "utilization"]
+
+export type Resolution = "minute" | "hour" | "day" | "week"
+export const RESOLUTIONS: Resolution[] = ["minute", "hour", "day", "week"]
+
+const MINUTE_MS = 60_000
+const HOUR_MS = 60 * MINUTE_MS
+const DAY_MS = 24 * HOUR_MS
+
+export const BUCKET_MS: Record<Resolution, number> = {
+  minute: MINUTE_MS,
+  hour: HOUR_MS,
+  day: DAY_MS,
+  week: 7 * DAY_MS,
+}
+
+// Range presets offered by the analytics charts, ending now
+export const ANALYTICS_RANGES = {
+  "24h": DAY_MS,
+  "7d": 7 * DAY_MS,
+  "30d": 30 * DAY_MS,
+  "90d": 90 * DAY_MS,
+} as const
+
+export type AnalyticsRangeKey = keyof typeof ANALYTICS_RANGES
+
+// Buckets are aligned to UTC; weeks start on Monday (the epoch was a Thursday)
+const BUCKET_OFFSET_MS: Record<Resolution, number> = { minute: 0, hour: 0, day: 0, week: 4 * DAY_MS }
+
+export function bucketIndex(timestamp: number, resolution: Resolution) {
+  return Math.floor((timestamp - BUCKET_OFFSET_MS[resolution]) / BUCKET_MS[resolution])
+}
+
+export function bucketStart(index: number, resolution: Resolution) {
+  return index * BUCKET_MS[resolution] + BUCKET_OFFSET_MS[resolution]
+}
+
+const FIELDS = ["seconds", "activeSeconds", "miles", "gallons", "cost"] as const
+type Field = (typeof FIELDS)[number]
+type Column = Float32Array | Float64Array
+type ColumnType = new (length: number) => Column
+
+export type UsageTotals = Record<Field, number>
+
+export function emptyTotals(): UsageTotals {
+  return { seconds: 0, activeSeconds: 0, miles: 0, gallons: 0, cost: 0 }
+}
+
+// A derived metric for one bucket, or NaN when the bucket has no data for it
+function metricValue(metric: SeriesMetric, columns: Record<Field, Column>, slot: number) {
+  switch (metric) {
+    case "gallons":
+    case "cost":
+    case "miles":
+      return columns.seconds[slot] > 0 ? columns[metric][slot] : NaN
+    case "mpg":
+      return columns.gallons[slot] > 0 ? columns.miles[slot] / columns.gallons[slot] : NaN
+    case "utilization":
+      return columns.seconds[slot] > 0
+        ? (columns.activeSeconds[slot] / columns.seconds[slot]) * 100
+        : NaN
+  }
+}
+
+export function totalsMetric(metric: SeriesMetric, totals: UsageTotals) {
+  switch (metric) {
+    case "gallons":
+    case "cost":
+    case "miles":
+      return totals[metric]
+    case "mpg":
+      return totals.gallons > 0 ? totals.miles / totals.gallons : 0
+    case "utilization":
+      return totals.seconds > 0 ? (totals.activeSeconds / totals.seconds) * 100 : 0
+  }
+}
+
+// Upper bound on the buckets one series keeps, whatever its retention, so a
+// stray timestamp far from the rest can't make it allocate for the gap. At
+// hourly resolution this is over eleven years.
+export const MAX_SERIES_BUCKETS = 100_000
+
+export interface SeriesPoints {
+  times: Float64Array
+  values: Float64Array
+}
+
+// Fixed-size buckets of summed samples, one typed array per field. Buckets are
+// dense from the oldest kept bucket to the newest, so a bucket's slot is its
+// index minus the first index and range reads are plain array walks. The
+// oldest buckets are dropped as new ones open past the retention limit.
+export class BucketSeries {
+  private first = 0
+  private length = 0
+  private columns: Record<Field, Column>
+  readonly retentionBuckets: number
+
+  constructor(
+    readonly resolution: Resolution,
+    retentionBuckets = MAX_SERIES_BUCKETS,
+    private readonly ColumnType: ColumnType = Float64Array
+  ) {
+    this.retentionBuckets = Math.min(retentionBuckets, MAX_SERIES_BUCKETS)
+    this.columns = this.allocate(16)
+  }
+
+  get size() {
+    return this.length
+  }
+
+  add(sample: UsageSample) {
+    const index = bucketIndex(sample.timestamp, this.resolution)
+    if (this.length === 0) this.first = index
+
+    // Out-of-order sample older than anything kept: open buckets at the front
+    if (index < this.first) {
+      const shift = this.first - index
+      if (this.length + shift > this.retentionBuckets) return
+      this.reserve(this.length + shift)
+      for (const field of FIELDS) {
+        const column = this.columns[field]
+        column.copyWithin(shift, 0, this.length)
+        column.fill(0, 0, shift)
+      }
+      this.first = index
+      this.length += shift
+    }
+
+    let slot = index - this.first
+    if (slot >= this.length) {
+      const length = slot + 1
+      if (length > this.retentionBuckets) {
+        this.drop(length - this.retentionBuckets)
+        slot = index - this.first
+      }
+      this.reserve(slot + 1)
+      for (const field of FIELDS) this.columns[field].fill(0, this.length, slot + 1)
+      this.length = slot + 1
+    }
+
+    const { columns } = this
+    columns.seconds[slot] += sample.seconds
+    columns.activeSeconds[slot] += sample.activeSeconds
+    columns.miles[slot] += sample.miles
+    columns.gallons[slot] += sample.gallons
+    columns.cost[slot] += sample.cost
+  }
+
+  // Slots of the buckets overlapping [from, to)
+  private slots(from: number, to: number): [number, number] {
+    const start = Math.max(bucketIndex(from, this.resolution) - this.first, 0)
+    const end = Math.min(bucketIndex(to - 1, this.resolution) - this.first + 1, this.length)
+    return [start, Math.max(start, end)]
+  }
+
+  bucketCount(from: number, to: number) {
+    return bucketIndex(to - 1, this.resolution) - bucketIndex(from, this.resolution) + 1
+  }
+
+  // Start time and metric value of every non-empty bucket overlapping [from, to)
+  read(metric: SeriesMetric, from: number, to: number): SeriesPoints {
+    const [start, end] = this.slots(from, to)
+    const times = new Float64Array(end - start)
+    const values = new Float64Array(end - start)
+    let count = 0
+    for (let slot = start; slot < end; slot++) {
+      const value = metricValue(metric, this.columns, slot)
+      if (Number.isNaN(value)) continue
+      times[count] = bucketStart(this.first + slot, this.resolution)
+      values[count] = value
+      count++
+    }
+    return { times: times.subarray(0, count), values: values.subarray(0, count) }
+  }
+
+  sum(from: number, to: number, totals = emptyTotals()) {
+    const [start, end] = this.slots(from, to)
+    for (const field of FIELDS) {
+      const column = this.columns[field]
+      let total = 0
+      for (let slot = start; slot < end; slot++) total += column[slot]
+      totals[field] += total
+    }
+    return totals
+  }
+
+  private drop(count: number) {
+    for (const field of FIELDS) this.columns[field].copyWithin(0, count, this.length)
+    this.first += count
+    this.length = Math.max(this.length - count, 0)
+  }
+
+  private reserve(length: number) {
+    const capacity = this.columns.seconds.length
+    if (length <= capacity) return
+    const next = this.allocate(Math.min(Math.max(length, capacity * 2), this.retentionBuckets))
+    for (const field of FIELDS) next[field].set(this.columns[field].subarray(0, this.length))
+    this.columns = next
+  }
+
+  private allocate(capacity: number) {
+    const columns = {} as Record<Field, Column>
+    for (const field of FIELDS) columns[field] = new this.ColumnType(capacity)
+    return columns
+  }
+}
+
+// How long each resolution is kept, in milliseconds. Infinity keeps up to
+// MAX_SERIES_BUCKETS buckets.
+export type Retention = Record<Resolution, number>
+
+// Samples for one scope (the whole fleet or one vehicle), rolled up into every
+// resolution as they arrive. Minute buckets are the raw data; hourly, daily
+// and weekly rollups are precomputed so long ranges never touch them.
+export class UsageHistory {
+  private readonly series: Record<Resolution, BucketSeries>
+  private latest = -Infinity
+
+  constructor(
+    private readonly retention: Retention,
+    columnType: ColumnType = Float64Array
+  ) {
+    this.series = {} as Record<Resolution, BucketSeries>
+    for (const resolution of RESOLUTIONS) {
+      const buckets = Math.ceil(retention[resolution] / BUCKET_MS[resolution]) + 1
+      this.series[resolution] = new BucketSeries(resolution, buckets, columnType)
+    }
+  }
+
+  add(sample: UsageSample) {
+    this.latest = Math.max(this.latest, sample.timestamp)
+    for (const resolution of RESOLUTIONS) this.series[resolution].add(sample)
+  }
+
+  get(resolution: Resolution) {
+    return this.series[resolution]
+  }
+
+  // Whether `resolution` still holds data back to `from`
+  covers(resolution: Resolution, from: number) {
+    const kept = (this.series[resolution].retentionBuckets - 1) * BUCKET_MS[resolution]
+    return from >= this.latest - Math.min(this.retention[resolution], kept)
+  }
+
+  // The finest resolution that covers the range in at most `maxBuckets`
+  // buckets, falling back to the coarsest
+  pick(from: number, to: number, maxBuckets: number): Resolution {
+    for (const resolution of RESOLUTIONS) {
+      if (!this.covers(resolution, from)) continue
+      if (this.series[resolution].bucketCount(from, to) <= maxBuckets) return resolution
+    }
+    return "week"
+  }
+}
+
+// Charts are drawn into at most this many pixels, and never get more points
+export const MAX_SERIES_POINTS = 1000
+export const MIN_SERIES_WIDTH = 10
+// A line is downsampled from up to this many buckets per pixel; finer data
+// is read from a coarser rollup instead
+const LINE_BUCKETS_PER_PIXEL = 10
+// Bars need room to stay readable
+const BAR_MIN_PX = 8
+
+export type SeriesMode = "line" | "bars"
+
+export interface SeriesQuery {
+  metric: SeriesMetric
+  from: number
+  to: number
+  // Drawing width in pixels
+  width: number
+  mode: SeriesMode
+}
+
+export interface SeriesResult {
+  resolution: Resolution
+  // [bucket start, value] pairs, oldest first
+  points: [number, number][]
+}
+
+export function clampSeriesWidth(width: number) {
+  if (!Number.isFinite(width)) return MAX_SERIES_POINTS
+  return Math.min(Math.max(Math.round(width), MIN_SERIES_WIDTH), MAX_SERIES_POINTS)
+}
+
+// The rollup a chart series is read from. Lines come from the finest rollup
+// with at most ten buckets per pixel; bars come from the finest rollup that
+// fits one bar per BAR_MIN_PX pixels.
+export function seriesResolution(history: UsageHistory, query: SeriesQuery): Resolution {
+  const width = clampSeriesWidth(query.width)
+  const maxBuckets =
+    query.mode === "bars" ? Math.max(Math.floor(width / BAR_MIN_PX), 1) : width * LINE_BUCKETS_PER_PIXEL
+  return history.pick(query.from, query.to, maxBuckets)
+}
+
+// Chart points for a bucket read, LTTB-downsampled when there are more
+// buckets than pixels (lines always, bars only if even weekly buckets are
+// too many)
+export function pointsForWidth({ times, values }: SeriesPoints, width: number) {
+  const keep = times.length > width ? lttb(times, values, width) : null
+  const count = keep ? keep.length : times.length
+  const points = new Array<[number, number]>(count)
+  for (let i = 0; i < count; i++) {
+    const index = keep ? keep[i] : i
+    points[i] = [times[index], values[index]]
+  }
+  return points
+}
+
+// Reads a chart series from the rollups. The result never has more points
+// than pixels.
+export function querySeries(history: UsageHistory, query: SeriesQuery): SeriesResult {
+  const resolution = seriesResolution(history, query)
+  const data = history.get(resolution).read(query.metric, query.from, query.to)
+  return { resolution, points: pointsForWidth(data, clampSeriesWidth(query.width)) }
+}
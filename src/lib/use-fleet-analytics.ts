@@ -0,0 +1,96 @@
+"use client"
+
+import { useCallback, useEffect, useRef, useState } from "react"
+import type { SeriesResponse, UsageSummary } from "@/lib/fleet-analytics"
+import type { AnalyticsRangeKey, SeriesMetric, SeriesMode } from "@/lib/time-series"
+
+// Charts refetch this often so the newest bucket keeps filling in
+const REFRESH_MS = 60_000
+// Widths are rounded up to this step, so resizing does not refetch per pixel
+const WIDTH_STEP = 50
+
+// Width of an element, tracked with a ResizeObserver. Attach `ref` to the
+// chart container.
+export function useElementWidth<T extends HTMLElement>() {
+  const [width, setWidth] = useState(0)
+  const observer = useRef<ResizeObserver | null>(null)
+
+  const ref = useCallback((element: T | null) => {
+    observer.current?.disconnect()
+    observer.current = null
+    if (!element) return
+    setWidth(element.clientWidth)
+    observer.current = new ResizeObserver(([entry]) => setWidth(entry.contentRect.width))
+    observer.current.observe(element)
+  }, [])
+
+  return [ref, width] as const
+}
+
+// Fetches JSON from `url` (skipped while null), refetching every REFRESH_MS.
+// The previous response stays in place while a new one loads; requests
+// superseded by a new url are aborted.
+function useAnalyticsJson<T>(url: string | null) {
+  const [state, setState] = useState<{ url: string; data: T } | null>(null)
+  const [error, setError] = useState<string | null>(null)
+
+  useEffect(() => {
+    if (!url) return
+    let controller: AbortController | null = null
+
+    const load = () => {
+      controller?.abort()
+      controller = new AbortController()
+      fetch(url, { signal: controller.signal })
+        .then(async (response) => {
+          if (!response.ok) throw new Error(`Analytics request failed (${response.status})`)
+          setState({ url, data: (await response.json()) as T })
+          setError(null)
+        })
+        .catch((reason: unknown) => {
+          if (reason instanceof DOMException && reason.name === "AbortError") return
+          setError(reason instanceof Error ? reason.message : String(reason))
+        })
+    }
+
+    load()
+    const interval = setInterval(load, REFRESH_MS)
+    return () => {
+      clearInterval(interval)
+      controller?.abort()
+    }
+  }, [url])
+
+  return { data: state?.data ?? null, loading: url !== null && state?.url !== url, error }
+}
+
+interface UseSeriesOptions {
+  mode?: SeriesMode
+  vehicleId?: string
+}
+
+// A chart series sized to the measured container: pass the `ref` to the
+// element the chart fills, and the server returns at most one point per pixel.
+export function useAnalyticsSeries(
+  metric: SeriesMetric,
+  range: AnalyticsRangeKey,
+  { mode = "line", vehicleId }: UseSeriesOptions = {}
+) {
+  const [ref, width] = useElementWidth<HTMLDivElement>()
+  let url: string | null = null
+  if (width > 0) {
+    const params = new URLSearchParams({
+      metric,
+      range,
+      mode,
+      width: String(Math.ceil(width / WIDTH_STEP) * WIDTH_STEP),
+    })
+    if (vehicleId) params.set("vehicleId", vehicleId)
+    url = `/api/fleet/analytics/series?${params}`
+  }
+  return { ref, ...useAnalyticsJson<SeriesResponse>(url) }
+}
+
+export function useUsageSummary(range: AnalyticsRangeKey, limit = 10) {
+  return useAnalyticsJson<UsageSummary>(`/api/fleet/analytics/summary?range=${range}&limit=${limit}`)
+}
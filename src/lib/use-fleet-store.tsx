@@ -0,0 +1,61 @@
+"use client"
+
+import { createContext, useCallback, useContext, useSyncExternalStore, type ReactNode } from "react"
+import type { EntityTable, FleetStore } from "@/lib/fleet-store"
+
+const FleetStoreContext = createContext<FleetStore | null>(null)
+
+export function FleetStoreProvider({ store, children }: { store: FleetStore; children: ReactNode }) {
+  return <FleetStoreContext value={store}>{children}</FleetStoreContext>
+}
+
+export function useFleetStore() {
+  const store = useContext(FleetStoreContext)
+  if (!store) {
+    throw new Error("useFleetStore must be used within a FleetStoreProvider")
+  }
+  return store
+}
+
+const noopUnsubscribe = () => {}
+
+// Re-renders only when this entity is written
+export function useEntity<T extends { id: string }, I extends string>(
+  table: EntityTable<T, I>,
+  id: string | null | undefined
+) {
+  const subscribe = useCallback(
+    (listener: () => void) => (id ? table.subscribeEntity(id, listener) : noopUnsubscribe),
+    [table, id]
+  )
+  const getSnapshot = () => (id ? table.get(id) : undefined)
+  return useSyncExternalStore(subscribe, getSnapshot, getSnapshot)
+}
+
+// Re-renders only when membership of the bucket changes, not when its
+// entities are updated in place
+export function useIds<T extends { id: string }, I extends string>(
+  table: EntityTable<T, I>,
+  index?: I,
+  key?: string
+) {
+  const subscribe = useCallback(
+    (listener: () => void) => table.subscribeIds(listener, index, key),
+    [table, index, key]
+  )
+  const getSnapshot = () => table.ids(index, key)
+  return useSyncExternalStore(subscribe, getSnapshot, getSnapshot)
+}
+
+export function useCount<T extends { id: string }, I extends string>(
+  table: EntityTable<T, I>,
+  index?: I,
+  key?: string
+) {
+  const subscribe = useCallback(
+    (listener: () => void) => table.subscribeIds(listener, index, key),
+    [table, index, key]
+  )
+  const getSnapshot = () => table.count(index, key)
+  return useSyncExternalStore(subscribe, getSnapshot, getSnapshot)
+}
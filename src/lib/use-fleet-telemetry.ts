@@ -0,0 +1,94 @@
+"use client"
+
+import { useEffect, useRef, useState } from "react"
+import type { Alert, TelemetryUpdate, Vehicle } from "@/lib/fleet-types"
+
+export type TelemetryConnection = "connecting" | "live" | "offline"
+
+interface UseFleetTelemetryOptions {
+  onTelemetry: (updates: TelemetryUpdate[]) => void
+  onSnapshot?: (vehicles: Vehicle[]) => void
+  // New or changed alerts, oldest first
+  onAlerts?: (alerts: Alert[]) => void
+  url?: string
+}
+
+// Subscribes to the fleet SSE stream and hands incoming changes to
+// `onTelemetry` at most once per animation frame. Updates are coalesced per
+// vehicle, so the pending batch never grows past the fleet size even while
+// the tab is hidden and frames are paused. Alert changes are coalesced per
+// alert the same way and handed to `onAlerts`.
+export function useFleetTelemetry({
+  onTelemetry,
+  onSnapshot,
+  onAlerts,
+  url = "/api/fleet/stream",
+}: UseFleetTelemetryOptions) {
+  const [connection, setConnection] = useState<TelemetryConnection>("connecting")
+  const handlers = useRef({ onTelemetry, onSnapshot, onAlerts })
+
+  useEffect(() => {
+    handlers.current = { onTelemetry, onSnapshot, onAlerts }
+  })
+
+  useEffect(() => {
+    const source = new EventSource(url)
+    const pending = new Map<string, TelemetryUpdate>()
+    const pendingAlerts = new Map<string, Alert>()
+    let frame = 0
+
+    const flush = () => {
+      frame = 0
+      if (pending.size > 0) {
+        const batch = Array.from(pending.values())
+        pending.clear()
+        handlers.current.onTelemetry(batch)
+      }
+      if (pendingAlerts.size > 0) {
+        const alerts = Array.from(pendingAlerts.values())
+        pendingAlerts.clear()
+        handlers.current.onAlerts?.(alerts)
+      }
+    }
+
+    const schedule = () => {
+      if (!frame) {
+        frame = requestAnimationFrame(flush)
+      }
+    }
+
+    const handleSnapshot = (event: MessageEvent<string>) => {
+      handlers.current.onSnapshot?.(JSON.parse(event.data) as Vehicle[])
+    }
+
+    const handleTelemetry = (event: MessageEvent<string>) => {
+      for (const update of JSON.parse(event.data) as TelemetryUpdate[]) {
+        pending.set(update.vehicleId, update)
+      }
+      schedule()
+    }
+
+    // Map insertion order keeps alerts oldest first; a re-sent alert keeps
+    // its place with the newer contents
+    const handleAlerts = (event: MessageEvent<string>) => {
+      for (const alert of JSON.parse(event.data) as Alert[]) {
+        pendingAlerts.set(alert.id, alert)
+      }
+      schedule()
+    }
+
+    source.onopen = () => setConnection("live")
+    source.onerror = () =>
+      setConnection(source.readyState === EventSource.CLOSED ? "offline" : "connecting")
+    source.addEventListener("snapshot", handleSnapshot)
+    source.addEventListener("telemetry", handleTelemetry)
+    source.addEventListener("alerts", handleAlerts)
+
+    return () => {
+      source.close()
+      if (frame) cancelAnimationFrame(frame)
+    }
+  }, [url])
+
+  return connection
+}
@@ -0,0 +1,41 @@
+"use client"
+
+import { useEffect, useState } from "react"
+import type { RideEta } from "@/lib/ride-eta"
+
+// ETAs move with every telemetry batch; this is how often they are polled
+const REFRESH_MS = 5_000
+
+// Live ETAs for a set of rides, keyed by ride id. `initial` fills in until
+// the first response, e.g. ETAs rendered by a server component.
+export function useRideEtas(rideIds: string[], initial: Record<string, RideEta> = {}) {
+  const [etas, setEtas] = useState(initial)
+  const key = rideIds.join(",")
+
+  useEffect(() => {
+    if (!key) return
+    let controller: AbortController | null = null
+
+    const load = () => {
+      controller?.abort()
+      controller = new AbortController()
+      fetch(`/api/fleet/eta?ids=${encodeURIComponent(key)}`, { signal: controller.signal })
+        .then(async (response) => {
+          if (!response.ok) return
+          const { etas } = (await response.json()) as { etas: Record<string, RideEta> }
+          setEtas(etas)
+        })
+        // The last ETAs stay up until the next poll succeeds
+        .catch(() => {})
+    }
+
+    load()
+    const interval = setInterval(load, REFRESH_MS)
+    return () => {
+      clearInterval(interval)
+      controller?.abort()
+    }
+  }, [key])
+
+  return etas
+}
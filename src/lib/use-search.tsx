@@ -0,0 +1,152 @@
+"use client"
+
+import {
+  createContext,
+  useContext,
+  useEffect,
+  useState,
+  useSyncExternalStore,
+  type ReactNode,
+} from "react"
+import type { EntityTable } from "@/lib/fleet-store"
+import type { Driver, Trip, Vehicle } from "@/lib/fleet-types"
+import { SearchClient } from "@/lib/search-client"
+import { normalize, type SearchDocument, type SearchRef } from "@/lib/search-index"
+import type { SupportTicket } from "@/lib/support-data"
+
+// Searchable fields per entity kind, most important first
+
+export function vehicleSearchFields(vehicle: Vehicle) {
+  return [vehicle.name, vehicle.licensePlate, vehicle.location.address, vehicle.driver?.name ?? ""]
+}
+
+export function driverSearchFields(driver: Driver) {
+  return [driver.name, driver.license, driver.phone]
+}
+
+export function tripSearchFields(trip: Trip) {
+  return [trip.vehicleName, trip.driverName, `${trip.startLocation} ${trip.endLocation}`]
+}
+
+export function ticketSearchFields(ticket: SupportTicket) {
+  return [ticket.id, ticket.customer, ticket.subject]
+}
+
+// A SearchClient for the lifetime of the component; its worker is terminated
+// on unmount
+export function useSearchClient() {
+  const [client] = useState(() => new SearchClient())
+  useEffect(() => () => client.dispose(), [client])
+  return client
+}
+
+const SearchClientContext = createContext<SearchClient | null>(null)
+
+// One index shared by everything below it. Components that mount and unmount
+// underneath (lazily loaded tabs) query it without restarting the worker or
+// rebuilding the index.
+export function SearchClientProvider({ children }: { children: ReactNode }) {
+  const client = useSearchClient()
+  return <SearchClientContext value={client}>{children}</SearchClientContext>
+}
+
+export function useSharedSearchClient() {
+  const client = useContext(SearchClientContext)
+  if (!client) {
+    throw new Error("useSharedSearchClient must be used within a SearchClientProvider")
+  }
+  return client
+}
+
+// Keeps one kind of document in the index in step with a store table. Store
+// entities are immutable, so unchanged ones are skipped by identity, and only
+// entities whose searchable text changed are re-sent; telemetry-only updates
+// never reach the worker. Changes are coalesced to one sync per frame.
+export function useTableSearchSync<T extends { id: string }>(
+  client: SearchClient,
+  table: EntityTable<T, string>,
+  kind: string,
+  toFields: (entity: T) => string[]
+) {
+  useEffect(() => {
+    const seen = new Map<string, { entity: T; text: string }>()
+    let frame = 0
+
+    const sync = () => {
+      frame = 0
+      const documents: SearchDocument[] = []
+      const ids = table.ids()
+      for (const id of ids) {
+        const entity = table.get(id)
+        const previous = seen.get(id)
+        if (!entity || previous?.entity === entity) continue
+        const fields = toFields(entity)
+        const text = fields.join("\n")
+        seen.set(id, { entity, text })
+        if (previous?.text !== text) documents.push({ kind, id, fields })
+      }
+
+      if (seen.size > ids.length) {
+        const live = new Set(ids)
+        const removed: SearchRef[] = []
+        for (const id of seen.keys()) {
+          if (live.has(id)) continue
+          seen.delete(id)
+          removed.push({ kind, id })
+        }
+        client.remove(removed)
+      }
+      client.upsert(documents)
+    }
+
+    sync()
+    const unsubscribe = table.subscribe(() => {
+      if (!frame) frame = requestAnimationFrame(sync)
+    })
+    return () => {
+      cancelAnimationFrame(frame)
+      unsubscribe()
+    }
+  }, [client, table, kind, toFields])
+}
+
+interface UseSearchOptions {
+  kinds?: string[]
+  debounceMs?: number
+}
+
+// Ranked ids matching `query`, or null while the query is empty. Input is
+// debounced, the query runs in the client's worker, and results refresh when
+// the index changes. While a new query is in flight the previous results stay.
+export function useSearch(
+  client: SearchClient,
+  query: string,
+  { kinds, debounceMs = 120 }: UseSearchOptions = {}
+) {
+  const [debouncedQuery, setDebouncedQuery] = useState(query)
+  const [result, setResult] = useState<{ query: string; ids: string[] } | null>(null)
+  const version = useSyncExternalStore(client.subscribe, client.getVersion, client.getVersion)
+  const kindsKey = kinds?.join(",")
+
+  useEffect(() => {
+    const timeout = setTimeout(() => setDebouncedQuery(query), debounceMs)
+    return () => clearTimeout(timeout)
+  }, [query, debounceMs])
+
+  useEffect(() => {
+    if (!normalize(debouncedQuery)) return
+    let cancelled = false
+    client.search(debouncedQuery, { kinds: kindsKey?.split(",") }).then(({ ids }) => {
+      if (!cancelled) setResult({ query: debouncedQuery, ids })
+    })
+    return () => {
+      cancelled = true
+    }
+  }, [client, debouncedQuery, kindsKey, version])
+
+  const active = normalize(query) !== ""
+  return {
+    ids: active ? result?.ids ?? null : null,
+    pending: active && result?.query !== query,
+  }
+}
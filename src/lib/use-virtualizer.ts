@@ -0,0 +1,269 @@
+"use client"
+
+import { useCallback, useEffect, useLayoutEffect, useMemo, useRef, useState } from "react"
+
+type Key = string | number
+
+export interface VirtualItem {
+  index: number
+  key: Key
+  start: number
+  size: number
+}
+
+interface VirtualizerOptions {
+  count: number
+  estimateSize: (index: number) => number
+  getItemKey?: (index: number) => Key
+  overscan?: number
+  // Height covered by sticky content (e.g. a table header) at the top of the viewport
+  scrollPaddingStart?: number
+}
+
+interface Range {
+  start: number
+  end: number
+}
+
+const EMPTY_RANGE: Range = { start: 0, end: -1 }
+
+const defaultKey = (index: number) => index
+
+// Last index whose start offset is <= offset
+function findIndex(offsets: Float64Array, count: number, offset: number) {
+  let low = 0
+  let high = count - 1
+  while (low < high) {
+    const mid = (low + high + 1) >> 1
+    if (offsets[mid] <= offset) low = mid
+    else high = mid - 1
+  }
+  return low
+}
+
+// Windowing for a vertical list inside a scroll container. Only the rows that
+// intersect the viewport (plus `overscan` on each side) are returned, rows are
+// measured as they mount, and measured sizes are kept by key so filtering or
+// reordering does not throw them away.
+export function useVirtualizer({
+  count,
+  estimateSize,
+  getItemKey = defaultKey,
+  overscan = 6,
+  scrollPaddingStart = 0,
+}: VirtualizerOptions) {
+  const [scrollElement, setScrollElement] = useState<HTMLElement | null>(null)
+  const [listElement, setListElement] = useState<HTMLElement | null>(null)
+  const [measured] = useState(() => new Map<Key, number>())
+  const [measureVersion, setMeasureVersion] = useState(0)
+  const [range, setRange] = useState<Range>(EMPTY_RANGE)
+  // Start offset of every row, kept across renders. Measuring a row only
+  // recomputes the offsets after the first row that changed; a new count,
+  // estimate or key function rebuilds them all.
+  const [prefix] = useState(() => ({
+    sums: new Float64Array(1),
+    count: 0,
+    estimateSize,
+    getItemKey,
+    dirtyFrom: Infinity,
+  }))
+
+  const offsets = useMemo(() => {
+    let from = prefix.dirtyFrom
+    if (
+      count !== prefix.count ||
+      estimateSize !== prefix.estimateSize ||
+      getItemKey !== prefix.getItemKey
+    ) {
+      prefix.sums = new Float64Array(count + 1)
+      prefix.count = count
+      prefix.estimateSize = estimateSize
+      prefix.getItemKey = getItemKey
+      from = 0
+    }
+    const { sums } = prefix
+    for (let i = from; i < count; i++) {
+      sums[i + 1] = sums[i] + (measured.get(getItemKey(i)) ?? estimateSize(i))
+    }
+    prefix.dirtyFrom = Infinity
+    // A fresh view of the same sums, so effects depending on it rerun
+    return sums.subarray(0)
+    // measureVersion invalidates the cached offsets after a row is measured
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [count, estimateSize, getItemKey, measured, prefix, measureVersion])
+
+  const latest = useRef({ offsets, count, getItemKey, overscan, scrollElement, listElement })
+  useLayoutEffect(() => {
+    latest.current = { offsets, count, getItemKey, overscan, scrollElement, listElement }
+  })
+
+  // Offset of the list's first row within the scroll content
+  const scrollMargin = useCallback(() => {
+    const { scrollElement, listElement } = latest.current
+    if (!scrollElement || !listElement) return 0
+    return (
+      listElement.getBoundingClientRect().top -
+      scrollElement.getBoundingClientRect().top +
+      scrollElement.scrollTop
+    )
+  }, [])
+
+  const updateRange = useCallback(() => {
+    const { offsets, count, overscan, scrollElement } = latest.current
+    if (!scrollElement || count === 0) {
+      setRange(EMPTY_RANGE)
+      return
+    }
+    const top = scrollElement.scrollTop - scrollMargin()
+    const bottom = top + scrollElement.clientHeight
+    const first = findIndex(offsets, count, Math.max(0, top))
+    const last = findIndex(offsets, count, Math.max(0, bottom))
+    const start = Math.max(0, first - overscan)
+    const end = Math.min(count - 1, last + overscan)
+    setRange((prev) => (prev.start === start && prev.end === end ? prev : { start, end }))
+  }, [scrollMargin])
+
+  useLayoutEffect(() => {
+    updateRange()
+  }, [offsets, overscan, scrollElement, listElement, updateRange])
+
+  useEffect(() => {
+    if (!scrollElement) return
+    let frame = 0
+    const handleScroll = () => {
+      if (frame) return
+      frame = requestAnimationFrame(() => {
+        frame = 0
+        updateRange()
+      })
+    }
+    const resizeObserver = new ResizeObserver(updateRange)
+    resizeObserver.observe(scrollElement)
+    scrollElement.addEventListener("scroll", handleScroll, { passive: true })
+    return () => {
+      cancelAnimationFrame(frame)
+      resizeObserver.disconnect()
+      scrollElement.removeEventListener("scroll", handleScroll)
+    }
+  }, [scrollElement, updateRange])
+
+  const resizeObserver = useMemo(() => {
+    if (typeof ResizeObserver === "undefined") return null
+    return new ResizeObserver((entries) => {
+      const { offsets, count, getItemKey, scrollElement } = latest.current
+      let changed = false
+      let scrollAdjustment = 0
+      const top = scrollElement ? scrollElement.scrollTop - scrollMargin() : 0
+
+      for (const entry of entries) {
+        const element = entry.target as HTMLElement
+        if (!element.isConnected) continue
+        const index = Number(element.dataset.index)
+        if (!(index < count)) continue
+        const size = entry.borderBoxSize?.[0]?.blockSize ?? element.getBoundingClientRect().height
+        const key = getItemKey(index)
+        const previous = measured.get(key) ?? offsets[index + 1] - offsets[index]
+        if (size === previous) continue
+        measured.set(key, size)
+        prefix.dirtyFrom = Math.min(prefix.dirtyFrom, index)
+        changed = true
+        // Rows above the viewport changing height would shift the visible
+        // content; compensate so the user's position stays put
+        if (offsets[index] < top) scrollAdjustment += size - previous
+      }
+
+      if (scrollElement && scrollAdjustment !== 0) scrollElement.scrollTop += scrollAdjustment
+      if (changed) setMeasureVersion((version) => version + 1)
+    })
+  }, [measured, prefix, scrollMargin])
+
+  useEffect(() => () => resizeObserver?.disconnect(), [resizeObserver])
+
+  const measureElement = useCallback(
+    (element: HTMLElement | null) => {
+      if (!element || !resizeObserver) return
+      resizeObserver.observe(element)
+      return () => resizeObserver.unobserve(element)
+    },
+    [resizeObserver]
+  )
+
+  const scrollToIndex = useCallback(
+    (index: number, align: "auto" | "start" | "end" = "auto") => {
+      const { offsets, count, scrollElement } = latest.current
+      if (!scrollElement || index < 0 || index >= count) return
+      const margin = scrollMargin()
+      const start = offsets[index] + margin
+      const end = offsets[index + 1] + margin
+      const viewTop = scrollElement.scrollTop + scrollPaddingStart
+      const viewBottom = scrollElement.scrollTop + scrollElement.clientHeight
+
+      if (align === "start" || (align === "auto" && start < viewTop)) {
+        scrollElement.scrollTop = start - scrollPaddingStart
+      } else if (align === "end" || (align === "auto" && end > viewBottom)) {
+        scrollElement.scrollTop = end - scrollElement.clientHeight
+      }
+    },
+    [scrollMargin, scrollPaddingStart]
+  )
+
+  const items = useMemo(() => {
+    const out: VirtualItem[] = []
+    for (let index = range.start; index <= Math.min(range.end, count - 1); index++) {
+      out.push({
+        index,
+        key: getItemKey(index),
+        start: offsets[index],
+        size: offsets[index + 1] - offsets[index],
+      })
+    }
+    return out
+  }, [range, count, offsets, getItemKey])
+
+  const totalSize = offsets[count]
+  const last = items[items.length - 1]
+
+  return {
+    items,
+    totalSize,
+    // Space to reserve above and below the mounted rows
+    paddingStart: items.length > 0 ? items[0].start : 0,
+    paddingEnd: last ? totalSize - (last.start + last.size) : 0,
+    scrollRef: setScrollElement,
+    listRef: setListElement,
+    measureElement,
+    scrollToIndex,
+  }
+}
+
+// Index the active row should move to for a navigation key, or null when the
+// key is not a navigation key. `lanes` > 1 treats the list as a grid.
+export function getNavigationIndex(
+  key: string,
+  index: number,
+  count: number,
+  { lanes = 1, pageSize = 10 }: { lanes?: number; pageSize?: number } = {}
+): number | null {
+  if (count === 0) return null
+  const clamp = (value: number) => Math.max(0, Math.min(count - 1, value))
+  switch (key) {
+    case "ArrowDown":
+      return clamp(index < 0 ? 0 : index + lanes)
+    case "ArrowUp":
+      return clamp(index < 0 ? 0 : index - lanes)
+    case "ArrowRight":
+      return lanes > 1 ? clamp(index + 1) : null
+    case "ArrowLeft":
+      return lanes > 1 ? clamp(index - 1) : null
+    case "PageDown":
+      return clamp(index + pageSize * lanes)
+    case "PageUp":
+      return clamp(index - pageSize * lanes)
+    case "Home":
+      return 0
+    case "End":
+      return count - 1
+    default:
+      return null
+  }
+}